@@ -1 +1,9 @@
-from . import agent
\ No newline at end of file
+import importlib
+
+
+def __getattr__(name: str):
+    # ADK finds the app as <package>.agent.root_agent. agent is imported on that first access rather
+    # than with the package, so importing a parser-only module (parser_only, tools) stays cheap.
+    if name == "agent":
+        return importlib.import_module(f"{__name__}.agent")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,26 +1,32 @@
-import datetime
-from zoneinfo import ZoneInfo
-from google.adk.agents import LlmAgent
-
-from .requirements import error_interpreter
-from .custom_agent.coordinator_agent import CoordinatorAgent
-from google.adk.sessions import InMemorySessionService
-from google.adk.runners import Runner
-from google.adk.events import Event
-from pydantic import BaseModel, Field
+import asyncio
 import logging
-from google.genai import types
-from vertexai.generative_models import GenerationConfig
-from google.adk.models.google_llm import Gemini
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, AsyncIterator, Dict, Iterable, Optional, Tuple
 
+from .requirements import error_interpreter
+from .custom_agent.circuit_breaker import CircuitBreaker
+from .custom_agent.latency_profiles import REQUEST_STATE_KEY, apply_latency_profile, get_latency_profile
+from .custom_agent.metrics import Metrics, process_memory
+from .custom_agent.model_tiering import ModelTierRouter
+from .custom_agent.single_flight import SingleFlight
+from .custom_agent.verdict import parse_verdict
+from .custom_agent.verdict_cache import VerdictCache
+from .custom_agent.verdict_store import SqliteVerdictStore
 from .requirements import model_validator
+from .requirements import ddl_validator, dml_validator, function_validator, query_validator, session_validator
+from .tools import complexity, prompt_router
 
-validation_generation_config = GenerationConfig(
-    temperature=0.0,             # For strict, deterministic output
-    top_p=0.9,                   # To reduce randomness
-    top_k=1,                     # To further reduce randomness
-    response_mime_type='application/json' # Crucial for enforcing JSON
-)
+if TYPE_CHECKING:
+    from google.adk.agents import LlmAgent
+    from google.adk.events import Event
+    from google.adk.runners import Runner
+    from google.genai import types
+    from .custom_agent.coordinator_agent import CoordinatorAgent
+    from .custom_agent.hedging import HedgedLlm
+    from .custom_agent.prompt_cache import PromptCacheManager
+    from .custom_agent.session_store import BoundedSessionService
 
 # --- Configure Logging ---
 logging.basicConfig(level=logging.INFO)
@@ -29,84 +35,487 @@ logger = logging.getLogger(__name__)
 
 APP_NAME = "sql_validator_app"
 USER_ID = "12345"
-SESSION_ID = "123344"
 
+# --- Batch Validation ---
+DEFAULT_BATCH_CONCURRENCY = 8
 
-model_validator_agent = LlmAgent(
-    name="ModelBasedValidatorAgent",
-    model="gemini-2.5-flash",
-    instruction=model_validator.MODEL_VALIDATOR_PROMPT,
-    description="Strict Spark SQL validator. Returns only structured JSON output. Does not explain, repair, or interpret user queries.",
-    output_key="model_agent_result",
-    generate_content_config = validation_generation_config,
-)
+# --- Prompt Caching ---
+# Register each agent's static instruction once as cached content with the model backend
+# and reuse the handle on every request instead of re-sending the instruction.
+USE_PROMPT_CACHE = False
+PROMPT_CACHE_TTL_SECONDS = 3600.0
 
-error_interpreter_agent = LlmAgent(
-    name="ErrorInterpreterAgent",
-    model="gemini-2.5-flash",
-    instruction= error_interpreter.ERROR_INTERPRETER_PROMPT,
-    description="Strict error interpreter for SQL syntax errors. Analyzes provided SQL query and error message, returning only structured JSON output with clear syntax error explanation.",
-)
+# Set by build_agents when USE_PROMPT_CACHE is on
+prompt_cache: Optional["PromptCacheManager"] = None
 
+# --- Latency Profiles ---
+# Thinking budget, output token cap and strict verdict schema of each model call.
+# Requests pick "fast", "balanced" or "thorough"; this one applies when they don't.
+# None keeps the agents' own generation config for those requests.
+DEFAULT_LATENCY_PROFILE: Optional[str] = None
 
-coordinator_agent = CoordinatorAgent(
-    name="CoordinatorAgent",
-    model_validator_agent=model_validator_agent,
-    error_intepreter_agent=error_interpreter_agent,
-    sub_agents=[model_validator_agent, error_interpreter_agent],
-)
+# --- Deadlines and Circuit Breaker ---
+# Seconds a validation may take, shared by all of its stages and statements. Once it passes, model
+# calls still running are abandoned and their statements get the parser's result, marked
+# "tier": "parser-only". None waits for the model. Requests can pass their own timeout.
+REQUEST_TIMEOUT_SECONDS: Optional[float] = None
+# Consecutive failed (or timed out) model calls that open the circuit breaker. While it is open,
+# statements get parser-only verdicts without calling the model; after CIRCUIT_BREAKER_RESET_SECONDS
+# one trial call decides whether it closes again.
+CIRCUIT_BREAKER_FAILURES = 5
+CIRCUIT_BREAKER_RESET_SECONDS = 30.0
 
-# --- Setup Runner and Session ---
-session_service = InMemorySessionService()
-initial_state = {"input": "Select * from abc;"}
-session = session_service.create_session(
-    app_name=APP_NAME,
-    user_id=USER_ID,
-    session_id=SESSION_ID,
-    state=initial_state # Pass initial state here
-)
+# --- Hedged Requests ---
+# Send a second, identical model validator request when the first hasn't answered within the
+# HEDGE_QUANTILE latency of recent calls; the first well-formed verdict wins and the other call
+# is cancelled. Hedges add at most HEDGE_MAX_EXTRA_RATIO extra validator calls.
+USE_HEDGING = False
+HEDGE_QUANTILE = 0.95
+HEDGE_MAX_EXTRA_RATIO = 0.1
+
+# --- Model Tiering ---
+# Send trivial statements to a cheaper, faster model and only complex ones to the strongest.
+# A statement's complexity score (AST size, query nesting, joins, CTEs, windows, ...) at or
+# above a threshold moves it up a tier; see tools/complexity.py.
+USE_MODEL_TIERING = False
+MODEL_TIERS = {
+    complexity.SIMPLE: "gemini-2.5-flash-lite",
+    complexity.MODERATE: "gemini-2.5-flash",
+    complexity.COMPLEX: "gemini-2.5-pro",
+}
+MODEL_TIER_MODERATE_AT = complexity.DEFAULT_MODERATE_AT
+MODEL_TIER_COMPLEX_AT = complexity.DEFAULT_COMPLEX_AT
+
+model_tiering = ModelTierRouter(
+    MODEL_TIERS,
+    moderate_at=MODEL_TIER_MODERATE_AT,
+    complex_at=MODEL_TIER_COMPLEX_AT,
+) if USE_MODEL_TIERING else None
 
-runner = Runner(
-    agent=coordinator_agent, # Pass the custom orchestrator agent
-    app_name=APP_NAME,
-    session_service=session_service
+
+def _before_model_callbacks() -> list:
+    """Callbacks run by every LlmAgent before each model request."""
+    from .custom_agent.model_input import history_free_contents
+    # Each call sees only the statement it validates, never the session's history
+    callbacks = [history_free_contents]
+    # Runs first: the prompt cache keys its handles on the request's model
+    if model_tiering is not None:
+        callbacks.append(model_tiering.before_model_callback)
+    # Runs after model tiering: thinking limits depend on the model
+    callbacks.append(apply_latency_profile)
+    if prompt_cache is not None:
+        callbacks.append(prompt_cache.before_model_callback)
+    return callbacks
+
+# --- Verdict Cache ---
+VERDICT_CACHE_MAX_ENTRIES = 4096
+VERDICT_CACHE_TTL_SECONDS = 3600.0
+# Cache validator verdicts per query shape (literals replaced by typed placeholders) rather than per exact query.
+# Literals whose value can make a query invalid (casts, regexes, sha2 bit lengths, ...) still get their own verdict.
+USE_FINGERPRINT_CACHE = False
+
+# --- Session Store ---
+# Bounds on the in-memory sessions, so a long-running process keeps a steady memory footprint:
+# least recently used sessions are evicted beyond SESSION_MAX_SESSIONS or after SESSION_IDLE_TTL_SECONDS
+# without use, and sessions beyond SESSION_MAX_EVENTS events have their older events compacted.
+SESSION_MAX_SESSIONS = 10_000
+SESSION_MAX_EVENTS = 200
+SESSION_IDLE_TTL_SECONDS = 3600.0
+
+# --- Persistent Verdict Store ---
+# SQLite file keeping verdicts across restarts; None keeps verdicts in memory only
+VERDICT_STORE_PATH: Optional[str] = None
+VERDICT_STORE_MAX_ENTRIES = 100_000
+
+
+# Shared by every request; none of these needs the Google SDKs
+verdict_cache = VerdictCache(
+    max_entries=VERDICT_CACHE_MAX_ENTRIES,
+    ttl_seconds=VERDICT_CACHE_TTL_SECONDS,
+)
+verdict_store = SqliteVerdictStore(
+    VERDICT_STORE_PATH,
+    max_entries=VERDICT_STORE_MAX_ENTRIES,
+) if VERDICT_STORE_PATH else None
+# Per-stage latency histograms and verdict tier counters, exported by the HTTP service
+metrics = Metrics()
+metrics.register_gauge("process_resident_memory_bytes", "Resident set size of the validator process.",
+                       lambda: process_memory()["rss_bytes"])
+# Concurrent requests for the same query share one in-flight model call
+single_flight = SingleFlight()
+circuit_breaker = CircuitBreaker(
+    failure_threshold=CIRCUIT_BREAKER_FAILURES,
+    reset_timeout_seconds=CIRCUIT_BREAKER_RESET_SECONDS,
 )
 
+# Set by use_hedging
+hedged_model: Optional["HedgedLlm"] = None
+
+# --- Deferred Agent Construction ---
+# Importing the Google SDKs and building the agents takes most of the startup time, so it waits for
+# build_agents. That runs on first use: the first validation, use_model_backend / use_hedging, or
+# reading one of the _BuiltAgents fields as a module attribute (agent.runner, agent.root_agent, ...).
+# Parser-only callers (parser_only.py) never load the SDKs.
+@dataclass
+class _BuiltAgents:
+    """What build_agents creates. Code in this module reads it through _agents()."""
+
+    validation_generation_config: "types.GenerateContentConfig"
+    model_validator_agent: "LlmAgent"
+    # Smaller prompts picked from the root class of the sqlglot AST; unknown classes use model_validator_agent
+    model_validator_agents: Dict[str, "LlmAgent"]
+    error_interpreter_agent: "LlmAgent"
+    coordinator_agent: "CoordinatorAgent"
+    root_agent: "CoordinatorAgent"
+    session_service: "BoundedSessionService"
+    runner: "Runner"
+
+
+_built: Optional[_BuiltAgents] = None
+
+
+def __getattr__(name: str):
+    # Only called for attributes the module doesn't have (PEP 562)
+    if name in _BuiltAgents.__dataclass_fields__:
+        return getattr(_agents(), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _agents() -> _BuiltAgents:
+    """The built agents, building them first if needed."""
+    build_agents()
+    return _built
+
+
+def _class_validator_agent(name: str, prompt: str, generation_config: "types.GenerateContentConfig") -> "LlmAgent":
+    """Builds a validator agent that only carries the prompt for one statement class."""
+    from google.adk.agents import LlmAgent
+    return LlmAgent(
+        name=name,
+        model="gemini-2.5-flash",
+        instruction=prompt,
+        description="Strict Spark SQL validator for one statement class. Returns only structured JSON output.",
+        output_key="model_agent_result",
+        generate_content_config = generation_config,
+        include_contents='none',
+        before_model_callback=_before_model_callbacks(),
+    )
+
+
+def agents_built() -> bool:
+    """Whether build_agents has run, i.e. the Google SDKs are loaded and the runner exists."""
+    return _built is not None
+
+
+def build_agents() -> None:
+    """
+    Imports the Google SDKs and builds the LlmAgents, the coordinator, the session service and
+    the runner from the settings above. Later calls do nothing. Services can call it at startup
+    to keep its cost off their first request.
+    """
+    global _built, prompt_cache
+    if _built is not None:
+        return
+    started = time.perf_counter()
+    from google.adk.agents import LlmAgent
+    from google.adk.runners import Runner
+    from google.genai import types
+    from .custom_agent.coordinator_agent import CoordinatorAgent
+    from .custom_agent.session_store import BoundedSessionService
+    from .tools.ast_rules import RuleEngine
+
+    validation_generation_config = types.GenerateContentConfig(
+        temperature=0.0,             # For strict, deterministic output
+        top_p=0.9,                   # To reduce randomness
+        top_k=1,                     # To further reduce randomness
+        response_mime_type='application/json' # Crucial for enforcing JSON
+    )
+    if USE_PROMPT_CACHE and prompt_cache is None:
+        from .custom_agent.prompt_cache import GeminiCachedContentBackend, PromptCacheManager
+        prompt_cache = PromptCacheManager(
+            GeminiCachedContentBackend(),
+            ttl_seconds=PROMPT_CACHE_TTL_SECONDS,
+        )
+
+    model_validator_agent = LlmAgent(
+        name="ModelBasedValidatorAgent",
+        model="gemini-2.5-flash",
+        instruction=model_validator.MODEL_VALIDATOR_PROMPT,
+        description="Strict Spark SQL validator. Returns only structured JSON output. Does not explain, repair, or interpret user queries.",
+        output_key="model_agent_result",
+        generate_content_config = validation_generation_config,
+        include_contents='none',
+        before_model_callback=_before_model_callbacks(),
+    )
+    model_validator_agents = {
+        prompt_router.QUERY: _class_validator_agent("QueryValidatorAgent", query_validator.QUERY_VALIDATOR_PROMPT,
+                                                         validation_generation_config),
+        prompt_router.FUNCTIONS: _class_validator_agent("FunctionValidatorAgent", function_validator.FUNCTION_VALIDATOR_PROMPT,
+                                                         validation_generation_config),
+        prompt_router.DDL: _class_validator_agent("DdlValidatorAgent", ddl_validator.DDL_VALIDATOR_PROMPT,
+                                                         validation_generation_config),
+        prompt_router.DML: _class_validator_agent("DmlValidatorAgent", dml_validator.DML_VALIDATOR_PROMPT,
+                                                         validation_generation_config),
+        prompt_router.SESSION: _class_validator_agent("SessionCommandValidatorAgent", session_validator.SESSION_VALIDATOR_PROMPT,
+                                                         validation_generation_config),
+    }
+    error_interpreter_agent = LlmAgent(
+        name="ErrorInterpreterAgent",
+        model="gemini-2.5-flash",
+        instruction= error_interpreter.ERROR_INTERPRETER_PROMPT,
+        description="Strict error interpreter for SQL syntax errors. Analyzes provided SQL query and error message, returning only structured JSON output with clear syntax error explanation.",
+        generate_content_config = validation_generation_config,
+        include_contents='none',
+        before_model_callback=_before_model_callbacks(),
+    )
+
+    coordinator_agent = CoordinatorAgent(
+        name="CoordinatorAgent",
+        model_validator_agent=model_validator_agent,
+        error_intepreter_agent=error_interpreter_agent,
+        model_validator_agents=model_validator_agents,
+        verdict_cache=verdict_cache,
+        verdict_store=verdict_store,
+        fingerprint_cache=USE_FINGERPRINT_CACHE,
+        model_tiering=model_tiering,
+        latency_profile=DEFAULT_LATENCY_PROFILE,
+        circuit_breaker=circuit_breaker,
+        request_timeout_seconds=REQUEST_TIMEOUT_SECONDS,
+        single_flight=single_flight,
+        metrics=metrics,
+        rule_engine=RuleEngine(),
+        sub_agents=[model_validator_agent, error_interpreter_agent, *model_validator_agents.values()],
+    )
+
+    # --- Setup Runner and Session ---
+    session_service = BoundedSessionService(
+        max_sessions=SESSION_MAX_SESSIONS,
+        max_events_per_session=SESSION_MAX_EVENTS,
+        idle_ttl_seconds=SESSION_IDLE_TTL_SECONDS,
+    )
+    metrics.register_gauge("sessions", "Sessions held by the session store.", session_service.session_count)
+    metrics.register_gauge("session_events", "Events held by the session store.", session_service.event_count)
+
+    runner = Runner(
+        agent=coordinator_agent, # Pass the custom orchestrator agent
+        app_name=APP_NAME,
+        session_service=session_service
+    )
+    _built = _BuiltAgents(
+        validation_generation_config=validation_generation_config,
+        model_validator_agent=model_validator_agent,
+        model_validator_agents=model_validator_agents,
+        error_interpreter_agent=error_interpreter_agent,
+        coordinator_agent=coordinator_agent,
+        root_agent=coordinator_agent,
+        session_service=session_service,
+        runner=runner,
+    )
+    logger.info("Built the agents in %.3fs", time.perf_counter() - started)
+
+    if USE_HEDGING:
+        use_hedging()
+
+
+def llm_agents() -> list:
+    """Every LlmAgent the coordinator may call."""
+    built = _agents()
+    return [built.model_validator_agent, built.error_interpreter_agent, *built.model_validator_agents.values()]
+
+
+def use_model_backend(model) -> None:
+    """
+    Points every LlmAgent at the given model: a model name, or a BaseLlm instance such as
+    custom_agent.fake_llm.FakeLlm for offline runs. Hedging, if in use, wraps the new model.
+    """
+    for agent in llm_agents():
+        agent.model = model
+    if hedged_model is not None:
+        use_hedging(hedged_model.hedge_quantile, hedged_model.max_extra_ratio)
+
+
+def use_hedging(hedge_quantile: float = HEDGE_QUANTILE, max_extra_ratio: float = HEDGE_MAX_EXTRA_RATIO) -> "HedgedLlm":
+    """
+    Hedges the model validators' calls (see custom_agent.hedging.HedgedLlm), wrapping the model
+    they use now. The error interpreter is left alone: it runs on the rarer invalid statements.
+    """
+    global hedged_model
+    built = _agents()
+    from google.adk.models.google_llm import Gemini
+    from .custom_agent.hedging import HedgedLlm
+    validators = [built.model_validator_agent, *built.model_validator_agents.values()]
+    model = built.model_validator_agent.model
+    if isinstance(model, HedgedLlm):
+        model = model.inner
+    hedged_model = HedgedLlm(
+        inner=Gemini(model=model) if isinstance(model, str) else model,
+        hedge_quantile=hedge_quantile,
+        max_extra_ratio=max_extra_ratio,
+    )
+    for agent in validators:
+        agent.model = hedged_model
+    return hedged_model
+
+
+def use_verdict_store(path: str) -> SqliteVerdictStore:
+    """Persists the coordinator's verdicts in the SQLite file at path, replacing any store in use."""
+    global verdict_store
+    if verdict_store is not None:
+        verdict_store.close()
+    verdict_store = SqliteVerdictStore(path, max_entries=VERDICT_STORE_MAX_ENTRIES)
+    if _built is not None:
+        _built.coordinator_agent.verdict_store = verdict_store
+    return verdict_store
+
+
+def use_model_tiering(router: ModelTierRouter) -> ModelTierRouter:
+    """Routes the model validator's requests by statement complexity with the given router, replacing any in use."""
+    global model_tiering
+    if _built is not None:
+        for agent in llm_agents():
+            callbacks = agent.before_model_callback
+            if model_tiering is not None:
+                callbacks.remove(model_tiering.before_model_callback)
+            callbacks.insert(0, router.before_model_callback)
+        _built.coordinator_agent.model_tiering = router
+    model_tiering = router
+    return router
+
+
+@asynccontextmanager
+async def request_session(state: Optional[dict] = None):
+    """
+    Creates an isolated, short-lived session for one validation and deletes it afterwards.
+
+    The coordinator keeps per-request values (sql_to_validate, error, model_agent_result)
+    in session state, so giving every request its own session lets many validations run
+    concurrently in one process without overwriting each other's query.
+    """
+    session_service = _agents().session_service
+    session = await session_service.create_session(app_name=APP_NAME, user_id=USER_ID, state=state or {})
+    try:
+        yield session
+    finally:
+        await session_service.delete_session(app_name=APP_NAME, user_id=USER_ID, session_id=session.id)
+
 
 # --- Function to Interact with the Agent ---
+async def _run_events(session_id: str, query: str) -> AsyncIterator["Event"]:
+    """Runs the coordinator natively on the event loop for one query in an existing session."""
+    from google.genai import types
+    content = types.Content(role='user', parts=[types.Part(text=query)])
+    async for event in _agents().runner.run_async(user_id=USER_ID, session_id=session_id, new_message=content):
+        yield event
+
+
+def _request_state(profile: Optional[str], timeout_seconds: Optional[float]) -> dict:
+    """Initial session state of one validation, checking the requested latency profile and timeout."""
+    from .custom_agent.coordinator_agent import TIMEOUT_STATE_KEY
+    state = {}
+    if profile is not None:
+        get_latency_profile(profile)
+        state[REQUEST_STATE_KEY] = profile
+    if timeout_seconds is not None:
+        if timeout_seconds <= 0:
+            raise ValueError("timeout_seconds must be positive")
+        state[TIMEOUT_STATE_KEY] = timeout_seconds
+    return state
+
+
+async def stream_validation(query: str, profile: Optional[str] = None,
+                            timeout_seconds: Optional[float] = None) -> AsyncIterator["Event"]:
+    """
+    Validates a query in its own session and yields coordinator events as they are produced.
+
+    Nothing blocks the event loop while the model is working, so an asyncio service
+    can serve other requests in the meantime. The parser verdict arrives first, as soon
+    as validate_sql_syntax returns (its event carries custom_metadata {"stage": "parser"});
+    the final response event carries the verdict JSON.
+    profile picks the latency profile of the model calls (see DEFAULT_LATENCY_PROFILE) and
+    timeout_seconds bounds the validation (see REQUEST_TIMEOUT_SECONDS).
+    """
+    async with request_session(_request_state(profile, timeout_seconds)) as session:
+        async for event in _run_events(session.id, query):
+            yield event
+
+
 async def call_agent(user_input_topic: str):
     """
-    Sends a new topic to the agent (overwriting the initial one if needed)
-    and runs the workflow.
+    Sends a query to the agent in its own session and runs the workflow.
     """
-    current_session = await session_service.get_session(app_name=APP_NAME, 
-                                                  user_id=USER_ID, 
-                                                  session_id=SESSION_ID)
-    if not current_session:
-        logger.error("Session not found!")
-        return
+    async with request_session({"input": user_input_topic}) as session:
+        logger.info(f"Validating input: {user_input_topic}")
 
-    current_session.state["input"] = user_input_topic
-    logger.info(f"Updated session state input to: {user_input_topic}")
+        final_response = "No final response captured."
+        async for event in _run_events(session.id, user_input_topic):
+            if event.is_final_response() and event.content and event.content.parts:
+                logger.info(f"Potential final response from [{event.author}]: {event.content.parts[0].text}")
+                final_response = event.content.parts[0].text
 
-    content = types.Content(role='user', parts=[types.Part(text=f"{user_input_topic}")])
-    events = runner.run(user_id=USER_ID, session_id=SESSION_ID, new_message=content)
+        print("\n--- Agent Interaction Result ---")
+        print("Agent Final Response: ", final_response)
 
-    final_response = "No final response captured."
-    for event in events:
+        final_session = await _agents().session_service.get_session(app_name=APP_NAME, 
+                                                                    user_id=USER_ID, 
+                                                                    session_id=session.id)
+        print("Final Session State:")
+        import json
+        print(json.dumps(final_session.state, indent=2))
+        print("-------------------------------\n")
+
+
+# --- Batch Validation ---
+async def validate_query(query: str, profile: Optional[str] = None, timeout_seconds: Optional[float] = None) -> dict:
+    """
+    Validates a single query in its own short-lived session and returns the verdict.
+
+    Each call runs in its own request_session (see stream_validation), so concurrent
+    validations never share state.
+    If the final response is not a well-formed verdict, "isValidSQL" is None and
+    "summary" carries the raw response text.
+    """
+    final_response = None
+    async for event in stream_validation(query, profile, timeout_seconds):
         if event.is_final_response() and event.content and event.content.parts:
-            logger.info(f"Potential final response from [{event.author}]: {event.content.parts[0].text}")
             final_response = event.content.parts[0].text
 
-    print("\n--- Agent Interaction Result ---")
-    print("Agent Final Response: ", final_response)
+    verdict = parse_verdict(final_response)
+    if verdict is None:
+        return {"isValidSQL": None, "summary": final_response or "No final response captured."}
+    return verdict
+
+
+async def validate_many(queries: Iterable[str], concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+                        profile: Optional[str] = None,
+                        timeout_seconds: Optional[float] = None) -> AsyncIterator[Tuple[int, dict]]:
+    """
+    Validates many queries concurrently and yields (index, verdict) pairs as they finish.
+
+    At most `concurrency` validations are in flight at once, so total time is bounded
+    by the model quota rather than the sum of the latencies. Results arrive in
+    completion order; the index refers to the position in `queries`. A validation
+    that raises is reported as a verdict with "isValidSQL" None instead of aborting
+    the batch. Every query uses the latency profile `profile` and, if given, its own
+    timeout of `timeout_seconds`.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    # Reject an unknown profile or a bad timeout before any query starts
+    _request_state(profile, timeout_seconds)
+    semaphore = asyncio.Semaphore(concurrency)
 
-    final_session = session_service.get_session(app_name=APP_NAME, 
-                                                user_id=USER_ID, 
-                                                session_id=SESSION_ID)
-    print("Final Session State:")
-    import json
-    print(json.dumps(final_session.state, indent=2))
-    print("-------------------------------\n")
+    async def run(index: int, query: str) -> Tuple[int, dict]:
+        async with semaphore:
+            try:
+                return index, await validate_query(query, profile, timeout_seconds)
+            except Exception as e:
+                logger.exception("Validation of query %d failed", index)
+                return index, {"isValidSQL": None, "summary": f"Validation failed: {e}"}
 
-root_agent = coordinator_agent
\ No newline at end of file
+    tasks = [asyncio.ensure_future(run(index, query)) for index, query in enumerate(queries)]
+    try:
+        for next_result in asyncio.as_completed(tasks):
+            yield await next_result
+    finally:
+        for task in tasks:
+            task.cancel()
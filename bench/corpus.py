@@ -0,0 +1,141 @@
+import argparse
+import json
+import re
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Iterator, List, Optional
+
+from ..requirements import ddl_validator, dml_validator, error_interpreter, function_validator
+from ..requirements import query_validator, session_validator
+
+# Bump when the extracted examples or the synthetic generators change, so results
+# recorded against different corpora are never compared with each other.
+CORPUS_VERSION = 1
+CORPUS_PATH = Path(__file__).with_name(f"corpus_v{CORPUS_VERSION}.jsonl")
+
+# Prompt example sections, in the order they appear in MODEL_VALIDATOR_PROMPT
+_EXAMPLE_SECTIONS = (
+    ("query", query_validator.QUERY_EXAMPLES),
+    ("functions", function_validator.FUNCTION_EXAMPLES),
+    ("ddl", ddl_validator.DDL_EXAMPLES),
+    ("dml", dml_validator.DML_EXAMPLES),
+    ("session", session_validator.SESSION_EXAMPLES),
+)
+_QUERY_LINE = re.compile(r"^\* \*\*Query:\*\* `(.*)`\s*$", re.M)
+_SCENARIO = re.compile(r"^Scenario \d+: (.*)\nSQL Query: (.*)\n", re.M)
+
+
+@dataclass(frozen=True)
+class Case:
+    """One labeled query of the benchmark corpus."""
+    id: str
+    source: str
+    sql: str
+    isValidSQL: bool
+    summary: str
+
+
+def _first_json_object(text: str) -> Optional[dict]:
+    start = text.find("{")
+    if start < 0:
+        return None
+    try:
+        return json.JSONDecoder().raw_decode(text, start)[0]
+    except ValueError:
+        return None
+
+
+def prompt_example_cases() -> List[Case]:
+    """Extract the labeled query/verdict pairs embedded in the validator prompt sections."""
+    cases = []
+    for section, examples in _EXAMPLE_SECTIONS:
+        matches = list(_QUERY_LINE.finditer(examples))
+        for i, match in enumerate(matches):
+            end = matches[i + 1].start() if i + 1 < len(matches) else len(examples)
+            verdict = _first_json_object(examples[match.end():end])
+            if verdict is None:
+                continue
+            cases.append(Case(f"{section}-{i + 1:03d}", section, match.group(1),
+                              verdict["isValidSQL"], verdict["summary"]))
+    return cases
+
+
+def error_interpreter_cases() -> List[Case]:
+    """
+    Extract the scenarios of ERROR_INTERPRETER_PROMPT. Scenarios whose error comes from
+    the catalog rather than the parser (their summary calls it a schema issue) are
+    skipped: their SQL is syntactically valid.
+    """
+    cases = []
+    prompt = error_interpreter.ERROR_INTERPRETER_PROMPT
+    for i, match in enumerate(_SCENARIO.finditer(prompt)):
+        verdict = _first_json_object(prompt[match.end():])
+        if verdict is None or "schema" in verdict["summary"]:
+            continue
+        cases.append(Case(f"interpreter-{i + 1:03d}", "error_interpreter", match.group(2).strip(),
+                          verdict["isValidSQL"], verdict["summary"]))
+    return cases
+
+
+def synthetic_cases() -> List[Case]:
+    """Large generated queries that stress parsing, canonicalization and prompt size."""
+    cte_chain = "WITH " + ", ".join(
+        f"c{i} AS (SELECT id, v + {i} AS v FROM {'base' if i == 0 else f'c{i - 1}'})" for i in range(200)
+    ) + " SELECT id, v FROM c199"
+    in_list = "SELECT id, name FROM users WHERE id IN (" + ", ".join(str(i) for i in range(10_000)) + ")"
+    union = " UNION ALL ".join(f"SELECT {i} AS part, id, amount FROM sales_{i}" for i in range(200))
+    wide_select = "SELECT " + ", ".join(f"col_{i} AS alias_{i}" for i in range(1_000)) + " FROM wide_table"
+    values = "INSERT INTO events VALUES " + ", ".join(f"({i}, 'event_{i}', {i * 0.5})" for i in range(5_000))
+    return [
+        Case("synthetic-cte-chain-200", "synthetic", cte_chain, True, "200 chained CTEs."),
+        Case("synthetic-in-list-10k", "synthetic", in_list, True, "IN list with 10,000 literals."),
+        Case("synthetic-union-all-200", "synthetic", union, True, "200-way UNION ALL."),
+        Case("synthetic-wide-select-1000", "synthetic", wide_select, True, "SELECT list with 1,000 aliased columns."),
+        Case("synthetic-values-5k", "synthetic", values, True, "INSERT with 5,000 VALUES rows."),
+        Case("synthetic-union-all-200-unclosed", "synthetic", union + " WHERE (amount > 0", False,
+             "Unclosed parenthesis at the end of a 200-way UNION ALL."),
+        Case("synthetic-cte-chain-200-missing-comma", "synthetic", cte_chain.replace("), c100 AS", ") c100 AS"), False,
+             "Missing comma between two CTEs of a 200-CTE chain."),
+    ]
+
+
+def extract_corpus() -> List[Case]:
+    """Every labeled example from the prompts, in prompt order."""
+    return prompt_example_cases() + error_interpreter_cases()
+
+
+def write_corpus(path: Path = CORPUS_PATH) -> int:
+    cases = extract_corpus()
+    with open(path, "w", encoding="utf-8") as corpus:
+        for case in cases:
+            corpus.write(json.dumps(asdict(case)) + "\n")
+    return len(cases)
+
+
+def load_corpus(path: Path = CORPUS_PATH, include_synthetic: bool = True) -> List[Case]:
+    """Load the extracted corpus file and, by default, append the synthetic cases."""
+    with open(path, encoding="utf-8") as corpus:
+        cases = [Case(**json.loads(line)) for line in corpus if line.strip()]
+    if include_synthetic:
+        cases.extend(synthetic_cases())
+    return cases
+
+
+def iter_sources(cases: List[Case]) -> Iterator[str]:
+    seen = set()
+    for case in cases:
+        if case.source not in seen:
+            seen.add(case.source)
+            yield case.source
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Extract the labeled prompt examples into the benchmark corpus.")
+    parser.add_argument("--output", type=Path, default=CORPUS_PATH)
+    args = parser.parse_args()
+    count = write_corpus(args.output)
+    print(f"Wrote {count} cases to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+PACKAGE = __package__.split(".")[0]
+# Directory holding the package, put on the path of every measured interpreter
+PACKAGE_PARENT = Path(__file__).resolve().parents[2]
+
+# Startup paths timed in fresh interpreters. agent_built is what importing agent cost
+# before its construction was deferred: every SDK import plus building the agents and runner.
+TARGETS = {
+    "parser_only": f"import {PACKAGE}.parser_only",
+    "parser_only_validation": f"from {PACKAGE}.parser_only import validate_query; validate_query('SELECT a FROM t WHERE b > 1')",
+    "agent_import": f"import {PACKAGE}.agent",
+    "agent_built": f"import {PACKAGE}.agent; {PACKAGE}.agent.build_agents()",
+}
+
+_PROBE = """
+import json, sys, time
+sys.path.insert(0, {path!r})
+started = time.perf_counter()
+{statement}
+seconds = time.perf_counter() - started
+google_sdk = any(name.startswith(("google.adk", "google.genai")) for name in sys.modules)
+print(json.dumps({{"seconds": seconds, "google_sdk": google_sdk}}))
+"""
+
+
+def measure(statement: str) -> dict:
+    """Run statement in a fresh interpreter; return its own time, the process's wall time and whether it loaded the Google SDKs."""
+    started = time.perf_counter()
+    completed = subprocess.run([sys.executable, "-c", _PROBE.format(path=str(PACKAGE_PARENT), statement=statement)],
+                               capture_output=True, text=True, check=True)
+    probe = json.loads(completed.stdout.strip().splitlines()[-1])
+    probe["process_seconds"] = time.perf_counter() - started
+    return probe
+
+
+def run_targets(targets: Dict[str, str], repeat: int) -> dict:
+    results = {}
+    for name, statement in targets.items():
+        # One untimed run first, so every timed run finds the bytecode cache written
+        measure(statement)
+        probes = [measure(statement) for _ in range(repeat)]
+        seconds = [probe["seconds"] for probe in probes]
+        results[name] = {
+            "statement": statement,
+            "median_seconds": statistics.median(seconds),
+            "min_seconds": min(seconds),
+            "process_median_seconds": statistics.median(probe["process_seconds"] for probe in probes),
+            "google_sdk_loaded": any(probe["google_sdk"] for probe in probes),
+        }
+    return results
+
+
+def build_report(results: dict, repeat: int) -> dict:
+    report = {"python": sys.version.split()[0], "repeat": repeat, "targets": results}
+    eager = results.get("agent_built")
+    if eager is not None:
+        # Startup time each lazy path saves over building everything at import
+        report["startup_gain_seconds"] = {
+            name: eager["median_seconds"] - result["median_seconds"]
+            for name, result in results.items() if name != "agent_built"
+        }
+    return report
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Time package startup paths in fresh interpreters.")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per target.")
+    parser.add_argument("--target", action="append", choices=tuple(TARGETS),
+                        help="Only time this target (repeatable).")
+    parser.add_argument("--output", type=Path, help="Write the JSON report here instead of stdout.")
+    args = parser.parse_args(argv)
+    if args.repeat < 1:
+        parser.error("--repeat must be at least 1")
+
+    targets = {name: TARGETS[name] for name in args.target} if args.target else TARGETS
+    report = build_report(run_targets(targets, args.repeat), args.repeat)
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(text + "\n", encoding="utf-8")
+    else:
+        sys.stdout.write(text + "\n")
+
+
+if __name__ == "__main__":
+    main()
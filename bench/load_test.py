@@ -0,0 +1,118 @@
+import argparse
+import asyncio
+import itertools
+import json
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+from .. import agent
+from ..custom_agent.fake_llm import FakeLlm, fixed_latency, load_recordings, lognormal_latency, uniform_latency
+from ..custom_agent.metrics import ERROR_INTERPRETER, MODEL_VALIDATOR, QUANTILES, REQUEST, quantile
+from .corpus import CORPUS_PATH, Case, load_corpus
+from .run_bench import outcome_counts, run_corpus
+
+DEFAULT_CONCURRENCY_LEVELS = "1,2,4,8,16,32,64"
+
+
+def _latency_model(args: argparse.Namespace):
+    if args.latency == "fixed":
+        return fixed_latency(args.latency_median)
+    if args.latency == "uniform":
+        return uniform_latency(args.latency_median / 2, args.latency_median * 1.5)
+    return lognormal_latency(args.latency_median, args.latency_sigma)
+
+
+async def run_level(cases: List[Case], requests: int, concurrency: int) -> dict:
+    """Send `requests` validations at the given concurrency and report throughput, tail latency and overhead."""
+    workload = list(itertools.islice(itertools.cycle(cases), requests))
+    agent.metrics.reset()
+    started = time.perf_counter()
+    results = await run_corpus(workload, concurrency)
+    wall_seconds = time.perf_counter() - started
+
+    latencies = [result.latency_seconds for result in results]
+    stages = agent.metrics.snapshot()["stages"]
+    request_seconds = stages.get(REQUEST, {}).get("sum", 0.0)
+    model_seconds = sum(stages.get(stage, {}).get("sum", 0.0) for stage in (MODEL_VALIDATOR, ERROR_INTERPRETER))
+    return {
+        "concurrency": concurrency,
+        "requests": len(results),
+        # Model failures mostly surface as parser-only fallbacks, not as errors
+        **outcome_counts(results),
+        "wall_seconds": wall_seconds,
+        "queries_per_second": len(results) / wall_seconds if wall_seconds else None,
+        "latency_seconds": {f"p{int(q * 100)}": quantile(latencies, q) for q in QUANTILES},
+        # Time spent in the coordinator outside model calls, per request
+        "coordinator_overhead_seconds": (request_seconds - model_seconds) / len(results) if results else None,
+    }
+
+
+async def sweep(cases: List[Case], requests: int, levels: List[int]) -> List[dict]:
+    return [await run_level(cases, requests, concurrency) for concurrency in levels]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Load-test the coordinator against an offline model backend, sweeping concurrency.")
+    parser.add_argument("--concurrency", default=DEFAULT_CONCURRENCY_LEVELS,
+                        help="Comma-separated concurrency levels to sweep.")
+    parser.add_argument("--requests", type=int, default=200, help="Validations sent at each level.")
+    parser.add_argument("--corpus", type=Path, default=CORPUS_PATH)
+    parser.add_argument("--synthetic", action="store_true", help="Include the large synthetic queries.")
+    parser.add_argument("--latency", choices=("fixed", "uniform", "lognormal"), default="lognormal")
+    parser.add_argument("--latency-median", type=float, default=0.5, help="Median model latency in seconds.")
+    parser.add_argument("--latency-sigma", type=float, default=0.5, help="Spread of the lognormal latency.")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of model calls failing with a 503.")
+    parser.add_argument("--rate-limit", type=float, help="Model calls per second before 429 errors.")
+    parser.add_argument("--recordings", type=Path, help="Replay recorded responses from this JSON file.")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--warm", action="store_true",
+                        help="Keep the verdict cache and in-flight deduplication enabled.")
+    parser.add_argument("--hedge", action="store_true", help="Hedge slow model validator calls.")
+    parser.add_argument("--output", type=Path, help="Write the JSON report here instead of stdout.")
+    args = parser.parse_args()
+
+    model = FakeLlm(
+        latency=_latency_model(args),
+        error_rate=args.error_rate,
+        rate_limit_per_second=args.rate_limit,
+        recordings=load_recordings(args.recordings) if args.recordings else {},
+        seed=args.seed,
+    )
+    agent.use_model_backend(model)
+    if args.hedge:
+        agent.use_hedging()
+    if not args.warm:
+        agent.coordinator_agent.verdict_cache = None
+        agent.coordinator_agent.verdict_store = None
+        agent.coordinator_agent.single_flight = None
+
+    cases = load_corpus(args.corpus, include_synthetic=args.synthetic)
+    levels = [int(level) for level in args.concurrency.split(",")]
+    report = {
+        "backend": {
+            "latency": args.latency,
+            "latency_median_seconds": args.latency_median,
+            "error_rate": args.error_rate,
+            "rate_limit_per_second": args.rate_limit,
+            "recordings": len(model.recordings),
+        },
+        "levels": asyncio.run(sweep(cases, args.requests, levels)),
+        "model_calls": model.calls,
+        "replayed": model.replayed,
+        "failures": model.failures,
+        "rate_limited": model.rate_limited,
+        "hedging": agent.hedged_model.stats() if agent.hedged_model is not None else None,
+    }
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(text + "\n", encoding="utf-8")
+    else:
+        sys.stdout.write(text + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from .. import agent
+from ..custom_agent.fake_llm import FakeLlm
+from ..custom_agent.latency_profiles import PROFILES
+from ..custom_agent.metrics import QUANTILES, quantile
+from ..custom_agent.verdict import PARSER_ONLY, parse_verdict
+from .corpus import CORPUS_PATH, CORPUS_VERSION, Case, iter_sources, load_corpus
+
+
+@dataclass
+class CaseResult:
+    case: Case
+    predicted: Optional[bool]
+    summary: str
+    latency_seconds: float
+    prompt_tokens: int
+    output_tokens: int
+    thought_tokens: int
+    # "parser-only" when the model was skipped or failed and the parser's result stands in, with the reason
+    tier: Optional[str] = None
+    reason: Optional[str] = None
+    # The validation raised or gave no well-formed verdict
+    error: bool = False
+
+    @property
+    def correct(self) -> bool:
+        return self.predicted is self.case.isValidSQL
+
+    @property
+    def parser_only(self) -> bool:
+        return self.tier == PARSER_ONLY
+
+
+async def run_case(case: Case, profile: Optional[str] = None) -> CaseResult:
+    """Validate one case through the full coordinator pipeline, timing it and summing model token usage."""
+    started = time.perf_counter()
+    final_response = None
+    prompt_tokens = output_tokens = thought_tokens = 0
+    try:
+        async for event in agent.stream_validation(case.sql, profile):
+            usage = event.usage_metadata
+            if usage is not None and not event.partial:
+                prompt_tokens += usage.prompt_token_count or 0
+                output_tokens += usage.candidates_token_count or 0
+                thought_tokens += usage.thoughts_token_count or 0
+            if event.is_final_response() and event.content and event.content.parts:
+                final_response = event.content.parts[0].text
+    except Exception as e:
+        final_response = f"Validation failed: {e}"
+    latency = time.perf_counter() - started
+    verdict = parse_verdict(final_response)
+    error = verdict is None
+    if verdict is None:
+        verdict = {"isValidSQL": None, "summary": final_response or ""}
+    return CaseResult(case, verdict["isValidSQL"], verdict["summary"], latency, prompt_tokens, output_tokens,
+                      thought_tokens, verdict.get("tier"), verdict.get("reason"), error)
+
+
+async def run_corpus(cases: List[Case], concurrency: int, profile: Optional[str] = None) -> List[CaseResult]:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def bounded(case: Case) -> CaseResult:
+        async with semaphore:
+            return await run_case(case, profile)
+
+    return await asyncio.gather(*(bounded(case) for case in cases))
+
+
+def _accuracy(results: List[CaseResult]) -> Optional[float]:
+    return sum(result.correct for result in results) / len(results) if results else None
+
+
+def outcome_counts(results: List[CaseResult]) -> dict:
+    """
+    Count failed validations apart from parser-only verdicts. A failed or skipped model call
+    still gives a well-formed parser-only verdict, so it only shows up under "parser_only",
+    broken down by reason in "fallbacks".
+    """
+    fallbacks: Dict[str, int] = {}
+    for result in results:
+        if result.parser_only:
+            reason = result.reason or "unknown"
+            fallbacks[reason] = fallbacks.get(reason, 0) + 1
+    return {
+        "errors": sum(result.error for result in results),
+        "parser_only": sum(result.parser_only for result in results),
+        "fallbacks": fallbacks,
+    }
+
+
+def build_report(cases: List[Case], results: List[CaseResult], wall_seconds: float, concurrency: int,
+                 include_cases: bool, profile: Optional[str] = None) -> dict:
+    """Summarize a run as one JSON-serializable report: correctness, latency, tokens and throughput."""
+    latencies = [result.latency_seconds for result in results]
+    prompt_tokens = sum(result.prompt_tokens for result in results)
+    output_tokens = sum(result.output_tokens for result in results)
+    thought_tokens = sum(result.thought_tokens for result in results)
+    report = {
+        "corpus_version": CORPUS_VERSION,
+        "model": agent.model_validator_agent.model if isinstance(agent.model_validator_agent.model, str)
+        else agent.model_validator_agent.model.model,
+        "latency_profile": profile or agent.coordinator_agent.latency_profile,
+        "cases": len(results),
+        "concurrency": concurrency,
+        "accuracy": {
+            "overall": _accuracy(results),
+            "by_source": {
+                source: _accuracy([result for result in results if result.case.source == source])
+                for source in iter_sources(cases)
+            },
+            # Accuracy of the verdicts the full pipeline gave, parser-only fallbacks left out
+            "excluding_parser_only": _accuracy([result for result in results if not result.parser_only]),
+            "undecided": sum(result.predicted is None for result in results),
+            **outcome_counts(results),
+        },
+        "latency_seconds": {
+            **{f"p{int(q * 100)}": quantile(latencies, q) for q in QUANTILES},
+            "mean": statistics.fmean(latencies) if latencies else None,
+            "max": max(latencies, default=None),
+        },
+        "tokens": {
+            "prompt": prompt_tokens,
+            "output": output_tokens,
+            "thoughts": thought_tokens,
+            "per_query": (prompt_tokens + output_tokens + thought_tokens) / len(results) if results else None,
+        },
+        "wall_seconds": wall_seconds,
+        "queries_per_second": len(results) / wall_seconds if wall_seconds else None,
+        "pipeline": agent.metrics.snapshot(),
+    }
+    if include_cases:
+        report["results"] = [
+            {
+                "id": result.case.id,
+                "expected": result.case.isValidSQL,
+                "predicted": result.predicted,
+                "correct": result.correct,
+                "latency_seconds": result.latency_seconds,
+                "prompt_tokens": result.prompt_tokens,
+                "output_tokens": result.output_tokens,
+                "thought_tokens": result.thought_tokens,
+                "tier": result.tier,
+                "reason": result.reason,
+                "error": result.error,
+                "summary": result.summary,
+            }
+            for result in results
+        ]
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run the labeled corpus through the validation pipeline.")
+    parser.add_argument("--corpus", type=Path, default=CORPUS_PATH)
+    parser.add_argument("--no-synthetic", action="store_true", help="Skip the large generated queries.")
+    parser.add_argument("--source", action="append", help="Only run cases from this source (repeatable).")
+    parser.add_argument("--concurrency", type=int, default=agent.DEFAULT_BATCH_CONCURRENCY)
+    parser.add_argument("--cold", action="store_true",
+                        help="Disable the verdict cache and store so every case reaches its tier.")
+    parser.add_argument("--profile", choices=tuple(PROFILES),
+                        help="Latency profile of every case; compare runs to measure a profile's effect.")
+    parser.add_argument("--fake-model", action="store_true", help="Answer model calls locally with FakeLlm.")
+    parser.add_argument("--fake-latency", type=float, default=0.0)
+    parser.add_argument("--cases", action="store_true", help="Include a result entry per case.")
+    parser.add_argument("--output", type=Path, help="Write the JSON report here instead of stdout.")
+    args = parser.parse_args()
+
+    if args.fake_model:
+        agent.use_model_backend(FakeLlm(latency_seconds=args.fake_latency))
+    if args.cold:
+        agent.coordinator_agent.verdict_cache = None
+        agent.coordinator_agent.verdict_store = None
+
+    cases = load_corpus(args.corpus, include_synthetic=not args.no_synthetic)
+    if args.source:
+        cases = [case for case in cases if case.source in args.source]
+
+    agent.metrics.reset()
+    started = time.perf_counter()
+    results = asyncio.run(run_corpus(cases, args.concurrency, args.profile))
+    report = build_report(cases, results, time.perf_counter() - started, args.concurrency, args.cases, args.profile)
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(text + "\n", encoding="utf-8")
+    else:
+        sys.stdout.write(text + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+import time
+from typing import Callable, Optional
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Stops calling a model that keeps failing.
+
+    After `failure_threshold` consecutive failed calls the breaker opens and
+    `allow` refuses calls for `reset_timeout_seconds`. Then it lets a single trial
+    call through (half-open): a success closes the breaker again, a failure
+    reopens it. A trial that never reports back is replaced by a new one after
+    another `reset_timeout_seconds`.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout_seconds: float = 30.0,
+                 clock: Callable[[], float] = time.monotonic):
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be at least 1")
+        self.failure_threshold = failure_threshold
+        self.reset_timeout_seconds = reset_timeout_seconds
+        self._clock = clock
+        self._consecutive_failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_started_at: Optional[float] = None
+        self.opened = 0
+        self.rejected = 0
+
+    @property
+    def state(self) -> str:
+        if self._opened_at is None:
+            return CLOSED
+        if self._clock() - self._opened_at < self.reset_timeout_seconds:
+            return OPEN
+        return HALF_OPEN
+
+    def allow(self) -> bool:
+        """Return whether a model call may be made now; in the half-open state only the trial call may."""
+        state = self.state
+        if state == CLOSED:
+            return True
+        now = self._clock()
+        if state == HALF_OPEN and (self._trial_started_at is None
+                                   or now - self._trial_started_at >= self.reset_timeout_seconds):
+            self._trial_started_at = now
+            return True
+        self.rejected += 1
+        return False
+
+    def record_success(self) -> None:
+        self._consecutive_failures = 0
+        self._opened_at = None
+        self._trial_started_at = None
+
+    def record_failure(self) -> None:
+        self._consecutive_failures += 1
+        if self._opened_at is not None or self._consecutive_failures >= self.failure_threshold:
+            if self._opened_at is None or self.state == HALF_OPEN:
+                self.opened += 1
+            self._opened_at = self._clock()
+            self._trial_started_at = None
+
+    def stats(self) -> dict:
+        return {
+            "state": self.state,
+            "consecutive_failures": self._consecutive_failures,
+            "opened": self.opened,
+            "rejected": self.rejected,
+        }
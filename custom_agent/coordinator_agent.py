@@ -1,11 +1,127 @@
 from google.adk.agents import BaseAgent, LlmAgent
 from google.adk.agents.invocation_context import InvocationContext
 from google.adk.events import Event
+import asyncio
 import json
-from typing import AsyncGenerator
+import logging
+import time
+from contextlib import nullcontext
+from dataclasses import asdict
+from typing import AsyncGenerator, Dict, List, Optional, Sequence, Tuple
 from pydantic import Field
 from google.genai import types
-from ..tools.syntax_validator import validate_sql_syntax
+from sqlglot.tokens import Token
+from ..tools.ast_rules import RuleEngine
+from ..tools.error_templates import interpret_syntax_error
+from ..tools.fingerprint import query_fingerprint
+from ..tools.literal_compaction import DEFAULT_MAX_ITEMS, CompactedSql, compact_literals
+from ..tools.prompt_router import GENERAL, classify_statement
+from ..tools.statement_splitter import Statement, split_statements
+from ..tools.syntax_validator import ParseResult, parse_sql
+from .circuit_breaker import CircuitBreaker
+from .latency_profiles import PROFILE_STATE_KEY, REQUEST_STATE_KEY, LatencyProfile, get_latency_profile
+from .metrics import (
+    CACHE_LOOKUP, EMIT, ERROR_INTERPRETER, MODEL_VALIDATOR, PARSE, REQUEST, ROUTE, RULES, TIERING,
+    TIER_ERROR_INTERPRETER, TIER_MODEL, TIER_PARSER_ONLY, TIER_RULES, TIER_SINGLE_FLIGHT, TIER_TEMPLATE,
+    TIER_VERDICT_CACHE, TIER_VERDICT_STORE, Metrics,
+)
+from .model_tiering import MODEL_STATE_KEY, ModelTierRouter
+from .single_flight import SingleFlight
+from .verdict import PARSER_ONLY, parse_verdict, parser_only_verdict, script_verdict, statement_result, verdict_event
+from .verdict_cache import VerdictCache, verdict_cache_key
+from .verdict_store import SqliteVerdictStore
+
+logger = logging.getLogger(__name__)
+
+# Session state key a caller sets to bound one validation, in seconds
+TIMEOUT_STATE_KEY = "timeout_seconds"
+# Session state key holding the request's deadline, in event loop time
+_DEADLINE_STATE_KEY = "deadline"
+
+# Session state keys written during one validation. Each request runs in its own
+# session, so these never leak between concurrent validations.
+_STATE_KEYS = ("sql_to_validate", "error", "model_agent_result", MODEL_STATE_KEY, PROFILE_STATE_KEY, _DEADLINE_STATE_KEY)
+# Session state keys that statement-scoped contexts carry over
+_INHERITED_STATE_KEYS = (REQUEST_STATE_KEY, _DEADLINE_STATE_KEY)
+
+# Why a statement got a parser-only verdict
+_DEADLINE_EXCEEDED = "deadline_exceeded"
+_CIRCUIT_OPEN = "circuit_open"
+_MODEL_FAILURE = "model_failure"
+
+
+class _DeadlineExceeded(Exception):
+    """The request's deadline passed while a sub-agent was running."""
+
+
+def _model_name(agent: LlmAgent) -> str:
+    """Return the model name an LlmAgent is configured with."""
+    return agent.model if isinstance(agent.model, str) else agent.model.model
+
+
+def _instruction_text(agent: LlmAgent) -> str:
+    """Return the instruction an LlmAgent is configured with, for cache keying."""
+    if isinstance(agent.instruction, str):
+        return agent.instruction
+    return getattr(agent.instruction, "__qualname__", repr(agent.instruction))
+
+
+def _generation_config_text(agent: LlmAgent, profile: Optional[LatencyProfile] = None) -> str:
+    """Return the generation settings an LlmAgent is configured with, under the given latency profile, for cache keying."""
+    config = agent.generate_content_config
+    if profile is not None:
+        config = profile.generation_config(config)
+    if config is None:
+        return ""
+    return config.model_dump_json(exclude_none=True)
+
+
+def _with_original_positions(event: Event, compacted: CompactedSql) -> Event:
+    """
+    Returns the model's final event for a compacted statement with the elided lists listed in its
+    custom_metadata ("elisions") and the positions in its verdict mapped back to the submitted statement.
+    """
+    update = {"custom_metadata": {**(event.custom_metadata or {}),
+                                  "elisions": [asdict(elision) for elision in compacted.elisions]}}
+    text = event.content.parts[0].text or ""
+    restored = compacted.restore_positions(text)
+    if restored != text:
+        update["content"] = types.Content(role=event.content.role, parts=[types.Part(text=restored)])
+        state_delta = {key: restored if value == text else value for key, value in event.actions.state_delta.items()}
+        update["actions"] = event.actions.model_copy(update={"state_delta": state_delta})
+    return event.model_copy(update=update)
+
+
+async def _merge_event_streams(streams: List[AsyncGenerator[Event, None]], limit: int) -> AsyncGenerator[Event, None]:
+    """Run up to `limit` event streams at once and yield their events in arrival order."""
+    queue: asyncio.Queue = asyncio.Queue()
+    semaphore = asyncio.Semaphore(limit)
+    finished = object()
+
+    async def pump(stream: AsyncGenerator[Event, None]) -> None:
+        try:
+            async with semaphore:
+                async for event in stream:
+                    await queue.put(event)
+        finally:
+            await queue.put(finished)
+
+    tasks = [asyncio.ensure_future(pump(stream)) for stream in streams]
+    remaining = len(tasks)
+    try:
+        while remaining:
+            item = await queue.get()
+            if item is finished:
+                remaining -= 1
+                continue
+            yield item
+        for task in tasks:
+            # Surface the first failure, if any, once every stream has finished
+            task.result()
+    finally:
+        for task in tasks:
+            task.cancel()
+
 
 class CoordinatorAgent(BaseAgent):
     """
@@ -18,6 +134,39 @@ class CoordinatorAgent(BaseAgent):
     # # Declare the agents passed during initialization as class attributes with type hints
     model_validator_agent: LlmAgent = Field(...)
     error_intepreter_agent: LlmAgent = Field(...)
+    # Validators with a smaller, statement-class specific prompt, keyed by prompt_router class.
+    # Statements whose class has no entry here use model_validator_agent.
+    model_validator_agents: Dict[str, LlmAgent] = Field(default_factory=dict)
+    # Optional verdict cache; when set, repeated queries are answered without an LLM call
+    verdict_cache: Optional[VerdictCache] = None
+    # Optional persistent store behind the verdict cache, so verdicts survive restarts
+    verdict_store: Optional[SqliteVerdictStore] = None
+    # Key model validator verdicts on the literal-insensitive fingerprint instead of the canonical SQL,
+    # so parameter variants of one query shape share a verdict
+    fingerprint_cache: bool = False
+    # Optional in-flight deduplication; concurrent identical queries share one LLM call
+    single_flight: Optional[SingleFlight] = None
+    # Optional complexity-based model selection for the model validator; None always uses the agent's model
+    model_tiering: Optional[ModelTierRouter] = None
+    # Optional structural rule engine; a definite rule verdict skips the model validator
+    rule_engine: Optional[RuleEngine] = None
+    # Summarize common parse errors from sqlglot's structured error data instead of calling the error interpreter
+    use_error_templates: bool = True
+    # Optional per-stage latency histograms and verdict tier counters
+    metrics: Optional[Metrics] = None
+    # IN lists and VALUES blocks with more literal entries than this are shortened before the model
+    # validator sees them; None sends statements unchanged
+    literal_list_limit: Optional[int] = DEFAULT_MAX_ITEMS
+    # Latency profile (fast, balanced, thorough) of requests that don't pick one; None leaves the agents'
+    # generation settings unchanged
+    latency_profile: Optional[str] = None
+    # Optional circuit breaker around model calls; while it is open, statements get a parser-only verdict
+    circuit_breaker: Optional[CircuitBreaker] = None
+    # Seconds a request may take before its pending model calls are abandoned for parser-only verdicts;
+    # None waits as long as the model takes. Requests can set their own under TIMEOUT_STATE_KEY.
+    request_timeout_seconds: Optional[float] = None
+    # Maximum number of statements of one script validated at the same time
+    statement_concurrency: int = 8
 
     # model_config allows setting Pydantic configurations if needed, e.g., arbitrary_types_allowed
     model_config = {"arbitrary_types_allowed": True}
@@ -27,42 +176,105 @@ class CoordinatorAgent(BaseAgent):
         """
         Implements the custom orchestration logic for the sql validation.
         Uses the instance attributes assigned by Pydantic (e.g., self.model_validator_agent).
+        Scripts holding several statements are split and each statement is validated concurrently.
         """
         # Ensure session state is initialized
-        print("-----------------------------Session Start---------------------------------")
-        print("Session state:", ctx.session.state)
-        print("Context:", ctx.user_content)
+        logger.debug("Session %s state: %s", ctx.session.id, ctx.session.state)
         sql_query = ctx.user_content.parts[0].text
-        print(sql_query)
         if not sql_query:
             yield Event.text("No SQL input found in session state under key 'input'.")
             return
-        
-        print(sql_query)
-        ctx.session.state.clear() 
-        output = validate_sql_syntax(sql_query)
+
+        logger.debug("Validating %d characters of SQL", len(sql_query))
+        # Reset only the keys this agent owns; the rest of the session state belongs to the caller
+        for key in _STATE_KEYS:
+            ctx.session.state.pop(key, None)
+        timeout = ctx.session.state.get(TIMEOUT_STATE_KEY, self.request_timeout_seconds)
+        if timeout is not None:
+            # Shared by every stage and statement of this request
+            ctx.session.state[_DEADLINE_STATE_KEY] = asyncio.get_running_loop().time() + timeout
+        with self._span(REQUEST):
+            statements = split_statements(sql_query)
+            if len(statements) > 1:
+                events = self._validate_script(ctx, statements)
+            elif statements:
+                # The splitter already tokenized the statement; the parser reuses its tokens
+                events = self._validate_statement(ctx, statements[0].sql, {}, tokens=statements[0].tokens,
+                                                  start_line=statements[0].start_line,
+                                                  start_column=statements[0].start_column)
+            else:
+                events = self._validate_statement(ctx, sql_query, {})
+            async for event in events:
+                # Time spent handing the event to the runner, which appends it to the session
+                started = time.perf_counter()
+                yield event
+                self._observe(EMIT, time.perf_counter() - started)
+
+         # After tool_validator_agent finishes, clear its specific state once it's been handled
+        for key in _STATE_KEYS:
+            ctx.session.state.pop(key, None)
+
+    async def _validate_statement(self, ctx: InvocationContext, sql_query: str, outcome: dict, statement: Optional[Statement] = None,
+                                  tokens: Sequence[Token] = (), start_line: int = 1,
+                                  start_column: int = 1) -> AsyncGenerator[Event, None]:
+        """
+        Validates a single statement: parser first, then rules, cache and the matching LLM agent.
+        The statement is parsed exactly once; its ParseResult (AST, tokens, errors) is shared by every later stage.
+        The statement's verdict is stored in outcome["verdict"]. When the statement is part of a
+        script, its status events are labelled with its position. start_line and start_column
+        locate the statement in the input, so template summaries give positions in the input.
+        """
+        label = ""
+        parser_metadata = {"stage": "parser"}
+        if statement is not None:
+            label = f"[Statement {statement.index + 1}, lines {statement.start_line}-{statement.end_line}] "
+            parser_metadata["statement_index"] = statement.index
+        with self._span(PARSE):
+            parsed = parse_sql(sql_query, tokens=tokens or None)
+        output = parsed.as_dict()
         yield Event(
             author=self.name,
             content=types.Content(
             role="assistant",
-            parts=[types.Part(text=f"Tool Validation Result:\n```json\n{json.dumps(output, indent=2)}\n```")]
+            parts=[types.Part(text=f"{label}Tool Validation Result:\n```json\n{json.dumps(output, indent=2)}\n```")]
         ),
-            partial=True)
+            partial=True,
+            custom_metadata={**parser_metadata, "parser_result": output})
         ctx.session.state["sql_to_validate"] = sql_query
 
-        if output["valid"] and output["valid"] is True:
+        # valid is None when sqlglot failed internally; the model validator decides those statements
+        if parsed.valid is not False:
             ctx.session.state["error"] = ""
             ctx.session.state["model_agent_result"] = "" 
+            status = "valid according to tool" if parsed.valid else "not decidable by the tool"
             yield Event(
                 author=self.name,
                 content=types.Content(
                     role="assistant",
-                    parts=[types.Part(text="SQL syntax is valid according to tool. Proceeding with model validation...")]
+                    parts=[types.Part(text=f"{label}SQL syntax is {status}. Proceeding with model validation...")]
                 ),
                 partial=True
             ) 
-            async for event in self.model_validator_agent.run_async(ctx):
-                yield event
+            expression = parsed.expression
+            with self._span(ROUTE):
+                statement_class = classify_statement(expression) if expression is not None else GENERAL
+                validator_agent = self.model_validator_agents.get(statement_class, self.model_validator_agent)
+            rule_verdict = None
+            if self.rule_engine is not None and expression is not None:
+                with self._span(RULES):
+                    rule_verdict = self.rule_engine.evaluate(expression, parsed.tokens)
+            if rule_verdict is not None:
+                outcome["verdict"] = rule_verdict
+                self._count_tier(TIER_RULES)
+                yield verdict_event(self.name, rule_verdict, output_key=validator_agent.output_key)
+            else:
+                model = None
+                if self.model_tiering is not None and expression is not None:
+                    with self._span(TIERING):
+                        _, model = self.model_tiering.route(expression)
+                model_ctx, compacted = self._model_context(ctx, parsed)
+                async for event in self._run_with_cache(model_ctx, validator_agent, parsed, outcome, model, compacted):
+                    yield event
         else:            
             ctx.session.state["error"] = output["message"]
             ctx.session.state["model_agent_result"] = ""
@@ -70,18 +282,305 @@ class CoordinatorAgent(BaseAgent):
                 author=self.name,
                 content=types.Content(
                     role="assistant",
-                    parts=[types.Part(text="SQL syntax is invalid according to tool. Proceeding with error interpretion")]
+                    parts=[types.Part(text=f"{label}SQL syntax is invalid according to tool. Proceeding with error interpretion")]
                 ),
                 partial=True
             )
-            print("State after error:", ctx.session.state)
-            async for event in self.error_intepreter_agent.run_async(ctx):
+            logger.debug("Parser error: %s", output["message"])
+            template_verdict = None
+            if self.use_error_templates:
+                template_verdict = interpret_syntax_error(sql_query, parsed.errors, start_line, start_column)
+            if template_verdict is not None:
+                outcome["verdict"] = template_verdict
+                self._count_tier(TIER_TEMPLATE)
+                yield verdict_event(self.name, template_verdict, output_key=self.error_intepreter_agent.output_key)
+            else:
+                async for event in self._run_with_cache(ctx, self.error_intepreter_agent, parsed, outcome):
+                    yield event
+
+    async def _validate_script(self, ctx: InvocationContext, statements: List[Statement]) -> AsyncGenerator[Event, None]:
+        """
+        Validates every statement of a script concurrently and finishes with one combined verdict
+        listing a verdict per statement with its line range.
+        """
+        outcomes = [{} for _ in statements]
+
+        async def run(statement: Statement, outcome: dict) -> AsyncGenerator[Event, None]:
+            try:
+                async for event in self._validate_statement(self._scoped_context(ctx, statement.sql), statement.sql, outcome,
+                                                            statement, statement.tokens, statement.start_line,
+                                                            statement.start_column):
+                    yield event
+            except Exception as e:
+                outcome["verdict"] = {"isValidSQL": None, "summary": f"Validation failed: {e}"}
+            # Report each statement as soon as it is settled, before the combined verdict
+            result = statement_result(statement, outcome.get("verdict"))
+            yield Event(
+                author=self.name,
+                content=types.Content(
+                    role="assistant",
+                    parts=[types.Part(text=f"Statement {statement.index + 1} verdict:\n```json\n{json.dumps(result)}\n```")]
+                ),
+                partial=True,
+                custom_metadata={"stage": "statement", "statement": result},
+            )
+
+        streams = [run(statement, outcome) for statement, outcome in zip(statements, outcomes)]
+        async for event in _merge_event_streams(streams, self.statement_concurrency):
+            yield event
+
+        verdict = script_verdict([statement_result(statement, outcome.get("verdict"))
+                                  for statement, outcome in zip(statements, outcomes)])
+        yield Event(
+            author=self.name,
+            content=types.Content(
+                role="model",
+                parts=[types.Part(text=json.dumps(verdict))]
+            ),
+        )
+
+    def _scoped_context(self, ctx: InvocationContext, sql: str) -> InvocationContext:
+        """
+        Returns a copy of the invocation context scoped to one statement.
+        The copy has a private session state and a history holding only the given SQL,
+        so concurrently validated statements neither overwrite each other's state nor see each other's SQL.
+        """
+        user_content = types.Content(role="user", parts=[types.Part(text=sql)])
+        session = ctx.session.model_copy(update={
+            "state": {key: ctx.session.state[key] for key in _INHERITED_STATE_KEYS if key in ctx.session.state},
+            "events": [Event(author="user", content=user_content, invocation_id=ctx.invocation_id)],
+        })
+        return ctx.model_copy(update={"session": session, "user_content": user_content})
+
+    def _model_context(self, ctx: InvocationContext, parsed: ParseResult) -> Tuple[InvocationContext, Optional[CompactedSql]]:
+        """
+        Returns the context the model validator runs in: ctx itself, or a scoped copy whose
+        history holds the statement with its long literal lists compacted, along with the compaction.
+        """
+        if self.literal_list_limit is None:
+            return ctx, None
+        compacted = compact_literals(parsed, max_items=self.literal_list_limit)
+        if compacted is None:
+            return ctx, None
+        logger.debug("Compacted %d literal lists: %d -> %d characters",
+                     len(compacted.elisions), compacted.original_chars, len(compacted.sql))
+        model_ctx = self._scoped_context(ctx, compacted.sql)
+        model_ctx.session.state["sql_to_validate"] = compacted.sql
+        return model_ctx, compacted
+
+    async def _run_with_cache(self, ctx: InvocationContext, agent: LlmAgent, parsed: ParseResult, outcome: dict,
+                              model: Optional[str] = None,
+                              compacted: Optional[CompactedSql] = None) -> AsyncGenerator[Event, None]:
+        """
+        Runs the given sub-agent unless the verdict cache already holds its answer for this query,
+        or an identical query is already being validated by the same agent, in which case its verdict is awaited.
+        The sub-agent's final verdict is stored in outcome["verdict"] and, on a cache miss, in the cache and store.
+        A model picked by model tiering replaces the agent's model for this call and in the cache key,
+        and so does the request's latency profile for the generation settings.
+        compacted is the literal compaction the agent sees the statement with, if any.
+        """
+        if model:
+            ctx.session.state[MODEL_STATE_KEY] = model
+        profile_name = ctx.session.state.get(REQUEST_STATE_KEY) or self.latency_profile
+        profile = get_latency_profile(profile_name) if profile_name else None
+        if profile is not None:
+            ctx.session.state[PROFILE_STATE_KEY] = profile.name
+        key = None
+        if self.verdict_cache is not None or self.verdict_store is not None or self.single_flight is not None:
+            canonical = parsed.canonical
+            if self.fingerprint_cache and parsed.expression is not None:
+                canonical = f"fingerprint:{query_fingerprint(parsed.expression)}"
+            key = verdict_cache_key(parsed.sql, model or _model_name(agent), _instruction_text(agent),
+                                    _generation_config_text(agent, profile), canonical=canonical)
+        while True:
+            with self._span(CACHE_LOOKUP):
+                cached = await self._cached_verdict(key)
+            if cached is not None:
+                outcome["verdict"] = cached
+                yield verdict_event(self.name, cached, output_key=agent.output_key)
+                return
+            if self.single_flight is None:
+                break
+            in_flight = self.single_flight.follow(key)
+            if in_flight is None:
+                break
+            try:
+                # Shielded so a cancelled follower doesn't cancel the leader's result for everyone else
+                shared = await self._before_deadline(ctx, asyncio.shield(in_flight))
+            except asyncio.TimeoutError:
+                async for event in self._parser_only(agent, parsed, outcome, _DEADLINE_EXCEEDED):
+                    yield event
+                return
+            if shared is not None:
+                outcome["verdict"] = shared
+                self._count_tier(TIER_SINGLE_FLIGHT)
+                yield verdict_event(self.name, shared, output_key=agent.output_key)
+                return
+            # The leader ended without a verdict; check again and run the agent if nobody else took over
+
+        reason = self._skip_model_reason(ctx)
+        if reason is not None:
+            async for event in self._parser_only(agent, parsed, outcome, reason):
+                yield event
+            return
+        if self.single_flight is None:
+            async for event in self._run_agent(ctx, agent, parsed, key, outcome, compacted):
+                yield event
+            return
+        with self.single_flight.lead(key) as flight:
+            async for event in self._run_agent(ctx, agent, parsed, key, outcome, compacted):
                 yield event
+            verdict = outcome.get("verdict", {})
+            if verdict.get("isValidSQL") is not None and verdict.get("tier") != PARSER_ONLY:
+                flight.set_result(verdict)
+
+    async def _run_agent(self, ctx: InvocationContext, agent: LlmAgent, parsed: ParseResult, key: Optional[str],
+                         outcome: dict, compacted: Optional[CompactedSql] = None) -> AsyncGenerator[Event, None]:
+        """
+        Runs the sub-agent, stores its verdict in outcome["verdict"] and caches it under key.
+        If the sub-agent fails or the request's deadline passes first, the statement gets a parser-only verdict.
+        The recorded model stage time excludes the time its events spend being emitted.
+        For a compacted statement the final event lists the elided lists and reports positions
+        in the submitted statement (see _with_original_positions).
+        """
+        is_interpreter = agent is self.error_intepreter_agent
+        verdict = None
+        final_text = None
+        failure = None
+        model_seconds = 0.0
+        started = time.perf_counter()
+        try:
+            async for event in self._agent_events(ctx, agent):
+                model_seconds += time.perf_counter() - started
+                started = None
+                if event.author == agent.name and event.is_final_response() and event.content and event.content.parts:
+                    if compacted is not None:
+                        event = _with_original_positions(event, compacted)
+                    final_text = event.content.parts[0].text
+                    verdict = parse_verdict(final_text) or verdict
+                yield event
+                started = time.perf_counter()
+        except _DeadlineExceeded:
+            failure = _DEADLINE_EXCEEDED
+        except Exception:
+            logger.warning("%s failed; falling back to the parser result", agent.name, exc_info=True)
+            failure = _MODEL_FAILURE
+        finally:
+            # Failed calls are timed too, so their time isn't attributed to the coordinator
+            if started is not None:
+                model_seconds += time.perf_counter() - started
+            self._observe(ERROR_INTERPRETER if is_interpreter else MODEL_VALIDATOR, model_seconds)
+        # A missed deadline says more about the request's budget than about the model's health
+        if self.circuit_breaker is not None and failure != _DEADLINE_EXCEEDED:
+            if failure is None:
+                self.circuit_breaker.record_success()
+            else:
+                self.circuit_breaker.record_failure()
+        if failure is not None:
+            async for event in self._parser_only(agent, parsed, outcome, failure):
+                yield event
+            return
+        self._count_tier(TIER_ERROR_INTERPRETER if is_interpreter else TIER_MODEL)
+        if verdict is not None:
+            outcome["verdict"] = verdict
+            await self._store_verdict(key, verdict)
+        else:
+            outcome["verdict"] = {"isValidSQL": None, "summary": final_text or "No final response captured."}
+
+    async def _agent_events(self, ctx: InvocationContext, agent: LlmAgent) -> AsyncGenerator[Event, None]:
+        """
+        Runs the sub-agent and yields its events. With a request deadline the agent runs in its own
+        task, which is cancelled, raising _DeadlineExceeded, if the deadline passes before it finishes.
+        """
+        deadline = ctx.session.state.get(_DEADLINE_STATE_KEY)
+        if deadline is None:
+            async for event in agent.run_async(ctx):
+                yield event
+            return
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+        finished = object()
+
+        async def pump() -> None:
+            try:
+                async for event in agent.run_async(ctx):
+                    queue.put_nowait(event)
+            finally:
+                queue.put_nowait(finished)
+
+        task = asyncio.ensure_future(pump())
+        try:
+            while True:
+                try:
+                    item = await asyncio.wait_for(queue.get(), max(0.0, deadline - loop.time()))
+                except asyncio.TimeoutError:
+                    raise _DeadlineExceeded() from None
+                if item is finished:
+                    break
+                yield item
+            task.result()
+        finally:
+            task.cancel()
+
+    async def _before_deadline(self, ctx: InvocationContext, awaitable):
+        """Awaits awaitable, raising asyncio.TimeoutError if the request's deadline passes first."""
+        deadline = ctx.session.state.get(_DEADLINE_STATE_KEY)
+        if deadline is None:
+            return await awaitable
+        return await asyncio.wait_for(awaitable, max(0.0, deadline - asyncio.get_running_loop().time()))
+
+    def _skip_model_reason(self, ctx: InvocationContext) -> Optional[str]:
+        """Why the model must not be called for this statement now, or None if it may be."""
+        deadline = ctx.session.state.get(_DEADLINE_STATE_KEY)
+        if deadline is not None and asyncio.get_running_loop().time() >= deadline:
+            return _DEADLINE_EXCEEDED
+        if self.circuit_breaker is not None and not self.circuit_breaker.allow():
+            return _CIRCUIT_OPEN
+        return None
+
+    async def _parser_only(self, agent: LlmAgent, parsed: ParseResult, outcome: dict, reason: str) -> AsyncGenerator[Event, None]:
+        """Settles the statement with the parser's own result, marked as a parser-only verdict."""
+        logger.info("Returning the parser-only verdict: %s", reason)
+        verdict = parser_only_verdict(parsed.as_dict(), reason)
+        outcome["verdict"] = verdict
+        self._count_tier(TIER_PARSER_ONLY)
+        yield verdict_event(self.name, verdict, output_key=agent.output_key)
+
+    async def _cached_verdict(self, key: Optional[str]) -> Optional[dict]:
+        """Looks key up in the verdict cache, then in the persistent store, warming the cache on a store hit."""
+        if key is None:
+            return None
+        if self.verdict_cache is not None:
+            cached = self.verdict_cache.get(key)
+            if cached is not None:
+                self._count_tier(TIER_VERDICT_CACHE)
+                return cached
+        if self.verdict_store is None:
+            return None
+        stored = await asyncio.to_thread(self.verdict_store.get, key)
+        if stored is not None:
+            self._count_tier(TIER_VERDICT_STORE)
+            if self.verdict_cache is not None:
+                self.verdict_cache.put(key, stored)
+        return stored
+
+    async def _store_verdict(self, key: Optional[str], verdict: dict) -> None:
+        """Saves a model verdict in the verdict cache and the persistent store."""
+        if key is None:
+            return
+        if self.verdict_cache is not None:
+            self.verdict_cache.put(key, verdict)
+        if self.verdict_store is not None:
+            await asyncio.to_thread(self.verdict_store.put, key, verdict)
+
+    def _span(self, stage: str):
+        """Times a block as one observation of stage, if metrics are enabled."""
+        return self.metrics.span(stage) if self.metrics is not None else nullcontext()
+
+    def _observe(self, stage: str, seconds: float) -> None:
+        if self.metrics is not None:
+            self.metrics.observe(stage, seconds)
 
-         # After tool_validator_agent finishes, clear its specific state if needed
-        if "error" in ctx.session.state:
-            del ctx.session.state["error"]
-        if "sql_to_validate" in ctx.session.state:
-            del ctx.session.state["sql_to_validate"] # Clear once it's been handled
-        if "model_agent_result" in ctx.session.state:
-            del ctx.session.state["model_agent_result"]
\ No newline at end of file
+    def _count_tier(self, tier: str) -> None:
+        if self.metrics is not None:
+            self.metrics.count_tier(tier)
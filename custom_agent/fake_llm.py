@@ -0,0 +1,204 @@
+import asyncio
+import json
+import math
+import random
+import time
+from pathlib import Path
+from typing import AsyncGenerator, Callable, Dict, Optional
+
+from google.adk.models.base_llm import BaseLlm
+from google.adk.models.llm_request import LlmRequest
+from google.adk.models.llm_response import LlmResponse
+from google.genai import errors, types
+from pydantic import Field, PrivateAttr
+
+from ..requirements.error_interpreter import ERROR_INTERPRETER_PROMPT
+from .verdict_cache import prompt_hash
+
+VALID_VERDICT = {"isValidSQL": True, "summary": "Query is syntactically valid Spark SQL."}
+# Default answer to the error interpreter, which only sees statements the parser rejected
+INVALID_VERDICT = {"isValidSQL": False, "summary": "Query has a Spark SQL syntax error."}
+# First line of the error interpreter's instruction, which identifies its requests
+_ERROR_INTERPRETER_HEADING = ERROR_INTERPRETER_PROMPT.strip().splitlines()[0]
+
+
+def request_text(llm_request: LlmRequest) -> str:
+    """Concatenate the text of every content part of a model request."""
+    texts = []
+    for content in llm_request.contents or []:
+        for part in content.parts or []:
+            if part.text:
+                texts.append(part.text)
+    return "\n".join(texts)
+
+
+def request_key(llm_request: LlmRequest) -> str:
+    """
+    Identify a model request by a hash of its instruction (or cached-content handle)
+    and its contents, for recording and replaying responses.
+    """
+    config = llm_request.config
+    instruction = ""
+    if config is not None:
+        instruction = str(config.system_instruction or config.cached_content or "")
+    return prompt_hash(f"{instruction}\x1f{request_text(llm_request)}")
+
+
+def is_error_interpreter_request(llm_request: LlmRequest) -> bool:
+    """Whether the request carries the error interpreter's instruction rather than a validator's."""
+    config = llm_request.config
+    instruction = config.system_instruction if config is not None else None
+    return isinstance(instruction, str) and instruction.lstrip().startswith(_ERROR_INTERPRETER_HEADING)
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (about four characters per token) used for offline usage metadata."""
+    return max(1, len(text) // 4) if text else 0
+
+
+def response_for(text: str, llm_request: LlmRequest) -> LlmResponse:
+    """Wrap a response text in an LlmResponse with estimated usage metadata."""
+    instruction = llm_request.config.system_instruction if llm_request.config else None
+    prompt_tokens = estimate_tokens(str(instruction or "")) + estimate_tokens(request_text(llm_request))
+    return LlmResponse(
+        content=types.Content(role="model", parts=[types.Part(text=text)]),
+        usage_metadata=types.GenerateContentResponseUsageMetadata(
+            prompt_token_count=prompt_tokens,
+            candidates_token_count=estimate_tokens(text),
+            total_token_count=prompt_tokens + estimate_tokens(text),
+        ),
+    )
+
+
+def load_recordings(path: Path) -> Dict[str, str]:
+    """Read recorded responses (request key -> response text) from a JSON file."""
+    with open(path, encoding="utf-8") as recordings:
+        return json.load(recordings)
+
+
+def save_recordings(path: Path, recordings: Dict[str, str]) -> None:
+    with open(path, "w", encoding="utf-8") as output:
+        json.dump(recordings, output, indent=2, sort_keys=True)
+
+
+# --- Latency distributions: functions returning the delay of one call in seconds ---
+
+def fixed_latency(seconds: float) -> Callable[[random.Random], float]:
+    return lambda rng: seconds
+
+
+def uniform_latency(low: float, high: float) -> Callable[[random.Random], float]:
+    return lambda rng: rng.uniform(low, high)
+
+
+def lognormal_latency(median: float, sigma: float = 0.5) -> Callable[[random.Random], float]:
+    """Right-skewed latency around median, the usual shape of model response times."""
+    mu = math.log(median)
+    return lambda rng: rng.lognormvariate(mu, sigma)
+
+
+def rate_limit_error() -> errors.ClientError:
+    return errors.ClientError(429, {"error": {"code": 429, "message": "Resource exhausted (simulated).",
+                                              "status": "RESOURCE_EXHAUSTED"}})
+
+
+def server_error() -> errors.ServerError:
+    return errors.ServerError(503, {"error": {"code": 503, "message": "Service unavailable (simulated).",
+                                              "status": "UNAVAILABLE"}})
+
+
+class FakeLlm(BaseLlm):
+    """
+    Offline model backend that answers every request with a fixed verdict: valid for
+    the validators and invalid for the error interpreter, which is only called for
+    statements the parser rejected.
+
+    Use it in place of the `model=` string of the LlmAgents (see agent.use_model_backend)
+    to run the coordinator, the HTTP service or benchmarks without network access
+    or model quota. It can replay recorded responses, sample its latency from a
+    distribution, fail a share of calls and enforce a requests-per-second limit
+    the way the real API does (HTTP 429).
+    """
+
+    model: str = "fake-llm"
+    # Seconds to wait before answering, to mimic model latency
+    latency_seconds: float = 0.0
+    # Optional latency distribution; overrides latency_seconds when set
+    latency: Optional[Callable[[random.Random], float]] = None
+    # Optional function computing the response text from the request
+    responder: Optional[Callable[[LlmRequest], str]] = None
+    # Recorded responses keyed by request_key, replayed before responder is consulted
+    recordings: Dict[str, str] = Field(default_factory=dict)
+    # Share of calls that fail with a simulated 503
+    error_rate: float = 0.0
+    # Calls per second accepted before failing with a simulated 429; None for no limit
+    rate_limit_per_second: Optional[float] = None
+    seed: Optional[int] = None
+    calls: int = 0
+    replayed: int = 0
+    failures: int = 0
+    rate_limited: int = 0
+
+    _rng: random.Random = PrivateAttr(default=None)
+    _window_start: float = PrivateAttr(default=0.0)
+    _window_calls: int = PrivateAttr(default=0)
+
+    def model_post_init(self, __context) -> None:
+        self._rng = random.Random(self.seed)
+
+    def _over_rate_limit(self) -> bool:
+        if self.rate_limit_per_second is None:
+            return False
+        now = time.monotonic()
+        if now - self._window_start >= 1.0:
+            self._window_start = now
+            self._window_calls = 0
+        self._window_calls += 1
+        return self._window_calls > self.rate_limit_per_second
+
+    async def generate_content_async(self, llm_request: LlmRequest, stream: bool = False) -> AsyncGenerator[LlmResponse, None]:
+        self.calls += 1
+        if self._over_rate_limit():
+            self.rate_limited += 1
+            raise rate_limit_error()
+        delay = self.latency(self._rng) if self.latency is not None else self.latency_seconds
+        if delay:
+            await asyncio.sleep(delay)
+        if self.error_rate and self._rng.random() < self.error_rate:
+            self.failures += 1
+            raise server_error()
+        text = self.recordings.get(request_key(llm_request)) if self.recordings else None
+        if text is not None:
+            self.replayed += 1
+        elif self.responder is not None:
+            text = self.responder(llm_request)
+        elif is_error_interpreter_request(llm_request):
+            text = json.dumps(INVALID_VERDICT)
+        else:
+            text = json.dumps(VALID_VERDICT)
+        yield response_for(text, llm_request)
+
+
+class RecordingLlm(BaseLlm):
+    """
+    Passes requests through to a real model and records each final response text
+    under its request_key, so a FakeLlm can later replay the session offline.
+    """
+
+    inner: BaseLlm
+    # Defaults to the wrapped model's name
+    model: str = ""
+    recordings: Dict[str, str] = Field(default_factory=dict)
+
+    def model_post_init(self, __context) -> None:
+        if not self.model:
+            self.model = self.inner.model
+
+    async def generate_content_async(self, llm_request: LlmRequest, stream: bool = False) -> AsyncGenerator[LlmResponse, None]:
+        texts = []
+        async for response in self.inner.generate_content_async(llm_request, stream=stream):
+            if not response.partial and response.content and response.content.parts:
+                texts.extend(part.text for part in response.content.parts if part.text)
+            yield response
+        if texts:
+            self.recordings[request_key(llm_request)] = "".join(texts)
@@ -0,0 +1,143 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import AsyncGenerator, Deque, List, Optional
+
+from google.adk.models.base_llm import BaseLlm
+from google.adk.models.llm_request import LlmRequest
+from google.adk.models.llm_response import LlmResponse
+from pydantic import PrivateAttr
+
+from .metrics import quantile
+from .verdict import parse_verdict
+
+logger = logging.getLogger(__name__)
+
+
+def _response_text(responses: List[LlmResponse]) -> str:
+    texts = []
+    for response in responses:
+        if not response.partial and response.content and response.content.parts:
+            texts.extend(part.text for part in response.content.parts if part.text)
+    return "".join(texts)
+
+
+class HedgedLlm(BaseLlm):
+    """
+    Cuts tail latency by hedging slow model calls.
+
+    If a call hasn't answered after the `hedge_quantile` latency of recent calls, an
+    identical second request is sent. The first response holding a well-formed verdict
+    wins and the other request is cancelled. Hedges are paid for from a budget that
+    grows by `max_extra_ratio` per call (capped at `max_burst`), so hedging never
+    adds more than that share of extra model calls. Streaming calls are passed
+    through unhedged.
+    """
+
+    inner: BaseLlm
+    # Defaults to the wrapped model's name
+    model: str = ""
+    # Latency quantile of recent calls after which a call is hedged
+    hedge_quantile: float = 0.95
+    # Hedge delay until min_samples calls have been timed
+    initial_delay_seconds: float = 2.0
+    min_samples: int = 20
+    # Lower bound of the hedge delay, so fast bursts don't hedge every call
+    min_delay_seconds: float = 0.05
+    # Extra calls hedging may add, as a share of all calls
+    max_extra_ratio: float = 0.1
+    # Unused hedge budget kept for later, in calls
+    max_burst: float = 10.0
+    # Recent call latencies kept for the quantile
+    window: int = 512
+    calls: int = 0
+    hedges_fired: int = 0
+    hedges_won: int = 0
+    # Calls slow enough to hedge that weren't, because the budget was spent
+    hedges_skipped: int = 0
+
+    _latencies: Deque[float] = PrivateAttr(default=None)
+    _budget: float = PrivateAttr(default=0.0)
+
+    def model_post_init(self, __context) -> None:
+        if not self.model:
+            self.model = self.inner.model
+        self._latencies = deque(maxlen=self.window)
+
+    def hedge_delay(self) -> float:
+        """Seconds to wait for a call before hedging it."""
+        if len(self._latencies) < self.min_samples:
+            return self.initial_delay_seconds
+        return max(self.min_delay_seconds, quantile(self._latencies, self.hedge_quantile))
+
+    async def _attempt(self, llm_request: LlmRequest) -> List[LlmResponse]:
+        started = time.perf_counter()
+        try:
+            responses = [response async for response in self.inner.generate_content_async(llm_request)]
+        except asyncio.CancelledError:
+            # A slow attempt cancelled after the other one won would have taken at least this long.
+            # Leaving it out would bias the quantile low and hedge more and more calls.
+            self._latencies.append(time.perf_counter() - started)
+            raise
+        self._latencies.append(time.perf_counter() - started)
+        return responses
+
+    def _take_budget(self) -> bool:
+        if self._budget < 1.0:
+            self.hedges_skipped += 1
+            return False
+        self._budget -= 1.0
+        return True
+
+    async def generate_content_async(self, llm_request: LlmRequest, stream: bool = False) -> AsyncGenerator[LlmResponse, None]:
+        if stream:
+            async for response in self.inner.generate_content_async(llm_request, stream=True):
+                yield response
+            return
+        self.calls += 1
+        self._budget = min(self.max_burst, self._budget + self.max_extra_ratio)
+        # The hedge gets its own copy: backends may rewrite the request they are given
+        hedge_request = llm_request.model_copy(deep=True)
+        primary = asyncio.ensure_future(self._attempt(llm_request))
+        attempts = [primary]
+        try:
+            delay = self.hedge_delay()
+            done, _ = await asyncio.wait(attempts, timeout=delay)
+            if not done and self._take_budget():
+                self.hedges_fired += 1
+                logger.debug("Model call still running after %.3fs; sending a hedge", delay)
+                attempts.append(asyncio.ensure_future(self._attempt(hedge_request)))
+            winner = await self._first_verdict(attempts)
+            if winner is not None and winner is not primary:
+                self.hedges_won += 1
+            # Without a verdict from any attempt, the primary's outcome (error or unusable text) stands
+            responses = (winner or primary).result()
+        finally:
+            for attempt in attempts:
+                if attempt.done() and not attempt.cancelled():
+                    # Mark a losing attempt's error as seen
+                    attempt.exception()
+                attempt.cancel()
+        for response in responses:
+            yield response
+
+    @staticmethod
+    async def _first_verdict(attempts: List[asyncio.Future]) -> Optional[asyncio.Future]:
+        """Wait for the first attempt whose response is a well-formed verdict; None if none of them gives one."""
+        pending = set(attempts)
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for attempt in attempts:
+                if attempt in done and not attempt.exception() and parse_verdict(_response_text(attempt.result())):
+                    return attempt
+        return None
+
+    def stats(self) -> dict:
+        return {
+            "calls": self.calls,
+            "hedges_fired": self.hedges_fired,
+            "hedges_won": self.hedges_won,
+            "hedges_skipped": self.hedges_skipped,
+            "hedge_delay_seconds": self.hedge_delay(),
+        }
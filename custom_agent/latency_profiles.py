@@ -0,0 +1,97 @@
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from google.adk.agents.callback_context import CallbackContext
+    from google.adk.models.llm_request import LlmRequest
+    from google.genai import types
+
+FAST = "fast"
+BALANCED = "balanced"
+THOROUGH = "thorough"
+
+# Session state key a caller sets to pick the profile of one validation
+REQUEST_STATE_KEY = "latency_profile"
+# Session state key holding the profile the coordinator resolved for the model call in progress
+PROFILE_STATE_KEY = "generation_profile"
+
+
+@lru_cache(maxsize=None)
+def verdict_schema() -> "types.Schema":
+    """The only response either agent may give: {"isValidSQL": bool, "summary": str}."""
+    # Imported on first use: profile names and lookups don't need the Google SDKs
+    from google.genai import types
+    return types.Schema(
+        type=types.Type.OBJECT,
+        properties={
+            "isValidSQL": types.Schema(type=types.Type.BOOLEAN),
+            "summary": types.Schema(type=types.Type.STRING),
+        },
+        required=["isValidSQL", "summary"],
+        property_ordering=["isValidSQL", "summary"],
+    )
+
+
+# Models that don't think; they reject a thinking config
+_NON_THINKING_MODEL_PREFIXES = ("gemini-1.", "gemini-2.0")
+# Models that can't turn thinking off, with the smallest budget they accept
+_MIN_THINKING_BUDGETS = {"gemini-2.5-pro": 128}
+
+
+@dataclass(frozen=True)
+class LatencyProfile:
+    """Generation limits trading answer latency against how long the model may reason."""
+
+    name: str
+    # Tokens the model may spend thinking before it answers; 0 turns thinking off
+    thinking_budget: int
+    # Cap on generated tokens, thinking included
+    max_output_tokens: int
+
+    def generation_config(self, base: Optional["types.GenerateContentConfig"] = None,
+                          model: str = "") -> "types.GenerateContentConfig":
+        """
+        Return a copy of base with this profile's thinking budget, token cap and the
+        strict verdict schema applied. The thinking budget is raised to the minimum
+        of models that always think and left out for models that never do.
+        """
+        from google.genai import types
+        config = base.model_copy(deep=True) if base is not None else types.GenerateContentConfig()
+        config.max_output_tokens = self.max_output_tokens
+        config.response_mime_type = "application/json"
+        config.response_schema = verdict_schema()
+        if not model.startswith(_NON_THINKING_MODEL_PREFIXES):
+            budget = self.thinking_budget
+            for prefix, minimum in _MIN_THINKING_BUDGETS.items():
+                if model.startswith(prefix):
+                    budget = max(budget, minimum)
+            config.thinking_config = types.ThinkingConfig(thinking_budget=budget)
+        return config
+
+
+PROFILES = {
+    # No thinking, room for the two-field verdict only
+    FAST: LatencyProfile(FAST, thinking_budget=0, max_output_tokens=256),
+    BALANCED: LatencyProfile(BALANCED, thinking_budget=512, max_output_tokens=1024),
+    THOROUGH: LatencyProfile(THOROUGH, thinking_budget=4096, max_output_tokens=8192),
+}
+
+
+def get_latency_profile(name: str) -> LatencyProfile:
+    """Look a profile up by name, raising ValueError for unknown names."""
+    try:
+        return PROFILES[name]
+    except KeyError:
+        raise ValueError(f"Unknown latency profile '{name}'; expected one of {', '.join(PROFILES)}") from None
+
+
+def apply_latency_profile(callback_context: "CallbackContext", llm_request: "LlmRequest"):
+    """
+    before_model_callback applying the profile the coordinator picked for this call.
+    Install it after any callback that changes the request's model (model tiering).
+    """
+    name = callback_context.state.get(PROFILE_STATE_KEY)
+    if name:
+        llm_request.config = get_latency_profile(name).generation_config(llm_request.config, llm_request.model or "")
+    return None
@@ -0,0 +1,208 @@
+import math
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Callable, Deque, Dict, Iterator, List, Optional, Sequence, Tuple
+
+# Upper bounds, in seconds, of the latency histogram buckets
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+QUANTILES = (0.5, 0.95, 0.99)
+
+# Pipeline stages timed by the coordinator
+PARSE = "parse"
+ROUTE = "route"
+# Picking the validator model by statement complexity (model tiering)
+TIERING = "tiering"
+RULES = "rules"
+CACHE_LOOKUP = "cache_lookup"
+MODEL_VALIDATOR = "model_validator"
+ERROR_INTERPRETER = "error_interpreter"
+EMIT = "emit"
+REQUEST = "request"
+
+# Tiers that can produce a statement's verdict
+TIER_VERDICT_CACHE = "verdict_cache"
+TIER_VERDICT_STORE = "verdict_store"
+TIER_SINGLE_FLIGHT = "single_flight"
+TIER_RULES = "rules"
+TIER_TEMPLATE = "template"
+TIER_MODEL = "model"
+TIER_ERROR_INTERPRETER = "error_interpreter"
+TIER_PARSER_ONLY = "parser_only"
+
+
+def quantile(values: Sequence[float], q: float) -> Optional[float]:
+    """Nearest-rank quantile of values, or None if there are none."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, math.ceil(q * len(ordered)) - 1))]
+
+
+def process_memory() -> dict:
+    """Resident set size of this process now and at its peak, in bytes (None where the platform can't tell)."""
+    rss = peak = None
+    try:
+        with open("/proc/self/statm") as statm:
+            rss = int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        import resource
+        # ru_maxrss is in kilobytes on Linux
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+    except ImportError:
+        pass
+    return {"rss_bytes": rss, "peak_rss_bytes": peak}
+
+
+class Histogram:
+    """
+    Latency histogram with fixed cumulative buckets for export, plus a window of
+    the most recent samples for p50/p95/p99.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS, window: int = 2048):
+        self.buckets = tuple(buckets)
+        self.bucket_counts = [0] * len(self.buckets)
+        self.count = 0
+        self.sum = 0.0
+        self._recent: Deque[float] = deque(maxlen=window)
+
+    def observe(self, seconds: float) -> None:
+        self.count += 1
+        self.sum += seconds
+        self._recent.append(seconds)
+        for i, bound in enumerate(self.buckets):
+            if seconds <= bound:
+                self.bucket_counts[i] += 1
+                break
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Nearest-rank quantile of the recent samples, or None before the first observation."""
+        return quantile(self._recent, q)
+
+    def cumulative_buckets(self) -> List[Tuple[str, int]]:
+        """(le, cumulative count) pairs in Prometheus order, ending with +Inf."""
+        pairs = []
+        running = 0
+        for bound, count in zip(self.buckets, self.bucket_counts):
+            running += count
+            pairs.append((repr(bound), running))
+        pairs.append(("+Inf", self.count))
+        return pairs
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+class Metrics:
+    """
+    In-process registry of per-stage latency histograms and verdict tier counters.
+
+    `span(stage)` times a block, `observe(stage, seconds)` records a measured
+    duration and `count_tier(tier)` counts which tier answered a statement.
+    `register_gauge` adds a value read at export time, such as memory usage.
+    Export with `prometheus_text()` or read `snapshot()` for p50/p95/p99.
+    After `enable_opentelemetry()` every span is also reported as an
+    OpenTelemetry span.
+    """
+
+    def __init__(self, namespace: str = "sql_validator", buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.namespace = namespace
+        self._buckets = tuple(buckets)
+        self._stages: Dict[str, Histogram] = {}
+        self._tiers: Dict[str, int] = {}
+        # Gauge name -> (description, function reading its current value; None when unknown)
+        self._gauges: Dict[str, Tuple[str, Callable[[], Optional[float]]]] = {}
+        self._lock = threading.Lock()
+        self._tracer = None
+
+    def enable_opentelemetry(self, tracer=None) -> None:
+        """Also emit every span through OpenTelemetry (requires the opentelemetry-api package)."""
+        if tracer is None:
+            from opentelemetry import trace
+            tracer = trace.get_tracer(self.namespace)
+        self._tracer = tracer
+
+    def observe(self, stage: str, seconds: float) -> None:
+        with self._lock:
+            histogram = self._stages.get(stage)
+            if histogram is None:
+                histogram = self._stages[stage] = Histogram(self._buckets)
+            histogram.observe(seconds)
+
+    @contextmanager
+    def span(self, stage: str, **attributes) -> Iterator[None]:
+        """Time the enclosed block as one observation of stage."""
+        otel_span = None
+        if self._tracer is not None:
+            otel_span = self._tracer.start_span(f"{self.namespace}.{stage}", attributes=attributes or None)
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(stage, time.perf_counter() - started)
+            if otel_span is not None:
+                otel_span.end()
+
+    def count_tier(self, tier: str) -> None:
+        with self._lock:
+            self._tiers[tier] = self._tiers.get(tier, 0) + 1
+
+    def register_gauge(self, name: str, description: str, read: Callable[[], Optional[float]]) -> None:
+        """Export read() as the gauge `<namespace>_<name>`, replacing any gauge of that name."""
+        self._gauges[name] = (description, read)
+
+    def _gauge_values(self) -> Dict[str, Optional[float]]:
+        return {name: read() for name, (_, read) in self._gauges.items()}
+
+    def snapshot(self) -> dict:
+        """Per-stage count, total and p50/p95/p99 in seconds, verdict counts per tier and gauge values."""
+        gauges = self._gauge_values()
+        with self._lock:
+            stages = {
+                stage: {
+                    "count": histogram.count,
+                    "sum": histogram.sum,
+                    **{f"p{int(q * 100)}": histogram.quantile(q) for q in QUANTILES},
+                }
+                for stage, histogram in self._stages.items()
+            }
+            return {"stages": stages, "tiers": dict(self._tiers), "gauges": gauges}
+
+    def prometheus_text(self) -> str:
+        """Render the histograms and counters in the Prometheus text exposition format."""
+        latency = f"{self.namespace}_stage_duration_seconds"
+        tiers = f"{self.namespace}_verdicts_total"
+        lines = [
+            f"# HELP {latency} Time spent in each validation stage.",
+            f"# TYPE {latency} histogram",
+        ]
+        with self._lock:
+            for stage, histogram in sorted(self._stages.items()):
+                label = f"stage=\"{_escape(stage)}\""
+                for bound, count in histogram.cumulative_buckets():
+                    lines.append(f"{latency}_bucket{{{label},le=\"{bound}\"}} {count}")
+                lines.append(f"{latency}_sum{{{label}}} {histogram.sum}")
+                lines.append(f"{latency}_count{{{label}}} {histogram.count}")
+            lines.append(f"# HELP {tiers} Statement verdicts by the tier that produced them.")
+            lines.append(f"# TYPE {tiers} counter")
+            for tier, count in sorted(self._tiers.items()):
+                lines.append(f"{tiers}{{tier=\"{_escape(tier)}\"}} {count}")
+        for name, value in sorted(self._gauge_values().items()):
+            if value is None:
+                continue
+            gauge = f"{self.namespace}_{name}"
+            lines.append(f"# HELP {gauge} {self._gauges[name][0]}")
+            lines.append(f"# TYPE {gauge} gauge")
+            lines.append(f"{gauge} {value}")
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stages.clear()
+            self._tiers.clear()
@@ -0,0 +1,25 @@
+from typing import List
+
+from google.adk.agents.callback_context import CallbackContext
+from google.adk.models.llm_request import LlmRequest
+from google.genai import types
+
+
+def statement_contents(sql: str, error: str = "") -> List[types.Content]:
+    """The complete conversation of one model call: the statement and, for the error interpreter, its parse error."""
+    text = f"session.state.sql_to_validate:\n{sql}"
+    if error:
+        text += f"\n\nsession.state.error:\n{error}"
+    return [types.Content(role="user", parts=[types.Part(text=text)])]
+
+
+def history_free_contents(callback_context: CallbackContext, llm_request: LlmRequest):
+    """
+    before_model_callback replacing the request's conversation with the statement being validated
+    (and its error), so earlier queries, verdicts and status events of the session never reach the
+    model and the prompt size doesn't depend on how many queries the session has seen.
+    """
+    sql = callback_context.state.get("sql_to_validate")
+    if sql:
+        llm_request.contents = statement_contents(sql, callback_context.state.get("error") or "")
+    return None
@@ -0,0 +1,63 @@
+import logging
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
+
+from sqlglot import exp
+
+from ..tools.complexity import DEFAULT_COMPLEX_AT, DEFAULT_MODERATE_AT, TIERS, complexity_tier, score_query
+
+if TYPE_CHECKING:
+    from google.adk.agents.callback_context import CallbackContext
+    from google.adk.models.llm_request import LlmRequest
+
+logger = logging.getLogger(__name__)
+
+# Session state key holding the model picked for the statement being validated
+MODEL_STATE_KEY = "validator_model"
+
+
+class ModelTierRouter:
+    """
+    Picks the model validator's model from the complexity of the parsed statement.
+
+    Trivial statements go to the cheapest, fastest model and only complex ones to
+    the strongest. The coordinator calls `route` and records the pick in session
+    state under MODEL_STATE_KEY; install `before_model_callback` on the LlmAgents
+    (before any callback that depends on the request's model, such as prompt
+    caching) to apply it to the model request. Tiers without a model keep the
+    agent's own model.
+    """
+
+    def __init__(self, models: Dict[str, str], moderate_at: float = DEFAULT_MODERATE_AT,
+                 complex_at: float = DEFAULT_COMPLEX_AT):
+        unknown = set(models) - set(TIERS)
+        if unknown:
+            raise ValueError(f"Unknown complexity tiers: {', '.join(sorted(unknown))}")
+        if moderate_at > complex_at:
+            raise ValueError("moderate_at must not be greater than complex_at")
+        self.models = dict(models)
+        self.moderate_at = moderate_at
+        self.complex_at = complex_at
+        self.routed = {tier: 0 for tier in TIERS}
+
+    def route(self, expression: exp.Expression) -> Tuple[str, Optional[str]]:
+        """Return the statement's complexity tier and the model configured for it (None for the agent's own)."""
+        complexity = score_query(expression)
+        tier = complexity_tier(complexity, self.moderate_at, self.complex_at)
+        self.routed[tier] += 1
+        logger.debug("Complexity %.2f (%s) routed to %s", complexity.score, tier, self.models.get(tier))
+        return tier, self.models.get(tier)
+
+    def before_model_callback(self, callback_context: "CallbackContext", llm_request: "LlmRequest"):
+        """Send the request to the model the coordinator picked for this statement, if any."""
+        model = callback_context.state.get(MODEL_STATE_KEY)
+        if model:
+            llm_request.model = model
+        return None
+
+    def stats(self) -> dict:
+        return {
+            "models": {tier: self.models.get(tier) for tier in TIERS},
+            "moderate_at": self.moderate_at,
+            "complex_at": self.complex_at,
+            "routed": dict(self.routed),
+        }
@@ -0,0 +1,239 @@
+import asyncio
+import itertools
+import logging
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Tuple
+
+from google.adk.agents.callback_context import CallbackContext
+from google.adk.models.llm_request import LlmRequest
+from google.genai import types
+
+from .verdict_cache import prompt_hash
+
+logger = logging.getLogger(__name__)
+
+
+class CachedContentBackend:
+    """
+    Model backend that stores a static prompt prefix as reusable cached content.
+
+    Implementations return an opaque handle name that is passed as
+    `GenerateContentConfig.cached_content` on later requests.
+    """
+
+    async def create(self, model: str, system_instruction: str, ttl_seconds: float) -> str:
+        raise NotImplementedError
+
+    async def refresh(self, name: str, ttl_seconds: float) -> None:
+        """Extend the lifetime of an existing handle. Raises if the handle no longer exists."""
+        raise NotImplementedError
+
+    async def delete(self, name: str) -> None:
+        raise NotImplementedError
+
+
+class GeminiCachedContentBackend(CachedContentBackend):
+    """Cached content stored through the google-genai `caches` API."""
+
+    def __init__(self, client=None, display_name: str = "sql-validator-prompt"):
+        self._client = client
+        self.display_name = display_name
+
+    @property
+    def client(self):
+        if self._client is None:
+            from google.genai import Client
+            self._client = Client()
+        return self._client
+
+    async def create(self, model: str, system_instruction: str, ttl_seconds: float) -> str:
+        cached = await self.client.aio.caches.create(
+            model=model,
+            config=types.CreateCachedContentConfig(
+                system_instruction=system_instruction,
+                ttl=f"{int(ttl_seconds)}s",
+                display_name=self.display_name,
+            ),
+        )
+        return cached.name
+
+    async def refresh(self, name: str, ttl_seconds: float) -> None:
+        await self.client.aio.caches.update(
+            name=name,
+            config=types.UpdateCachedContentConfig(ttl=f"{int(ttl_seconds)}s"),
+        )
+
+    async def delete(self, name: str) -> None:
+        await self.client.aio.caches.delete(name=name)
+
+
+class InMemoryCachedContentBackend(CachedContentBackend):
+    """Offline stand-in for the cached content API, for tests and local runs."""
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self._clock = clock
+        self._ids = itertools.count(1)
+        # name -> (model, system_instruction, expires_at)
+        self.entries: Dict[str, Tuple[str, str, float]] = {}
+        self.created = 0
+        self.refreshed = 0
+        self.deleted = 0
+
+    async def create(self, model: str, system_instruction: str, ttl_seconds: float) -> str:
+        name = f"cachedContents/local-{next(self._ids)}"
+        self.entries[name] = (model, system_instruction, self._clock() + ttl_seconds)
+        self.created += 1
+        return name
+
+    async def refresh(self, name: str, ttl_seconds: float) -> None:
+        entry = self.entries.get(name)
+        if entry is None or entry[2] <= self._clock():
+            self.entries.pop(name, None)
+            raise KeyError(f"Cached content {name} not found")
+        self.entries[name] = (entry[0], entry[1], self._clock() + ttl_seconds)
+        self.refreshed += 1
+
+    async def delete(self, name: str) -> None:
+        if self.entries.pop(name, None) is not None:
+            self.deleted += 1
+
+    def lookup(self, name: str) -> Optional[str]:
+        """Return the system instruction stored under name, or None if it is unknown or expired."""
+        entry = self.entries.get(name)
+        if entry is None or entry[2] <= self._clock():
+            return None
+        return entry[1]
+
+
+@dataclass
+class _Handle:
+    name: str
+    prompt_hash: str
+    expires_at: float
+
+
+def _instruction_text(instruction) -> str:
+    """Flatten a system instruction (plain string or Content) into its text."""
+    if instruction is None:
+        return ""
+    if isinstance(instruction, str):
+        return instruction
+    if isinstance(instruction, types.Content):
+        return "".join(part.text or "" for part in instruction.parts or [])
+    return str(instruction)
+
+
+class PromptCacheManager:
+    """
+    Registers each agent's static instruction once as cached content and reuses the handle.
+
+    Install `before_model_callback` on the LlmAgents. On every model request it
+    swaps the system instruction for the cached-content handle of that
+    (model, instruction) pair. Handles are refreshed shortly before they expire,
+    and a changed instruction hash replaces the old handle automatically. When
+    creating a handle fails, that instruction is sent inline for
+    failure_backoff_seconds before creating it is tried again.
+    """
+
+    def __init__(self, backend: CachedContentBackend, ttl_seconds: float = 3600.0,
+                 refresh_margin_seconds: float = 60.0, min_prompt_chars: int = 4096,
+                 failure_backoff_seconds: float = 300.0, clock: Callable[[], float] = time.monotonic):
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds
+        self.refresh_margin_seconds = refresh_margin_seconds
+        # Backends reject caching very short prompts; those are sent inline as usual
+        self.min_prompt_chars = min_prompt_chars
+        self.failure_backoff_seconds = failure_backoff_seconds
+        self._clock = clock
+        self._handles: Dict[Tuple[str, str], _Handle] = {}
+        self._locks: Dict[Tuple[str, str], asyncio.Lock] = {}
+        # (agent, model) -> (prompt hash, time) of a failed create; that prompt isn't cached again before then
+        self._failures: Dict[Tuple[str, str], Tuple[str, float]] = {}
+        self.hits = 0
+        self.creations = 0
+        self.refreshes = 0
+        self.invalidations = 0
+        self.create_failures = 0
+        self.backoff_skips = 0
+
+    async def handle_for(self, agent_name: str, model: str, instruction: str) -> Optional[str]:
+        """
+        Return a live cached-content handle for this agent's instruction, creating or refreshing it as needed.
+        Returns None while creating a handle for this instruction is backing off after a failure.
+        """
+        key = (agent_name, model)
+        digest = prompt_hash(instruction)
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            handle = self._handles.get(key)
+            now = self._clock()
+            failure = self._failures.get(key)
+            if failure is not None and failure[0] == digest and now < failure[1]:
+                self.backoff_skips += 1
+                return None
+            if handle is not None and handle.prompt_hash != digest:
+                # The prompt text changed: the cached prefix no longer matches
+                self.invalidations += 1
+                self._handles.pop(key)
+                try:
+                    await self.backend.delete(handle.name)
+                except Exception:
+                    logger.warning("Could not delete stale cached content %s", handle.name, exc_info=True)
+                handle = None
+
+            if handle is not None and now < handle.expires_at - self.refresh_margin_seconds:
+                self.hits += 1
+                return handle.name
+
+            if handle is not None:
+                try:
+                    await self.backend.refresh(handle.name, self.ttl_seconds)
+                    handle.expires_at = now + self.ttl_seconds
+                    self.refreshes += 1
+                    return handle.name
+                except Exception:
+                    logger.info("Cached content %s expired, creating a new one", handle.name)
+                    self._handles.pop(key)
+
+            try:
+                name = await self.backend.create(model, instruction, self.ttl_seconds)
+            except Exception:
+                self.create_failures += 1
+                self._failures[key] = (digest, now + self.failure_backoff_seconds)
+                raise
+            self._failures.pop(key, None)
+            self._handles[key] = _Handle(name=name, prompt_hash=digest, expires_at=now + self.ttl_seconds)
+            self.creations += 1
+            return name
+
+    async def before_model_callback(self, callback_context: CallbackContext, llm_request: LlmRequest):
+        """Replace the request's system instruction with its cached-content handle."""
+        config = llm_request.config
+        if config is None or config.cached_content:
+            return None
+        instruction = _instruction_text(config.system_instruction)
+        if len(instruction) < self.min_prompt_chars:
+            return None
+        try:
+            name = await self.handle_for(callback_context.agent_name, llm_request.model, instruction)
+        except Exception:
+            logger.warning("Prompt caching failed; sending the instruction inline for %.0fs",
+                           self.failure_backoff_seconds, exc_info=True)
+            return None
+        if name is None:
+            return None
+        config.cached_content = name
+        config.system_instruction = None
+        return None
+
+    def stats(self) -> dict:
+        return {
+            "handles": len(self._handles),
+            "hits": self.hits,
+            "creations": self.creations,
+            "refreshes": self.refreshes,
+            "invalidations": self.invalidations,
+            "create_failures": self.create_failures,
+            "backoff_skips": self.backoff_skips,
+        }
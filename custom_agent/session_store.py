@@ -0,0 +1,170 @@
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from google.adk.events import Event
+from google.adk.sessions import InMemorySessionService, Session
+from google.genai import types
+
+from .metrics import process_memory
+from .verdict import parse_verdict
+
+logger = logging.getLogger(__name__)
+
+# Author of the event standing in for a session's compacted events
+COMPACTION_AUTHOR = "session_compactor"
+
+_SessionKey = Tuple[str, str, str]
+
+
+def _verdict_counts(events: List[Event]) -> Dict[str, int]:
+    """Count the verdicts among events, merging the counts of earlier compaction summaries."""
+    counts = {"valid": 0, "invalid": 0, "undecided": 0}
+    for event in events:
+        if event.author == COMPACTION_AUTHOR:
+            for outcome, count in (event.custom_metadata or {}).get("verdicts", {}).items():
+                counts[outcome] = counts.get(outcome, 0) + count
+            continue
+        if event.partial or not event.is_final_response() or not event.content or not event.content.parts:
+            continue
+        verdict = parse_verdict(event.content.parts[0].text)
+        if verdict is None:
+            continue
+        outcome = {True: "valid", False: "invalid"}.get(verdict["isValidSQL"], "undecided")
+        counts[outcome] += 1
+    return counts
+
+
+def compaction_event(events: List[Event]) -> Event:
+    """One event summarizing events: how many there were and the verdicts among them."""
+    compacted = sum((event.custom_metadata or {}).get("compacted_events", 1) if event.author == COMPACTION_AUTHOR else 1
+                    for event in events)
+    counts = _verdict_counts(events)
+    summary = (f"{compacted} earlier events compacted: {counts['valid']} valid, {counts['invalid']} invalid and "
+               f"{counts['undecided']} undecided verdicts.")
+    return Event(
+        author=COMPACTION_AUTHOR,
+        invocation_id=events[-1].invocation_id,
+        timestamp=events[-1].timestamp,
+        content=types.Content(role="model", parts=[types.Part(text=summary)]),
+        custom_metadata={"compacted_events": compacted, "verdicts": counts},
+    )
+
+
+class BoundedSessionService(InMemorySessionService):
+    """
+    In-memory session service whose memory stays bounded in a long-running process.
+
+    - At most `max_sessions` sessions are kept; creating one more evicts the least
+      recently used.
+    - Sessions untouched for `idle_ttl_seconds` are evicted.
+    - A session holding more than `max_events_per_session` events has its older
+      events replaced by one summary event (see compaction_event), keeping the
+      most recent `max_events_per_session // 2`. This also keeps event appends
+      fast, since each one scans the session's events.
+    """
+
+    def __init__(self, max_sessions: int = 10_000, max_events_per_session: int = 200,
+                 idle_ttl_seconds: Optional[float] = 3600.0, clock: Callable[[], float] = time.time):
+        super().__init__()
+        if max_sessions < 1 or max_events_per_session < 2:
+            raise ValueError("max_sessions must be at least 1 and max_events_per_session at least 2")
+        self.max_sessions = max_sessions
+        self.max_events_per_session = max_events_per_session
+        self.idle_ttl_seconds = idle_ttl_seconds
+        self._clock = clock
+        # Session key -> last use, least recently used first
+        self._last_used: "OrderedDict[_SessionKey, float]" = OrderedDict()
+        self.evicted_idle = 0
+        self.evicted_capacity = 0
+        self.compactions = 0
+        self.compacted_events = 0
+
+    def _touch(self, key: _SessionKey) -> None:
+        self._last_used[key] = self._clock()
+        self._last_used.move_to_end(key)
+
+    def _evict(self, key: _SessionKey) -> None:
+        self._last_used.pop(key, None)
+        app_name, user_id, session_id = key
+        sessions = self.sessions.get(app_name, {}).get(user_id)
+        if sessions is None:
+            return
+        sessions.pop(session_id, None)
+        if not sessions:
+            # Don't keep an empty map per user that ever had a session
+            del self.sessions[app_name][user_id]
+
+    def _evict_idle(self) -> None:
+        if self.idle_ttl_seconds is None:
+            return
+        cutoff = self._clock() - self.idle_ttl_seconds
+        while self._last_used:
+            key, last_used = next(iter(self._last_used.items()))
+            if last_used > cutoff:
+                break
+            self._evict(key)
+            self.evicted_idle += 1
+
+    async def create_session(self, *, app_name: str, user_id: str, state: Optional[Dict[str, Any]] = None,
+                             session_id: Optional[str] = None) -> Session:
+        self._evict_idle()
+        while len(self._last_used) >= self.max_sessions:
+            self._evict(next(iter(self._last_used)))
+            self.evicted_capacity += 1
+        session = await super().create_session(app_name=app_name, user_id=user_id, state=state, session_id=session_id)
+        self._touch((app_name, user_id, session.id))
+        return session
+
+    async def get_session(self, *, app_name: str, user_id: str, session_id: str, config=None) -> Optional[Session]:
+        self._evict_idle()
+        session = await super().get_session(app_name=app_name, user_id=user_id, session_id=session_id, config=config)
+        if session is not None:
+            self._touch((app_name, user_id, session.id))
+        return session
+
+    async def delete_session(self, *, app_name: str, user_id: str, session_id: str) -> None:
+        await super().delete_session(app_name=app_name, user_id=user_id, session_id=session_id)
+        self._evict((app_name, user_id, session_id))
+
+    async def append_event(self, session: Session, event: Event) -> Event:
+        event = await super().append_event(session=session, event=event)
+        key = (session.app_name, session.user_id, session.id)
+        stored = self.sessions.get(session.app_name, {}).get(session.user_id, {}).get(session.id)
+        if stored is None or event.partial:
+            return event
+        self._touch(key)
+        if len(stored.events) > self.max_events_per_session:
+            self._compact(stored)
+        return event
+
+    def _compact(self, session: Session) -> None:
+        keep = self.max_events_per_session // 2
+        old, recent = session.events[:-keep], session.events[-keep:]
+        session.events = [compaction_event(old), *recent]
+        self.compactions += 1
+        self.compacted_events += len(old)
+        logger.debug("Compacted %d events of session %s", len(old), session.id)
+
+    def session_count(self) -> int:
+        return len(self._last_used)
+
+    def event_count(self) -> int:
+        return sum(len(session.events)
+                   for users in self.sessions.values()
+                   for sessions in users.values()
+                   for session in sessions.values())
+
+    def stats(self) -> dict:
+        return {
+            "sessions": self.session_count(),
+            "events": self.event_count(),
+            "max_sessions": self.max_sessions,
+            "max_events_per_session": self.max_events_per_session,
+            "evicted_idle": self.evicted_idle,
+            "evicted_capacity": self.evicted_capacity,
+            "compactions": self.compactions,
+            "compacted_events": self.compacted_events,
+            **process_memory(),
+        }
@@ -0,0 +1,53 @@
+import asyncio
+from contextlib import contextmanager
+from typing import Dict, Hashable, Iterator, Optional
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent work on the same key into a single in-flight call.
+
+    The first caller for a key becomes the leader and publishes its result through
+    `lead`; callers arriving while it runs get the leader's future from `follow`
+    and await that instead of repeating the work. A leader that finishes without a
+    result (failure, cancellation, unparseable response) publishes None so its
+    followers can fall back to running the work themselves.
+    """
+
+    def __init__(self):
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+        self.leaders = 0
+        self.coalesced = 0
+
+    def follow(self, key: Hashable) -> Optional[asyncio.Future]:
+        """Return the future of the in-flight call for key, or None if nobody is running it."""
+        future = self._inflight.get(key)
+        if future is not None:
+            self.coalesced += 1
+        return future
+
+    @contextmanager
+    def lead(self, key: Hashable) -> Iterator[asyncio.Future]:
+        """
+        Register the caller as the leader for key for the duration of the block.
+
+        Set the result on the yielded future to hand it to every follower. If the
+        block exits without doing so, followers receive None.
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        self.leaders += 1
+        try:
+            yield future
+        finally:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+            if not future.done():
+                future.set_result(None)
+
+    def stats(self) -> dict:
+        return {
+            "in_flight": len(self._inflight),
+            "leaders": self.leaders,
+            "coalesced": self.coalesced,
+        }
@@ -0,0 +1,139 @@
+import json
+from typing import TYPE_CHECKING, List, Optional
+
+from ..tools.statement_splitter import Statement
+
+if TYPE_CHECKING:
+    from google.adk.events import Event
+
+# "tier" of a verdict built from the parser result alone, without the model
+PARSER_ONLY = "parser-only"
+
+
+def parse_verdict(text: Optional[str]) -> Optional[dict]:
+    """
+    Extract the {"isValidSQL", "summary"} verdict from a model response.
+
+    The prompts ask for a raw JSON object, but models occasionally wrap it in a
+    markdown code fence, so fences are stripped before decoding.
+
+    Parameters:
+        text (str): The raw text of the final model response.
+
+    Returns:
+        dict | None: The verdict with the "isValidSQL" and "summary" keys (plus the
+                     per-statement "statements" list of a script verdict and the
+                     "tier" and "reason" of a parser-only verdict), or None if the
+                     text is not a well-formed verdict.
+    """
+    if not text:
+        return None
+    body = text.strip()
+    if body.startswith("```"):
+        body = body.strip("`").strip()
+        if body.lower().startswith("json"):
+            body = body[4:].strip()
+    try:
+        data = json.loads(body)
+    except ValueError:
+        return None
+    if not isinstance(data, dict):
+        return None
+    parser_only = data.get("tier") == PARSER_ONLY
+    # A parser-only verdict is undecided (null) when sqlglot itself failed on the statement,
+    # a script verdict when one of its statements is undecided and none is invalid
+    undecided_allowed = parser_only or isinstance(data.get("statements"), list)
+    if not (isinstance(data.get("isValidSQL"), bool) or (undecided_allowed and data.get("isValidSQL") is None)):
+        return None
+    if not isinstance(data.get("summary"), str):
+        return None
+    verdict = {"isValidSQL": data["isValidSQL"], "summary": data["summary"]}
+    if isinstance(data.get("statements"), list):
+        verdict["statements"] = data["statements"]
+    if parser_only:
+        verdict["tier"] = PARSER_ONLY
+        verdict["reason"] = data.get("reason")
+    return verdict
+
+
+def parser_only_verdict(parser_result: dict, reason: str) -> dict:
+    """
+    Build a degraded verdict from the parser result alone, for statements the model
+    can't be asked about in time (deadline passed, circuit breaker open, model failure).
+
+    Parameters:
+        parser_result (dict): The {"valid", "message", "errors"} result of the parser.
+        reason (str): Why the model was skipped.
+
+    Returns:
+        dict: The verdict, marked with "tier": "parser-only" and the reason.
+    """
+    return {
+        "isValidSQL": parser_result["valid"],
+        "summary": parser_result["message"],
+        "tier": PARSER_ONLY,
+        "reason": reason,
+    }
+
+
+def statement_result(statement: Statement, verdict: Optional[dict]) -> dict:
+    """The per-statement entry of a script verdict: the statement's position, line range and verdict."""
+    verdict = verdict or {"isValidSQL": None, "summary": "No verdict captured for this statement."}
+    result = {
+        "index": statement.index,
+        "start_line": statement.start_line,
+        "end_line": statement.end_line,
+        "isValidSQL": verdict["isValidSQL"],
+        "summary": verdict["summary"],
+    }
+    if verdict.get("tier") == PARSER_ONLY:
+        result["tier"] = PARSER_ONLY
+        result["reason"] = verdict["reason"]
+    return result
+
+
+def script_verdict(results: List[dict]) -> dict:
+    """
+    Combine the statement_result entries of a script into one verdict: invalid if any
+    statement is, undecided (None) if any statement is undecided and none is invalid, and
+    valid only if every statement is. The script verdict is parser-only, with the first
+    statement's reason, if any of its statements' verdicts is.
+    """
+    invalid = [result for result in results if result["isValidSQL"] is False]
+    undecided = [result for result in results if result["isValidSQL"] is None]
+    if invalid:
+        is_valid, summary = False, f"{len(invalid)} of {len(results)} statements are not valid Spark SQL."
+    elif undecided:
+        is_valid, summary = None, f"{len(undecided)} of {len(results)} statements could not be validated."
+    else:
+        is_valid, summary = True, f"All {len(results)} statements are syntactically valid Spark SQL."
+    verdict = {"isValidSQL": is_valid, "summary": summary, "statements": results}
+    degraded = [result["reason"] for result in results if result.get("tier") == PARSER_ONLY]
+    if degraded:
+        verdict.update(tier=PARSER_ONLY, reason=degraded[0])
+    return verdict
+
+
+def verdict_event(author: str, verdict: dict, output_key: Optional[str] = None) -> "Event":
+    """
+    Build a final-response event carrying a verdict that did not come from a model call.
+
+    Parameters:
+        author (str): Name of the agent emitting the event.
+        verdict (dict): The verdict to emit as the response text.
+        output_key (str): Optional state key to store the verdict under, mirroring LlmAgent.output_key.
+
+    Returns:
+        Event: A non-partial event whose text is the JSON verdict.
+    """
+    # Imported here so parse_verdict and parser_only_verdict don't load the Google SDKs
+    from google.adk.events import Event, EventActions
+    from google.genai import types
+
+    text = json.dumps(verdict)
+    actions = EventActions(state_delta={output_key: text}) if output_key else EventActions()
+    return Event(
+        author=author,
+        content=types.Content(role="model", parts=[types.Part(text=text)]),
+        actions=actions,
+    )
@@ -0,0 +1,105 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Optional
+
+from ..tools.syntax_validator import canonicalize_sql
+
+
+def prompt_hash(prompt: str) -> str:
+    """Return a short, stable digest of a prompt's text."""
+    return hashlib.sha256(prompt.encode("utf-8")).hexdigest()[:16]
+
+
+def verdict_cache_key(sql: str, model: str, prompt: str, generation_config: str = "",
+                      canonical: Optional[str] = None) -> str:
+    """
+    Build the cache key for a verdict.
+
+    Parameters:
+        sql (str): The SQL query as submitted. It is canonicalized so whitespace,
+                   comments and keyword case do not produce distinct keys.
+        model (str): Name of the model that produces the verdict.
+        prompt (str): The instruction text the model is run with.
+        generation_config (str): Serialized generation settings of the model call.
+        canonical (str): The canonical form of sql if the caller already has it
+                         (see ParseResult.canonical); saves parsing sql again.
+
+    Returns:
+        str: A hex digest identifying (canonical SQL, model, generation config, prompt).
+    """
+    if canonical is None:
+        canonical = canonicalize_sql(sql)
+    material = "\x1f".join((model, generation_config, prompt_hash(prompt), canonical))
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+class VerdictCache:
+    """
+    Bounded in-process LRU cache of validation verdicts with a per-entry TTL.
+
+    Entries are the {"isValidSQL", "summary"} dicts produced by the validator or
+    error interpreter agents. The cache is safe to share between concurrent
+    requests in one process.
+    """
+
+    def __init__(self, max_entries: int = 4096, ttl_seconds: Optional[float] = 3600.0,
+                 clock: Callable[[], float] = time.monotonic):
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: "OrderedDict[str, tuple[float, dict]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: str) -> Optional[dict]:
+        """Return a copy of the cached verdict for key, or None on a miss or expired entry."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            stored_at, verdict = entry
+            if self.ttl_seconds is not None and self._clock() - stored_at > self.ttl_seconds:
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return dict(verdict)
+
+    def put(self, key: str, verdict: dict) -> None:
+        """Store a verdict, evicting the least recently used entries beyond max_entries."""
+        with self._lock:
+            self._entries[key] = (self._clock(), dict(verdict))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop every entry. Counters are kept."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> dict:
+        """Return the hit/miss/eviction counters and current size."""
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
@@ -0,0 +1,123 @@
+import json
+import logging
+import sqlite3
+import threading
+import time
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS verdicts (
+    key TEXT PRIMARY KEY,
+    verdict TEXT NOT NULL,
+    stored_at REAL NOT NULL,
+    used_at REAL NOT NULL
+)
+"""
+_USED_AT_INDEX = "CREATE INDEX IF NOT EXISTS verdicts_used_at ON verdicts (used_at)"
+
+
+class SqliteVerdictStore:
+    """
+    Persistent verdict store backed by a single SQLite file.
+
+    It sits behind the in-process VerdictCache so verdicts survive restarts.
+    Keys are the same verdict_cache_key digests, which already cover the
+    canonical SQL, the model, the generation config and the prompt hash: editing
+    a prompt makes its old entries unreachable, and compaction reclaims them.
+
+    Opening the store only reads the row count; entries are looked up on demand.
+    When the row count passes max_entries plus a slack of compaction_slack, the
+    least recently used rows are deleted down to max_entries. The methods block on
+    disk I/O, so async callers should run them in a worker thread.
+    """
+
+    def __init__(self, path: str, max_entries: int = 100_000, compaction_slack: float = 0.1,
+                 clock: Callable[[], float] = time.time):
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        self.path = path
+        self.max_entries = max_entries
+        self._compact_above = max_entries + max(1, int(max_entries * compaction_slack))
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(_SCHEMA)
+        self._connection.execute(_USED_AT_INDEX)
+        self._size = self._connection.execute("SELECT COUNT(*) FROM verdicts").fetchone()[0]
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.compactions = 0
+        self.evictions = 0
+
+    def get(self, key: str) -> Optional[dict]:
+        """Return the stored verdict for key, or None if it is not stored."""
+        with self._lock:
+            row = self._connection.execute("SELECT verdict FROM verdicts WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self._connection.execute("UPDATE verdicts SET used_at = ? WHERE key = ?", (self._clock(), key))
+            self.hits += 1
+        try:
+            return json.loads(row[0])
+        except ValueError:
+            logger.warning("Discarding unreadable stored verdict %s", key)
+            return None
+
+    def put(self, key: str, verdict: dict) -> None:
+        """Store a verdict, compacting the store if it has grown past its bound."""
+        now = self._clock()
+        with self._lock:
+            exists = self._connection.execute("SELECT 1 FROM verdicts WHERE key = ?", (key,)).fetchone()
+            self._connection.execute(
+                "INSERT OR REPLACE INTO verdicts (key, verdict, stored_at, used_at) VALUES (?, ?, ?, ?)",
+                (key, json.dumps(verdict), now, now),
+            )
+            self.writes += 1
+            if exists is None:
+                self._size += 1
+            if self._size > self._compact_above:
+                self._compact()
+
+    def _compact(self) -> None:
+        """Delete the least recently used rows beyond max_entries. Called with the lock held."""
+        excess = self._size - self.max_entries
+        self._connection.execute(
+            "DELETE FROM verdicts WHERE key IN (SELECT key FROM verdicts ORDER BY used_at LIMIT ?)",
+            (excess,),
+        )
+        self._size = self.max_entries
+        self.compactions += 1
+        self.evictions += excess
+
+    def clear(self) -> None:
+        """Delete every stored verdict. Counters are kept."""
+        with self._lock:
+            self._connection.execute("DELETE FROM verdicts")
+            self._size = 0
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def stats(self) -> dict:
+        """Return the hit/miss/write/compaction counters and current size."""
+        with self._lock:
+            return {
+                "path": self.path,
+                "size": self._size,
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "writes": self.writes,
+                "compactions": self.compactions,
+                "evictions": self.evictions,
+            }
@@ -0,0 +1,79 @@
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import List, Optional, Sequence
+
+from sqlglot.tokens import Token
+
+from .custom_agent.verdict import parser_only_verdict, script_verdict, statement_result
+from .tools.ast_rules import RuleEngine
+from .tools.error_templates import interpret_syntax_error
+from .tools.statement_splitter import split_statements
+from .tools.syntax_validator import parse_sql
+
+# Reason of the parser-only verdicts given here: this entry point never calls a model
+MODEL_DISABLED = "model_disabled"
+
+_rule_engine = RuleEngine()
+
+
+def validate_statement(sql: str, tokens: Sequence[Token] = (), start_line: int = 1, start_column: int = 1) -> dict:
+    """
+    Validates one statement with the coordinator's model-free stages only: the parser, then the
+    structural rules for statements that parse and the error templates for those that don't.
+    Statements only the model could decide get the parser's result as a parser-only verdict.
+
+    Parameters:
+        sql (str): The statement.
+        tokens (Sequence[Token]): The statement's tokens, if the splitter already produced them.
+        start_line (int): Line of the input the statement starts on, for the positions in summaries.
+        start_column (int): Column of that line the statement starts at.
+
+    Returns:
+        dict: The {"isValidSQL", "summary"} verdict, plus "tier" and "reason" when parser-only.
+    """
+    parsed = parse_sql(sql, tokens=tokens or None)
+    verdict = None
+    if parsed.valid is False:
+        verdict = interpret_syntax_error(sql, parsed.errors, start_line, start_column)
+    elif parsed.expression is not None:
+        verdict = _rule_engine.evaluate(parsed.expression, parsed.tokens)
+    return verdict or parser_only_verdict(parsed.as_dict(), MODEL_DISABLED)
+
+
+def validate_query(query: str) -> dict:
+    """
+    Validates a query or a multi-statement script without the model and without importing the
+    Google SDKs, so CLI runs, pre-commit hooks and cold starts only pay for sqlglot. Scripts get
+    one combined verdict with a "statements" entry per statement, as from agent.validate_query.
+    """
+    statements = split_statements(query)
+    verdicts = [validate_statement(statement.sql, statement.tokens, statement.start_line, statement.start_column)
+                for statement in statements]
+    if len(statements) > 1:
+        return script_verdict([statement_result(statement, verdict) for statement, verdict in zip(statements, verdicts)])
+    if statements:
+        return verdicts[0]
+    return validate_statement(query)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Check Spark SQL with the parser, structural rules and error templates only; no model calls.")
+    parser.add_argument("paths", nargs="*", type=Path, metavar="PATH",
+                        help="SQL files to check; standard input is checked when none are given.")
+    args = parser.parse_args(argv)
+
+    sources = [(str(path), path.read_text(encoding="utf-8")) for path in args.paths] or [("-", sys.stdin.read())]
+    invalid = False
+    for name, query in sources:
+        verdict = validate_query(query)
+        invalid = invalid or verdict["isValidSQL"] is False
+        sys.stdout.write(json.dumps({"path": name, **verdict}) + "\n")
+    # Undecided (null) verdicts, of a statement or of a script, don't fail the run: only the model could settle them
+    return 1 if invalid else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,87 @@
+from .validator_base import build_validator_prompt
+
+DDL_CHECK_ITEMS = """\
+    - Check the statement keyword and object type (e.g., `CREATE DATABASE`, `CREATE TABLE`, `ALTER TABLE`, `DROP TABLE`, `TRUNCATE TABLE`).
+    - Confirm that optional clauses such as `IF NOT EXISTS` / `IF EXISTS` appear in their required position, directly after the object type.
+    - Ensure column definition lists are enclosed in parentheses, comma-separated, and give every column a data type.
+    - Confirm `ALTER TABLE` actions use the Spark SQL keywords (e.g., `ADD COLUMNS (...)`, `DROP COLUMNS`, `RENAME TO`).
+    - Confirm table options follow the column list in the documented order (`USING`, `PARTITIONED BY`, `LOCATION`, `TBLPROPERTIES`, `AS SELECT`).
+
+"""
+
+DDL_EXAMPLES = """\
+* **Query:** `CREATE DATABASE IF NOT EXISTS sales_db`
+        * **Response:**
+        ```json
+        {
+  "isValidSQL": true,
+  "summary": "Valid CREATE DATABASE statement with IF NOT EXISTS."
+}
+        ```
+
+* **Query:** `CREATE DATABASE sales_db IF NOT EXISTS`
+        * **Response:**
+        ```json
+        {
+  "isValidSQL": false,
+  "summary": "Invalid clause order; IF NOT EXISTS must follow DATABASE name."
+}
+        ```
+
+* **Query:** `CREATE TABLE prod (id INT, name STRING) USING PARQUET`
+        * **Response:**
+        ```json
+        {
+  "isValidSQL": true,
+  "summary": "Valid CREATE TABLE using the Parquet data source."
+}
+        ```
+
+* **Query:** `CREATE TABLE prod id INT, name STRING USING PARQUET`
+        * **Response:**
+        ```json
+        {
+  "isValidSQL": false,
+  "summary": "Missing parentheses around column definitions."
+}
+        ```
+
+* **Query:** `ALTER TABLE prod ADD COLUMNS (price DECIMAL(10,2))`
+        * **Response:**
+        ```json
+        {
+  "isValidSQL": true,
+  "summary": "Valid ALTER TABLE to add a new column."
+}
+        ```
+
+* **Query:** `ALTER TABLE prod ADD COLUMN price DECIMAL(10,2)`
+        * **Response:**
+        ```json
+        {
+  "isValidSQL": false,
+  "summary": "Spark expects ADD COLUMNS ( ... ); singular ADD COLUMN is not supported."
+}
+        ```
+
+* **Query:** `TRUNCATE TABLE prod`
+        * **Response:**
+        ```json
+        {
+  "isValidSQL": true,
+  "summary": "Valid TRUNCATE TABLE statement."
+}
+        ```
+
+* **Query:** `TRUNCATE prod`
+        * **Response:**
+        ```json
+        {
+  "isValidSQL": false,
+  "summary": "TABLE keyword is mandatory in TRUNCATE TABLE."
+}
+        ```
+
+"""
+
+DDL_VALIDATOR_PROMPT = build_validator_prompt(DDL_CHECK_ITEMS, DDL_EXAMPLES)
@@ -0,0 +1,87 @@
+from .query_validator import QUERY_CHECK_ITEMS
+from .validator_base import build_validator_prompt
+
+DML_CHECK_ITEMS = """\
+    - Check `INSERT INTO` / `INSERT OVERWRITE` statements name a target table and provide either `VALUES (...)` rows or a query.
+    - Check `MERGE INTO target USING source ON condition` is followed by at least one `WHEN MATCHED` or `WHEN NOT MATCHED` clause with a valid action.
+    - Check `UPDATE table SET column = expression [WHERE ...]` includes the `SET` keyword and comma-separated assignments.
+    - Check `DELETE FROM table [WHERE ...]` includes the `FROM` keyword.
+    - Any embedded query (e.g., `INSERT INTO ... SELECT`, `USING (SELECT ...)`) must follow these query rules:
+"""
+
+DML_EXAMPLES = """\
+* **Query:** `INSERT INTO prod VALUES (1, 'widget')`
+        * **Response:**
+        ```json
+        {
+  "isValidSQL": true,
+  "summary": "Valid INSERT INTO VALUES syntax."
+}
+        ```
+
+* **Query:** `INSERT prod VALUES (1, 'widget')`
+        * **Response:**
+        ```json
+        {
+  "isValidSQL": false,
+  "summary": "INSERT must include the INTO keyword."
+}
+        ```
+
+* **Query:** `MERGE INTO prod p USING updates u ON p.id = u.id WHEN MATCHED THEN UPDATE SET name = u.name`
+        * **Response:**
+        ```json
+        {
+  "isValidSQL": true,
+  "summary": "Valid MERGE statement updating matching rows."
+}
+        ```
+
+* **Query:** `MERGE prod p USING updates u ON p.id = u.id WHEN MATCHED THEN UPDATE SET name = u.name`
+        * **Response:**
+        ```json
+        {
+  "isValidSQL": false,
+  "summary": "Missing INTO keyword after MERGE."
+}
+        ```
+
+* **Query:** `UPDATE prod SET price = price * 1.1 WHERE id = 1`
+        * **Response:**
+        ```json
+        {
+  "isValidSQL": true,
+  "summary": "Valid UPDATE statement with arithmetic expression."
+}
+        ```
+
+* **Query:** `UPDATE prod price = 5 WHERE id = 1`
+        * **Response:**
+        ```json
+        {
+  "isValidSQL": false,
+  "summary": "UPDATE requires the SET keyword before assignments."
+}
+        ```
+
+* **Query:** `DELETE FROM prod WHERE id = 2`
+        * **Response:**
+        ```json
+        {
+  "isValidSQL": true,
+  "summary": "Valid DELETE statement with WHERE filter."
+}
+        ```
+
+* **Query:** `DELETE prod WHERE id = 2`
+        * **Response:**
+        ```json
+        {
+  "isValidSQL": false,
+  "summary": "DELETE must include the FROM keyword."
+}
+        ```
+
+"""
+
+DML_VALIDATOR_PROMPT = build_validator_prompt(DML_CHECK_ITEMS + QUERY_CHECK_ITEMS, DML_EXAMPLES)
@@ -10,8 +10,6 @@ Follow these guidelines exactly:
 4. Do NOT suggest fixes, tips, or alternative SQL.
 5. Do NOT assume schema or database context. Focus strictly on the syntax error message provided in `state["error"]`.
 
-**Ignore any previous SQL queries or validation results mentioned in the conversation history. Focus solely on the input provided in the 'session.state.sql_to_validate' and 'session.state.error' fields for this turn.**
-
 Return the result in the following strict JSON format:
 
 {
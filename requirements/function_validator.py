@@ -0,0 +1,314 @@
+from .query_validator import QUERY_CHECK_ITEMS, QUERY_EXAMPLES
+from .validator_base import build_validator_prompt
+
+FUNCTION_CHECK_ITEMS = """\
+    - Check every built-in function call against its Spark SQL signature: the number of arguments, their order and the types of literal arguments.
+    - Check literal values passed to casts and functions: CAST ranges, date and timestamp validity, regex patterns and numeric parameters such as `sha2` bit lengths.
+    - Check ARRAY, MAP and STRUCT constructors for consistent element types and complete key/value pairs.
+
+"""
+
+FUNCTION_EXAMPLES = """\
+* **Query:** `SELECT CAST('2025-07-14' AS DATE)`
+        * **Response:**
+        ```json
+        {
+  "isValidSQL": true,
+  "summary": "Valid date literal cast to DATE."
+}
+        ```
+
+* **Query:** `SELECT CAST('2025-02-30' AS DATE)`
+        * **Response:**
+        ```json
+        {
+  "isValidSQL": false,
+  "summary": "Invalid date literal: February 30 does not exist."
+}
+        ```
+
+* **Query:** `SELECT ARRAY(1, 2, 3) AS nums`
+        * **Response:**
+        ```json
+        {
+  "isValidSQL": true,
+  "summary": "Valid ARRAY constructor with homogeneous INT elements."
+}
+        ```
+
+* **Query:** `SELECT ARRAY(1, 'two', 3) AS bad_nums`
+        * **Response:**
+        ```json
+        {
+  "isValidSQL": false,
+  "summary": "Invalid ARRAY: element types are not consistent."
+}
+        ```
+
+* **Query:** `SELECT MAP('k1', 1, 'k2', 2) AS m`
+        * **Response:**
+        ```json
+        {
+  "isValidSQL": true,
+  "summary": "Valid MAP constructor with alternating key/value arguments."
+}
+        ```
+
+* **Query:** `SELECT MAP('k1', 1, 'k2') AS bad_map`
+        * **Response:**
+        ```json
+        {
+  "isValidSQL": false,
+  "summary": "Invalid MAP: odd number of arguments leaves a dangling key without value."
+}
+        ```
+
+* **Query:** `SELECT STRUCT(1 AS id, 'a' AS name) AS s`
+        * **Response:**
+        ```json
+        {
+  "isValidSQL": true,
+  "summary": "Valid STRUCT constructor with named fields."
+}
+        ```
+
+* **Query:** `SELECT STRUCT(1, 'a', 'extra') AS s`
+        * **Response:**
+        ```json
+        {
+  "isValidSQL": false,
+  "summary": "Invalid STRUCT: field names missing for all elements."
+}
+        ```
+
+* **Query:** `SELECT name FROM users WHERE name RLIKE '^A.*'`
+        * **Response:**
+        ```json
+        {
+  "isValidSQL": true,
+  "summary": "Valid regex filter using RLIKE."
+}
+        ```
+
+* **Query:** `SELECT name FROM users WHERE name RLIKE '['`
+        * **Response:**
+        ```json
+        {
+  "isValidSQL": false,
+  "summary": "Invalid regex pattern: unclosed character class."
+}
+        ```
+
+* **Query:** `SELECT CAST('128' AS TINYINT)`
+        * **Response:**
+        ```json
+        {
+  "isValidSQL": true,
+  "summary": "Valid cast within the TINYINT range (-128 to 127)."
+}
+        ```
+
+* **Query:** `SELECT CAST(200 AS TINYINT)`
+        * **Response:**
+        ```json
+        {
+  "isValidSQL": false,
+  "summary": "Overflow: 200 is outside the valid TINYINT range."
+}
+        ```
+
+* **Query:** `SELECT substring('Spark', 2, 3)`
+        * **Response:**
+        ```json
+        {
+  "isValidSQL": true,
+  "summary": "Valid SUBSTRING scalar function with start and length."
+}
+        ```
+
+* **Query:** `SELECT substring(123, 2, 3)`
+        * **Response:**
+        ```json
+        {
+  "isValidSQL": false,
+  "summary": "Invalid SUBSTRING: first argument must be a string."
+}
+        ```
+
+* **Query:** `SELECT array_contains(array(1,2,3), 2)`
+        * **Response:**
+        ```json
+        {
+  "isValidSQL": true,
+  "summary": "Valid array_contains function checking membership."
+}
+        ```
+
+* **Query:** `SELECT array_contains(2, array(1,2,3))`
+        * **Response:**
+        ```json
+        {
+  "isValidSQL": false,
+  "summary": "Invalid argument order for array_contains."
+}
+        ```
+
+* **Query:** `SELECT date_add('2025-07-14', 7)`
+        * **Response:**
+        ```json
+        {
+  "isValidSQL": true,
+  "summary": "Valid DATE_ADD adding 7 days to the date."
+}
+        ```
+
+* **Query:** `SELECT date_add(7, '2025-07-14')`
+        * **Response:**
+        ```json
+        {
+  "isValidSQL": false,
+  "summary": "DATE_ADD expects (date, int) argument order."
+}
+        ```
+
+* **Query:** `SELECT row_number() OVER (PARTITION BY dept ORDER BY salary)`
+        * **Response:**
+        ```json
+        {
+  "isValidSQL": true,
+  "summary": "Valid window function ROW_NUMBER with partition and order."
+}
+        ```
+
+* **Query:** `SELECT row_number() OVER (PARTITION dept ORDER BY salary)`
+        * **Response:**
+        ```json
+        {
+  "isValidSQL": false,
+  "summary": "Missing BY keyword after PARTITION in window specification."
+}
+        ```
+
+* **Query:** `SELECT explode(array(1,2,3))`
+        * **Response:**
+        ```json
+        {
+  "isValidSQL": true,
+  "summary": "Valid LATERAL VIEW compatible explode function."
+}
+        ```
+
+* **Query:** `SELECT explode()`
+        * **Response:**
+        ```json
+        {
+  "isValidSQL": false,
+  "summary": "EXPLODE requires one array or map argument."
+}
+        ```
+
+* **Query:** `SELECT map_from_arrays(array('a','b'), array(1,2))`
+        * **Response:**
+        ```json
+        {
+  "isValidSQL": true,
+  "summary": "Valid map_from_arrays creating a map from two equally sized arrays."
+}
+        ```
+
+* **Query:** `SELECT map_from_arrays(array('a'), array(1,2))`
+        * **Response:**
+        ```json
+        {
+  "isValidSQL": false,
+  "summary": "Invalid map_from_arrays: array length mismatch."
+}
+        ```
+
+* **Query:** `SELECT percentile_approx(price, 0.9) FROM sales GROUP BY category`
+        * **Response:**
+        ```json
+        {
+  "isValidSQL": true,
+  "summary": "Valid percentile_approx aggregate function."
+}
+        ```
+
+* **Query:** `SELECT percentile_approx(price, '0.9') FROM sales`
+        * **Response:**
+        ```json
+        {
+  "isValidSQL": false,
+  "summary": "percentile_approx requires numeric percentile argument."
+}
+        ```
+
+* **Query:** `SELECT bitmap_count(bitmap_construct_agg(id)) FROM clicks`
+        * **Response:**
+        ```json
+        {
+  "isValidSQL": true,
+  "summary": "Valid bitmap aggregate computation."
+}
+        ```
+
+* **Query:** `SELECT bitmap_count(id) FROM clicks`
+        * **Response:**
+        ```json
+        {
+  "isValidSQL": false,
+  "summary": "bitmap_count expects a bitmap, not a plain numeric column."
+}
+        ```
+
+* **Query:** `SELECT to_timestamp('2025-07-14 10:00:00')`
+        * **Response:**
+        ```json
+        {
+  "isValidSQL": true,
+  "summary": "Valid string-to-timestamp conversion."
+}
+        ```
+
+* **Query:** `SELECT to_timestamp('invalid timestamp')`
+        * **Response:**
+        ```json
+        {
+  "isValidSQL": false,
+  "summary": "String cannot be parsed as a valid timestamp."
+}
+        ```
+
+* **Query:** `SELECT sha2('Spark', 256)`
+        * **Response:**
+        ```json
+        {
+  "isValidSQL": true,
+  "summary": "Valid SHA2 hash with 256-bit digest."
+}
+        ```
+
+* **Query:** `SELECT sha2('Spark', 257)`
+        * **Response:**
+        ```json
+        {
+  "isValidSQL": false,
+  "summary": "Invalid bit length for SHA2; allowed values are 0, 224, 256, 384, 512."
+}
+        ```
+
+* **Query:** `SELECT CAST('abc' AS INT)`
+        * **Response:**
+        ```json
+        {
+  "isValidSQL": false,
+  "summary": "Invalid cast; non-numeric string to INT causes a runtime cast error in ANSI mode."
+}
+        ```
+"""
+
+FUNCTION_VALIDATOR_PROMPT = build_validator_prompt(
+    QUERY_CHECK_ITEMS.rstrip("\n") + "\n" + FUNCTION_CHECK_ITEMS,
+    QUERY_EXAMPLES,
+    FUNCTION_EXAMPLES,
+)
@@ -0,0 +1,377 @@
+from .validator_base import build_validator_prompt
+
+QUERY_CHECK_ITEMS = """\
+    - Check for a valid SELECT clause with at least one column or expression (e.g., `SELECT`, `SELECT *`, `SELECT id`, `SELECT COUNT(*)`).
+    - Ensure a FROM clause is present and properly structured (e.g., `FROM table_name`).
+    - Confirm the clause order: SELECT → FROM → WHERE → GROUP BY → HAVING → ORDER BY
+    - Check calls to common functions (aggregates, `CASE` / `IF`, `COALESCE`, `NULLIF`, `LOWER`, `UPPER`, `TRIM`, `CONCAT`, `ROUND`, `CURRENT_DATE`, `CURRENT_TIMESTAMP`, ...) and casts of columns for balanced parentheses and a plausible number of arguments.
+    - Reject invalid constructs like:
+      - `SELECT FROM table` (no columns after SELECT)
+      - `FROM table SELECT name` (incorrect clause order)
+      - `SELECT JOIN FROM table` (invalid JOIN structure)
+      - `SELECT name age FROM employees` (missing comma)
+      - `SELECT * customers` (missing FROM)
+      - `SELECT COUNT(*) name FROM orders` (missing AS or alias syntax)
+      - `SELECT customer_id FROM orders JOIN customers` (JOIN missing ON/USING)
+      - `SELECT id FROM users WHERE age >> 30` (invalid operator)
+      - `SELECT name FROM users WHERE id IN (SELECT id FROM)` (subquery missing FROM table)
+      - `SELECT COUNT(*) FROM` (missing table after FROM)
+      - `SELECT customer_id, COUNT(*) AS order_count FROM orders GROUP BY customer_id HAVING total_orders > 5` (Invalid HAVING clause *unless aliased in outer scope* - this is a tricky one and might be borderline semantic. Let's make sure the prompt *always* expects valid syntax, even if the alias isn't fully resolved. For this specific case, it's a bit of a gray area, but the current prompt handles it as a syntactic error which is fine.)
+      - `ON column_name = table.column` where `column_name` is ambiguous — in queries with multiple tables, all columns used in `ON`, `WHERE`, or `SELECT` must be qualified if there is any chance of conflict.
+
+"""
+
+QUERY_EXAMPLES = """\
+* **Query:** `SELECT FROM abc`
+* **Response:**
+    ```json
+    {
+      "isValidSQL": false,
+      "summary": "SELECT clause has no columns."
+    }
+    ```
+
+* **Query:** `SELECT id, name FROM users`
+* **Response:**
+    ```json
+    {
+      "isValidSQL": true,
+      "summary": "Query is syntactically valid Spark SQL."
+    }
+    ```
+
+* **Query:** `SELECT JOIN JOIN abc`
+* **Response:**
+    ```json
+    {
+      "isValidSQL": false,
+      "summary": "JOIN clause is invalid or incomplete. Expected a table name and ON/USING condition."
+    }
+    ```
+
+* **Query:** `SELECT name age FROM employees`
+* **Response:**
+    ```json
+    {
+      "isValidSQL": false,
+      "summary": "Missing comma between column names in SELECT clause."
+    }
+    ```
+
+* **Query:** `SELECT * customers`
+* **Response:**
+    ```json
+    {
+      "isValidSQL": false,
+      "summary": "Missing FROM keyword before table name."
+    }
+    ```
+
+* **Query:** `SELECT COUNT(*) name FROM orders`
+* **Response:**
+    ```json
+    {
+      "isValidSQL": false,
+      "summary": "Missing AS keyword or alias syntax error after aggregate function."
+    }
+    ```
+
+* **Query:** `SELECT customer_id FROM orders JOIN customers`
+* **Response:**
+    ```json
+    {
+      "isValidSQL": false,
+      "summary": "JOIN clause missing ON condition."
+    }
+    ```
+
+* **Query:** `SELECT customer_id, COUNT(*) AS order_count FROM orders GROUP BY customer_id`
+* **Response:**
+    ```json
+    {
+      "isValidSQL": true,
+      "summary": "Valid aggregation query using GROUP BY."
+    }
+    ```
+
+* **Query:** `SELECT e.name, d.department_name FROM employees e JOIN departments d ON e.dept_id = d.dept_id`
+* **Response:**
+    ```json
+    {
+      "isValidSQL": true,
+      "summary": "Valid inner join with aliases and ON condition."
+    }
+    ```
+
+* **Query:** `WITH top_customers AS (SELECT customer_id FROM orders GROUP BY customer_id HAVING COUNT(*) > 5) SELECT * FROM top_customers`
+* **Response:**
+    ```json
+    {
+      "isValidSQL": true,
+      "summary": "Valid use of CTE (WITH clause) and subquery referencing."
+    }
+    ```
+
+* **Query:** `SELECT name FROM users WHERE user_id IN (SELECT user_id FROM logs WHERE action = 'login')`
+* **Response:**
+    ```json
+    {
+      "isValidSQL": true,
+      "summary": "Valid subquery usage in WHERE clause."
+    }
+    ```
+
+* **Query:** `SELECT name, RANK() OVER (ORDER BY score DESC) AS rank FROM players`
+* **Response:**
+    ```json
+    {
+      "isValidSQL": true,
+      "summary": "Valid window function query using RANK()."
+    }
+    ```
+
+* **Query:** `SELECT c.customer_id, c.name, COUNT(o.order_id) AS total_orders FROM customers c JOIN orders o ON c.customer_id = o.customer_id GROUP BY c.customer_id, c.name HAVING total_orders > 5`
+* **Response:**
+    ```json
+    {
+      "isValidSQL": false,
+      "summary": "Invalid HAVING clause. total_orders must be replaced with COUNT(o.order_id) unless aliased in a subquery or CTE."
+    }
+    ```
+
+* **Query:** `SELECT * FROM (SELECT order_id, amount FROM orders) sub WHERE amount > 1000`
+* **Response:**
+    ```json
+    {
+      "isValidSQL": true,
+      "summary": "Valid use of inline subquery (derived table) with filtering."
+    }
+    ```
+
+* **Query:** `SELECT department_id, COUNT(CASE WHEN salary > 100000 THEN 1 END) AS high_paid_employees FROM employees GROUP BY department_id`
+* **Response:**
+    ```json
+    {
+      "isValidSQL": true,
+      "summary": "Valid use of conditional aggregation with CASE WHEN inside COUNT."
+    }
+    ```
+
+* **Query:** `WITH ranked_sales AS (SELECT salesperson_id, amount, RANK() OVER (PARTITION BY region ORDER BY amount DESC) AS rank FROM sales) SELECT * FROM ranked_sales WHERE rank <= 3`
+* **Response:**
+    ```json
+    {
+      "isValidSQL": true,
+      "summary": "Valid query with CTE, window function, and ranking filter."
+    }
+    ```
+
+* **Query:** `SELECT employee_id, SUM(salary) OVER (PARTITION BY department_id) FROM employees`
+* **Response:**
+    ```json
+    {
+      "isValidSQL": true,
+      "summary": "Valid window aggregation using SUM with PARTITION BY."
+    }
+    ```
+
+* **Query:** `SELECT id, name FROM (SELECT * FROM users) u WHERE u.age > 30`
+* **Response:**
+    ```json
+    {
+      "isValidSQL": true,
+      "summary": "Valid nested SELECT with alias and outer filtering."
+    }
+    ```
+
+* **Query:** `SELECT COUNT(*) FROM`
+* **Response:**
+    ```json
+    {
+      "isValidSQL": false,
+      "summary": "Missing table name after FROM clause."
+    }
+    ```
+
+* **Query:** `SELECT id FROM users WHERE age >> 30`
+* **Response:**
+    ```json
+    {
+      "isValidSQL": false,
+      "summary": "Invalid operator '>>'. Expected a valid comparison operator."
+    }
+    ```
+
+* **Query:** `SELECT name FROM users WHERE id IN (SELECT id FROM)`
+* **Response:**
+    ```json
+    {
+      "isValidSQL": false,
+      "summary": "Subquery missing table name in FROM clause."
+    }
+    ```
+
+* **Query:** `SELECT a.col1, b.col2 FROM tableA a FULL JOIN tableB b ON a.id = b.id`
+* **Response:**
+    ```json
+    {
+      "isValidSQL": true,
+      "summary": "Valid FULL OUTER JOIN query with aliases."
+    }
+
+* **Query:** `SELECT 5 % 2`
+        * **Response:**
+        ```json
+        {
+  "isValidSQL": true,
+  "summary": "Valid arithmetic modulus operator."
+}
+        ```
+
+* **Query:** `SELECT 5 %% 2`
+        * **Response:**
+        ```json
+        {
+  "isValidSQL": false,
+  "summary": "Invalid operator '%%'. Spark uses single % for modulus."
+}
+        ```
+
+* **Query:** `SELECT id FROM a INTERSECT SELECT id FROM b`
+        * **Response:**
+        ```json
+        {
+  "isValidSQL": true,
+  "summary": "Valid INTERSECT set operation."
+}
+        ```
+
+* **Query:** `SELECT id FROM a INTERSECTS SELECT id FROM b`
+        * **Response:**
+        ```json
+        {
+  "isValidSQL": false,
+  "summary": "Invalid keyword 'INTERSECTS'; correct set operator is INTERSECT."
+}
+        ```
+
+* **Query:** `SELECT 'Spark' AS greeting`
+        * **Response:**
+        ```json
+        {
+  "isValidSQL": true,
+  "summary": "Valid string literal."
+}
+        ```
+
+* **Query:** `SELECT 'Unclosed string`
+        * **Response:**
+        ```json
+        {
+  "isValidSQL": false,
+  "summary": "Unterminated string literal."
+}
+        ```
+
+* **Query:** `SELECT TRUE AND FALSE`
+        * **Response:**
+        ```json
+        {
+  "isValidSQL": true,
+  "summary": "Valid logical AND operation on boolean literals."
+}
+        ```
+
+* **Query:** `SELECT TRUE && FALSE`
+        * **Response:**
+        ```json
+        {
+  "isValidSQL": false,
+  "summary": "Invalid logical operator '&&'; Spark SQL uses AND/OR."
+}
+        ```
+
+* **Query:** `SELECT * FROM t1 UNION ALL SELECT * FROM t2`
+        * **Response:**
+        ```json
+        {
+  "isValidSQL": true,
+  "summary": "Valid UNION ALL combining two compatible result sets."
+}
+        ```
+
+* **Query:** `SELECT * FROM t1 UNIONALL SELECT * FROM t2`
+        * **Response:**
+        ```json
+        {
+  "isValidSQL": false,
+  "summary": "UNION ALL must be written as two separate keywords."
+}
+        ```
+
+* **Query:** `SELECT dept, year, SUM(sales) FROM sales GROUP BY GROUPING SETS ((dept), (year))`
+        * **Response:**
+        ```json
+        {
+  "isValidSQL": true,
+  "summary": "Valid GROUPING SETS aggregation."
+}
+        ```
+
+* **Query:** `SELECT dept, year, SUM(sales) FROM sales GROUP BY GROUPING SETS dept`
+        * **Response:**
+        ```json
+        {
+  "isValidSQL": false,
+  "summary": "GROUPING SETS requires parentheses around each grouping set."
+}
+        ```
+
+* **Query:** `SELECT * FROM sales PIVOT (SUM(sales) FOR year IN (2023, 2024))`
+        * **Response:**
+        ```json
+        {
+  "isValidSQL": true,
+  "summary": "Valid PIVOT query aggregating yearly sales."
+}
+        ```
+
+* **Query:** `SELECT * FROM sales PIVOT year`
+        * **Response:**
+        ```json
+        {
+  "isValidSQL": false,
+  "summary": "Invalid PIVOT syntax; expected PIVOT (agg FOR col IN (...))."
+}
+        ```
+
+* **Query:** `VALUES (1, 'a'), (2, 'b') AS t(id, name)`
+        * **Response:**
+        ```json
+        {
+  "isValidSQL": true,
+  "summary": "Valid VALUES list with explicit alias and column names."
+}
+        ```
+
+* **Query:** `VALUES (1, 'a') (2, 'b')`
+        * **Response:**
+        ```json
+        {
+  "isValidSQL": false,
+  "summary": "Comma is required between VALUE tuples."
+}
+        ```
+
+* **Query:** `SELECT 1 / 0`
+        * **Response:**
+        ```json
+        {
+  "isValidSQL": false,
+  "summary": "Division by zero triggers an ANSI-mode runtime error."
+}
+        ```
+
+"""
+
+QUERY_VALIDATOR_PROMPT = build_validator_prompt(QUERY_CHECK_ITEMS, QUERY_EXAMPLES)
@@ -0,0 +1,140 @@
+from .validator_base import build_validator_prompt
+
+SESSION_CHECK_ITEMS = """\
+    - Check the command keyword is spelled correctly and complete (e.g., `EXPLAIN`, `CACHE TABLE`, `SET`, `USE`, `SHOW TABLES`, `DESCRIBE TABLE`, `MSCK REPAIR TABLE`).
+    - Check `SET key = value` provides both a configuration key and a value.
+    - Check commands that operate on an object (e.g., `USE`, `CACHE TABLE`, `DESCRIBE`) name that object, and that modifiers such as `FORMATTED` / `EXTENDED` are in their required position.
+    - Any embedded query (e.g., `EXPLAIN SELECT ...`, `CACHE TABLE t AS SELECT ...`) must itself be a valid Spark SQL query.
+
+"""
+
+SESSION_EXAMPLES = """\
+* **Query:** `EXPLAIN SELECT 1`
+        * **Response:**
+        ```json
+        {
+  "isValidSQL": true,
+  "summary": "Valid EXPLAIN to show query plan."
+}
+        ```
+
+* **Query:** `EXPLAN SELECT 1`
+        * **Response:**
+        ```json
+        {
+  "isValidSQL": false,
+  "summary": "Spelling error; correct keyword is EXPLAIN."
+}
+        ```
+
+* **Query:** `CACHE TABLE my_table`
+        * **Response:**
+        ```json
+        {
+  "isValidSQL": true,
+  "summary": "Valid caching of a table in memory."
+}
+        ```
+
+* **Query:** `CACHE my_table`
+        * **Response:**
+        ```json
+        {
+  "isValidSQL": false,
+  "summary": "CACHE requires the TABLE keyword."
+}
+        ```
+
+* **Query:** `SET spark.sql.shuffle.partitions = 200`
+        * **Response:**
+        ```json
+        {
+  "isValidSQL": true,
+  "summary": "Valid SET command adjusting a session configuration."
+}
+        ```
+
+* **Query:** `SET spark.sql.invalid.config =`
+        * **Response:**
+        ```json
+        {
+  "isValidSQL": false,
+  "summary": "Missing value after '=' for configuration setting."
+}
+        ```
+
+* **Query:** `USE sales_db`
+        * **Response:**
+        ```json
+        {
+  "isValidSQL": true,
+  "summary": "Valid USE to switch current database."
+}
+        ```
+
+* **Query:** `USE`
+        * **Response:**
+        ```json
+        {
+  "isValidSQL": false,
+  "summary": "USE requires a database name."
+}
+        ```
+
+* **Query:** `SHOW TABLES`
+        * **Response:**
+        ```json
+        {
+  "isValidSQL": true,
+  "summary": "Valid SHOW TABLES listing tables in the current database."
+}
+        ```
+
+* **Query:** `SHOW TABLE`
+        * **Response:**
+        ```json
+        {
+  "isValidSQL": false,
+  "summary": "Incorrect keyword; Spark uses SHOW TABLES."
+}
+        ```
+
+* **Query:** `DESCRIBE TABLE formatted my_table`
+        * **Response:**
+        ```json
+        {
+  "isValidSQL": true,
+  "summary": "Valid DESCRIBE TABLE with formatted option."
+}
+        ```
+
+* **Query:** `DESCRIBE my_table formatted`
+        * **Response:**
+        ```json
+        {
+  "isValidSQL": false,
+  "summary": "DESCRIBE TABLE or DESC TABLE keyword expected before table name."
+}
+        ```
+
+* **Query:** `MSCK REPAIR TABLE partitioned_tbl`
+        * **Response:**
+        ```json
+        {
+  "isValidSQL": true,
+  "summary": "Valid command to repair partition metadata."
+}
+        ```
+
+* **Query:** `MSCK TABLE partitioned_tbl`
+        * **Response:**
+        ```json
+        {
+  "isValidSQL": false,
+  "summary": "REPAIR keyword missing in MSCK REPAIR TABLE."
+}
+        ```
+
+"""
+
+SESSION_VALIDATOR_PROMPT = build_validator_prompt(SESSION_CHECK_ITEMS, SESSION_EXAMPLES)
@@ -0,0 +1,204 @@
+import argparse
+import json
+import logging
+from typing import AsyncIterator, List, Literal, Optional
+
+from fastapi import FastAPI, Request
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from pydantic import BaseModel, Field
+
+from .. import agent
+from ..custom_agent.latency_profiles import BALANCED, FAST, THOROUGH
+from ..custom_agent.model_tiering import ModelTierRouter
+from ..custom_agent.verdict import parse_verdict
+
+logger = logging.getLogger(__name__)
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+SSE_MEDIA_TYPE = "text/event-stream"
+PROMETHEUS_MEDIA_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+# Idle HTTP/1.1 connections are kept open this long so clients can reuse them between requests
+KEEP_ALIVE_SECONDS = 75
+MAX_BATCH_CONCURRENCY = 64
+
+
+LatencyProfileName = Literal[FAST, BALANCED, THOROUGH]
+
+
+class ValidateRequest(BaseModel):
+    query: str
+    # Stream parser, per-statement and final records instead of returning only the verdict
+    stream: bool = False
+    # Latency profile of the model calls; the service default when omitted
+    profile: Optional[LatencyProfileName] = None
+    # Answer within this many seconds, falling back to a parser-only verdict; the service default when omitted
+    timeout_seconds: Optional[float] = Field(default=None, gt=0)
+
+
+class BatchValidateRequest(BaseModel):
+    queries: List[str]
+    concurrency: int = Field(default=agent.DEFAULT_BATCH_CONCURRENCY, ge=1, le=MAX_BATCH_CONCURRENCY)
+    profile: Optional[LatencyProfileName] = None
+    # Applies to each query of the batch
+    timeout_seconds: Optional[float] = Field(default=None, gt=0)
+
+
+def _wants_sse(request: Request) -> bool:
+    return SSE_MEDIA_TYPE in request.headers.get("accept", "")
+
+
+async def _encode(records: AsyncIterator[dict], sse: bool) -> AsyncIterator[str]:
+    """Serialize records as NDJSON lines or as server-sent events."""
+    async for record in records:
+        data = json.dumps(record)
+        yield f"data: {data}\n\n" if sse else f"{data}\n"
+
+
+def _streaming_response(records: AsyncIterator[dict], request: Request) -> StreamingResponse:
+    sse = _wants_sse(request)
+    return StreamingResponse(_encode(records, sse), media_type=SSE_MEDIA_TYPE if sse else NDJSON_MEDIA_TYPE)
+
+
+async def validation_records(query: str, profile: Optional[str] = None,
+                             timeout_seconds: Optional[float] = None) -> AsyncIterator[dict]:
+    """
+    Validate one query and yield its progress as plain records:
+    a "parser" record per statement as soon as sqlglot has checked it, a "statement"
+    record per settled statement of a script, and a final "verdict" record.
+    """
+    final_response = None
+    async for event in agent.stream_validation(query, profile, timeout_seconds):
+        metadata = event.custom_metadata or {}
+        stage = metadata.get("stage")
+        if stage == "parser":
+            result = metadata["parser_result"]
+            yield {
+                "type": "parser",
+                "statement_index": metadata.get("statement_index"),
+                "valid": result["valid"],
+                "message": result["message"],
+            }
+        elif stage == "statement":
+            yield {"type": "statement", **metadata["statement"]}
+        elif event.is_final_response() and event.content and event.content.parts:
+            final_response = event.content.parts[0].text
+
+    verdict = parse_verdict(final_response)
+    if verdict is None:
+        verdict = {"isValidSQL": None, "summary": final_response or "No final response captured."}
+    yield {"type": "verdict", **verdict}
+
+
+async def batch_records(queries: List[str], concurrency: int, profile: Optional[str] = None,
+                        timeout_seconds: Optional[float] = None) -> AsyncIterator[dict]:
+    """Validate many queries and yield one "result" record per query as it finishes, then a "done" record."""
+    count = 0
+    async for index, verdict in agent.validate_many(queries, concurrency=concurrency, profile=profile,
+                                                    timeout_seconds=timeout_seconds):
+        count += 1
+        yield {"type": "result", "index": index, **verdict}
+    yield {"type": "done", "count": count}
+
+
+def create_app() -> FastAPI:
+    """
+    Build the validation service. Every request shares the Runner, agents and verdict
+    cache defined in agent.py.
+    """
+    app = FastAPI(title="Spark SQL Validator")
+
+    @app.get("/healthz")
+    async def healthz():
+        return {"status": "ok"}
+
+    @app.get("/readyz")
+    async def readyz():
+        # Ready before the agents are built: the first validation builds them (see agent.build_agents)
+        return {
+            "status": "ready",
+            "agents_built": agent.agents_built(),
+            "verdict_cache": agent.verdict_cache.stats(),
+            "single_flight": agent.single_flight.stats(),
+            "verdict_store": agent.verdict_store.stats() if agent.verdict_store is not None else None,
+            "model_tiering": agent.model_tiering.stats() if agent.model_tiering is not None else None,
+            "hedging": agent.hedged_model.stats() if agent.hedged_model is not None else None,
+            "circuit_breaker": agent.circuit_breaker.stats(),
+            "session_store": agent.session_service.stats() if agent.agents_built() else None,
+        }
+
+    @app.get("/metrics")
+    async def metrics():
+        return PlainTextResponse(agent.metrics.prometheus_text(), media_type=PROMETHEUS_MEDIA_TYPE)
+
+    @app.get("/metrics/summary")
+    async def metrics_summary():
+        return agent.metrics.snapshot()
+
+    @app.post("/validate")
+    async def validate(body: ValidateRequest, request: Request):
+        if body.stream or _wants_sse(request) or NDJSON_MEDIA_TYPE in request.headers.get("accept", ""):
+            return _streaming_response(validation_records(body.query, body.profile, body.timeout_seconds), request)
+        verdict = None
+        async for record in validation_records(body.query, body.profile, body.timeout_seconds):
+            verdict = record
+        verdict.pop("type")
+        return verdict
+
+    @app.post("/validate/batch")
+    async def validate_batch(body: BatchValidateRequest, request: Request):
+        return _streaming_response(batch_records(body.queries, body.concurrency, body.profile, body.timeout_seconds), request)
+
+    return app
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Serve Spark SQL validation over HTTP.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--fake-model", action="store_true",
+                        help="Answer every model call locally with FakeLlm instead of calling Gemini.")
+    parser.add_argument("--fake-latency", type=float, default=0.0,
+                        help="Seconds each FakeLlm call waits before answering.")
+    parser.add_argument("--fake-recordings", metavar="PATH",
+                        help="Replay model responses recorded with RecordingLlm from this JSON file.")
+    parser.add_argument("--verdict-store", metavar="PATH",
+                        help="Persist verdicts in this SQLite file so they survive restarts.")
+    parser.add_argument("--fingerprint-cache", action="store_true",
+                        help="Cache validator verdicts per literal-insensitive query fingerprint.")
+    parser.add_argument("--model-tiering", action="store_true",
+                        help="Pick the validator model by statement complexity (see agent.MODEL_TIERS).")
+    parser.add_argument("--latency-profile", choices=(FAST, BALANCED, THOROUGH),
+                        help="Latency profile of requests that don't pick one.")
+    parser.add_argument("--hedge", action="store_true",
+                        help="Hedge slow model validator calls with a second request (see agent.USE_HEDGING).")
+    parser.add_argument("--request-timeout", type=float,
+                        help="Seconds a validation may take before falling back to a parser-only verdict.")
+    args = parser.parse_args()
+
+    # Settings read when the agents are built, on the first request
+    if args.request_timeout:
+        agent.REQUEST_TIMEOUT_SECONDS = args.request_timeout
+    if args.latency_profile:
+        agent.DEFAULT_LATENCY_PROFILE = args.latency_profile
+    if args.fingerprint_cache:
+        agent.USE_FINGERPRINT_CACHE = True
+    if args.hedge:
+        agent.USE_HEDGING = True
+    if args.model_tiering:
+        agent.use_model_tiering(ModelTierRouter(agent.MODEL_TIERS, moderate_at=agent.MODEL_TIER_MODERATE_AT,
+                                                complex_at=agent.MODEL_TIER_COMPLEX_AT))
+
+    if args.verdict_store:
+        agent.use_verdict_store(args.verdict_store)
+
+    if args.fake_model:
+        from ..custom_agent.fake_llm import FakeLlm, load_recordings
+        recordings = load_recordings(args.fake_recordings) if args.fake_recordings else {}
+        agent.use_model_backend(FakeLlm(latency_seconds=args.fake_latency, recordings=recordings))
+
+    import uvicorn
+    uvicorn.run(create_app(), host=args.host, port=args.port, timeout_keep_alive=KEEP_ALIVE_SECONDS)
+
+
+if __name__ == "__main__":
+    main()
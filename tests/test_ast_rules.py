@@ -0,0 +1,41 @@
+import pytest
+
+from ..tools.ast_rules import RuleEngine
+from ..tools.syntax_validator import parse_sql
+
+
+def _evaluate(sql: str):
+    parsed = parse_sql(sql)
+    assert parsed.valid, parsed.message
+    return RuleEngine().evaluate(parsed.expression, parsed.tokens)
+
+
+@pytest.mark.parametrize("sql", [
+    "SELECT count(*) FILTER (WHERE status = 1) FROM t",
+    "SELECT k, sum(b) FILTER (WHERE c > 0) FROM t GROUP BY k",
+    "SELECT k, percentile_cont(0.5) WITHIN GROUP (ORDER BY x) FROM t GROUP BY k",
+    "SELECT k, count(*) FROM t GROUP BY k",
+    "SELECT a.x FROM a JOIN b ON TRUE",
+    "SELECT a.x FROM a JOIN b ON a.id = b.id JOIN c ON TRUE",
+    "SELECT a.x FROM a JOIN b USING (id)",
+    "SELECT a.x FROM a CROSS JOIN b",
+])
+def test_valid_statements_have_no_rule_verdict(sql):
+    assert _evaluate(sql) is None
+
+
+@pytest.mark.parametrize("sql, summary", [
+    ("SELECT a.x FROM a JOIN b", "JOIN clause missing ON condition."),
+    ("SELECT a.x FROM a JOIN b ON TRUE JOIN c", "JOIN clause missing ON condition."),
+    ("SELECT k, sum(b) FILTER (WHERE c > 0), d FROM t GROUP BY k",
+     "Column 'd' is not in the GROUP BY clause and is not aggregated."),
+    ("SELECT status, count(*) FILTER (WHERE status = 1) FROM t",
+     "Column 'status' must appear in a GROUP BY clause or be used in an aggregate function."),
+])
+def test_rule_violations(sql, summary):
+    assert _evaluate(sql) == {"isValidSQL": False, "summary": summary}
+
+
+def test_true_condition_without_tokens_is_left_to_the_model():
+    parsed = parse_sql("SELECT a.x FROM a JOIN b")
+    assert RuleEngine().evaluate(parsed.expression) is None
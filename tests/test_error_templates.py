@@ -0,0 +1,63 @@
+import pytest
+
+from .. import parser_only
+from ..tools.error_templates import interpret_syntax_error
+from ..tools.syntax_validator import parse_sql
+
+
+def _summary(sql: str):
+    parsed = parse_sql(sql)
+    assert parsed.valid is False
+    verdict = interpret_syntax_error(sql, parsed.errors)
+    return verdict and verdict["summary"]
+
+
+@pytest.mark.parametrize("sql", [
+    # The misspelled keyword comes before the token sqlglot highlights
+    "EXPLAN SELECT 1",
+    "SELECT a FROM t INTERSECTS SELECT b FROM u",
+    "SELECT a FROM t UNIONALL SELECT b FROM u",
+    "SELECT a b c FROM t",
+    # Highlight on the statement's first or last token
+    "SELECT explode()",
+    "USE",
+    "SELECT * FROM t WHERE (a = 1",
+    "SELECT a FROM t WHERE a IN (1, 2",
+    "SELECT a FROM t GROUP k",
+])
+def test_misleading_highlights_are_left_to_the_interpreter(sql):
+    assert _summary(sql) is None
+
+
+# Positions are those of the first character of the highlighted token
+@pytest.mark.parametrize("sql, summary", [
+    ("SELECT (a FROM t", "A closing parenthesis ')' is missing before 'FROM' at line 1, column 11."),
+    ("SELECT sum(a FROM t", "A closing parenthesis ')' is missing before 'FROM' at line 1, column 14."),
+    ("SELECT * FROM", "The FROM keyword is not followed by a table name at line 1, column 10."),
+    ("SELECT a FROM t JOIN", "The JOIN keyword is not followed by a table name at line 1, column 17."),
+    ("SELECT * FROM WHERE a = 1", "A table name is missing before 'WHERE' at line 1, column 15."),
+    ("SELECT a FROM t WHERE", "The query ends after 'WHERE' without the expression it requires at line 1, column 17."),
+    ("SELECT CAST(a AS) FROM t", "CAST is missing the target data type after AS at line 1, column 17."),
+    ("SELECT a FROM t)", "There is an unmatched closing parenthesis ')' at line 1, column 16."),
+    ("SELECT 'abc", "The string literal starting at line 1, column 8 is never closed."),
+])
+def test_template_summaries(sql, summary):
+    assert _summary(sql) == summary
+
+
+@pytest.mark.parametrize("script, summary", [
+    ("SELECT 1;\n\n  SELECT a,\n  b FROM", "The FROM keyword is not followed by a table name at line 4, column 5."),
+    ("SELECT 1;  SELECT (a FROM t", "A closing parenthesis ')' is missing before 'FROM' at line 1, column 22."),
+])
+def test_script_positions_refer_to_the_script(script, summary):
+    statement = parser_only.validate_query(script)["statements"][1]
+    assert statement["summary"] == summary
+
+
+@pytest.mark.parametrize("query, summary", [
+    ("\n\n  SELECT (a FROM t", "A closing parenthesis ')' is missing before 'FROM' at line 3, column 13."),
+    # A script that doesn't tokenize is validated whole
+    ("SELECT 1;\nSELECT 'abc", "The string literal starting at line 2, column 8 is never closed."),
+])
+def test_single_statement_positions_refer_to_the_input(query, summary):
+    assert parser_only.validate_query(query)["summary"] == summary
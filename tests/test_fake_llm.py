@@ -0,0 +1,24 @@
+import asyncio
+import json
+
+import pytest
+from google.adk.models.llm_request import LlmRequest
+from google.genai import types
+
+from ..custom_agent.fake_llm import FakeLlm
+from ..requirements.error_interpreter import ERROR_INTERPRETER_PROMPT
+from ..requirements.query_validator import QUERY_VALIDATOR_PROMPT
+
+
+async def _verdict(instruction: str) -> dict:
+    request = LlmRequest(config=types.GenerateContentConfig(system_instruction=instruction))
+    responses = [response async for response in FakeLlm().generate_content_async(request)]
+    return json.loads(responses[-1].content.parts[0].text)
+
+
+@pytest.mark.parametrize("instruction, valid", [
+    (QUERY_VALIDATOR_PROMPT, True),
+    (ERROR_INTERPRETER_PROMPT, False),
+])
+def test_default_verdict_follows_the_agent(instruction, valid):
+    assert asyncio.run(_verdict(instruction))["isValidSQL"] is valid
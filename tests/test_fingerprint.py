@@ -0,0 +1,36 @@
+import pytest
+
+from ..tools.fingerprint import query_fingerprint
+from ..tools.syntax_validator import parse_sql
+
+
+def _fingerprint(sql: str) -> str:
+    parsed = parse_sql(sql)
+    assert parsed.expression is not None, parsed.message
+    return query_fingerprint(parsed.expression)
+
+
+def test_parameter_values_share_a_fingerprint():
+    assert _fingerprint("SELECT a FROM t WHERE id = 1 AND name = 'x'") == \
+        _fingerprint("SELECT a FROM t WHERE id = 42 AND name = 'y'")
+
+
+@pytest.mark.parametrize("first, second", [
+    ("SHOW TABLES", "SHOW TABLE"),
+    ("SHOW TABLES", "SHOW FOOBAR BAZ"),
+    ("EXPLAIN SELECT 1", "EXPLAIN SELEC 1"),
+    ("MSCK REPAIR TABLE t", "MSCK REPAIR t garbage"),
+])
+def test_command_statements_keep_their_text(first, second):
+    assert _fingerprint(first) != _fingerprint(second)
+
+
+@pytest.mark.parametrize("first, second", [
+    ("SELECT date_add('2025-02-28', 1)", "SELECT date_add('2025-02-30', 1)"),
+    ("SELECT add_months('2025-02-28', 1)", "SELECT add_months('2025-02-30', 1)"),
+    ("SELECT make_timestamp(2025, 2, 28, 1, 1, 1)", "SELECT make_timestamp(2025, 2, 30, 1, 1, 1)"),
+    ("SELECT date_format('2025-02-28', 'yyyy')", "SELECT date_format('2025-02-30', 'yyyy')"),
+    ("SELECT datediff('2025-02-28', '2025-01-01')", "SELECT datediff('2025-02-30', '2025-01-01')"),
+])
+def test_date_literals_keep_their_value(first, second):
+    assert _fingerprint(first) != _fingerprint(second)
@@ -0,0 +1,24 @@
+import asyncio
+
+from google.adk.models.llm_request import LlmRequest
+
+from ..custom_agent.fake_llm import FakeLlm
+from ..custom_agent.hedging import HedgedLlm
+
+
+def test_cancelled_slow_attempt_is_timed():
+    delays = iter([0.5, 0.01])
+    inner = FakeLlm(latency=lambda rng: next(delays))
+    hedged = HedgedLlm(inner=inner, initial_delay_seconds=0.05, max_extra_ratio=1.0)
+
+    async def call():
+        responses = [response async for response in hedged.generate_content_async(LlmRequest())]
+        # Let the cancelled primary record its time
+        await asyncio.sleep(0)
+        return responses
+
+    assert asyncio.run(call())
+    assert (hedged.hedges_fired, hedged.hedges_won) == (1, 1)
+    # The hedge's own latency and, as a lower bound, the time the primary ran before it was cancelled
+    assert len(hedged._latencies) == 2
+    assert max(hedged._latencies) >= 0.05
@@ -0,0 +1,33 @@
+from ..tools.literal_compaction import compact_literals
+from ..tools.syntax_validator import parse_sql
+
+
+def _in_list(count: int) -> str:
+    return "(" + ", ".join(str(i) for i in range(count)) + ")"
+
+
+def test_positions_after_a_single_line_marker_map_back():
+    sql = f"SELECT a FROM t WHERE id IN {_in_list(40)} AND b IN {_in_list(30)} AND c = 1"
+    compacted = compact_literals(parse_sql(sql))
+    col = compacted.sql.index("c = 1") + 1
+    assert compacted.original_position(1, col) == (1, sql.index("c = 1") + 1)
+    assert compacted.restore_positions(f"Unexpected token at line 1, column {col}.") == \
+        f"Unexpected token at line 1, column {sql.index('c = 1') + 1}."
+    # Text before the first marker doesn't move
+    assert compacted.original_position(1, 5) == (1, 5)
+
+
+def test_elisions_record_where_each_list_starts():
+    sql = f"SELECT a\nFROM t\nWHERE id IN {_in_list(40)}"
+    compacted = compact_literals(parse_sql(sql))
+    (elision,) = compacted.elisions
+    assert (elision.line, elision.col, elision.kept, elision.elided) == (3, 14, 3, 37)
+
+
+def test_multi_line_lists_keep_the_columns_after_them():
+    items = ",\n".join(str(i) for i in range(40))
+    sql = f"SELECT a FROM t WHERE id IN ({items}) AND c = 1"
+    compacted = compact_literals(parse_sql(sql))
+    assert compacted.shifts == ()
+    line = sql.count("\n", 0, sql.index("c = 1")) + 1
+    assert compacted.sql.splitlines()[line - 1].index("c = 1") == sql.splitlines()[line - 1].index("c = 1")
@@ -0,0 +1,39 @@
+import json
+
+import pytest
+
+from .. import parser_only
+
+
+def _run(tmp_path, capsys, sql):
+    path = tmp_path / "query.sql"
+    path.write_text(sql, encoding="utf-8")
+    status = parser_only.main([str(path)])
+    return status, json.loads(capsys.readouterr().out)
+
+
+@pytest.mark.parametrize("sql", [
+    "SELECT MAP('k1', 1, 'k2')",
+    "SELECT 1 FROM t;\nSELECT MAP('k1', 1, 'k2');",
+])
+def test_undecided_input_does_not_fail_the_run(tmp_path, capsys, sql):
+    status, verdict = _run(tmp_path, capsys, sql)
+    assert verdict["isValidSQL"] is None
+    assert status == 0
+
+
+@pytest.mark.parametrize("sql", [
+    "SELECT (a FROM t",
+    "SELECT 1 FROM t;\nSELECT (a FROM t;",
+])
+def test_invalid_input_fails_the_run(tmp_path, capsys, sql):
+    status, verdict = _run(tmp_path, capsys, sql)
+    assert verdict["isValidSQL"] is False
+    assert status == 1
+
+
+def test_valid_input_is_a_parser_only_verdict(tmp_path, capsys):
+    status, verdict = _run(tmp_path, capsys, "SELECT a FROM t")
+    assert status == 0
+    assert verdict == {"path": str(tmp_path / "query.sql"), "isValidSQL": True, "summary": "SQL syntax is valid.",
+                       "tier": "parser-only", "reason": parser_only.MODEL_DISABLED}
@@ -0,0 +1,68 @@
+import asyncio
+
+import pytest
+
+from ..custom_agent.prompt_cache import InMemoryCachedContentBackend, PromptCacheManager
+
+MODEL = "gemini-2.5-flash"
+PROMPT = "Validate Spark SQL. " * 10
+
+
+class _FailingBackend(InMemoryCachedContentBackend):
+    def __init__(self, clock):
+        super().__init__(clock)
+        self.attempts = 0
+        self.fail = True
+
+    async def create(self, model: str, system_instruction: str, ttl_seconds: float) -> str:
+        self.attempts += 1
+        if self.fail:
+            raise RuntimeError("cached content quota exceeded")
+        return await super().create(model, system_instruction, ttl_seconds)
+
+
+def _manager(backend, now):
+    return PromptCacheManager(backend, ttl_seconds=600, refresh_margin_seconds=60, failure_backoff_seconds=120,
+                              clock=lambda: now[0])
+
+
+def test_handle_is_reused_then_refreshed_before_expiry():
+    now = [0.0]
+    backend = InMemoryCachedContentBackend(clock=lambda: now[0])
+    manager = _manager(backend, now)
+    name = asyncio.run(manager.handle_for("agent", MODEL, PROMPT))
+    now[0] = 500.0
+    assert asyncio.run(manager.handle_for("agent", MODEL, PROMPT)) == name
+    now[0] = 560.0
+    assert asyncio.run(manager.handle_for("agent", MODEL, PROMPT)) == name
+    assert (backend.created, backend.refreshed, manager.hits, manager.refreshes) == (1, 1, 1, 1)
+    # The refresh extended the handle's lifetime past its first expiry
+    assert backend.lookup(name) == PROMPT and manager.stats()["handles"] == 1
+
+
+def test_changed_prompt_gets_a_new_handle():
+    now = [0.0]
+    backend = InMemoryCachedContentBackend(clock=lambda: now[0])
+    manager = _manager(backend, now)
+    first = asyncio.run(manager.handle_for("agent", MODEL, PROMPT))
+    second = asyncio.run(manager.handle_for("agent", MODEL, PROMPT + "Reject missing FROM clauses."))
+    assert first != second
+    assert backend.lookup(first) is None
+    assert (backend.created, backend.deleted, manager.invalidations) == (2, 1, 1)
+
+
+def test_failed_create_backs_off_before_trying_again():
+    now = [0.0]
+    backend = _FailingBackend(clock=lambda: now[0])
+    manager = _manager(backend, now)
+    with pytest.raises(RuntimeError):
+        asyncio.run(manager.handle_for("agent", MODEL, PROMPT))
+    now[0] = 60.0
+    assert asyncio.run(manager.handle_for("agent", MODEL, PROMPT)) is None
+    assert backend.attempts == 1
+    # A different prompt isn't held back by the failure
+    backend.fail = False
+    assert asyncio.run(manager.handle_for("agent", MODEL, PROMPT + "v2")) is not None
+    now[0] = 121.0
+    assert asyncio.run(manager.handle_for("agent", MODEL, PROMPT)) is not None
+    assert (manager.create_failures, manager.backoff_skips, backend.attempts) == (1, 1, 3)
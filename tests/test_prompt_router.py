@@ -0,0 +1,31 @@
+import pytest
+
+from ..tools.prompt_router import FUNCTIONS, QUERY, classify_statement
+from ..tools.syntax_validator import parse_sql
+
+
+def _classify(sql: str) -> str:
+    parsed = parse_sql(sql)
+    assert parsed.valid, parsed.message
+    return classify_statement(parsed.expression)
+
+
+@pytest.mark.parametrize("sql", [
+    "SELECT COALESCE(a, 0), lower(b), upper(c), trim(d) FROM t",
+    "SELECT CAST(a AS INT), round(price, 2), current_date(), current_timestamp() FROM t",
+    "SELECT concat(first, ' ', last) FROM t WHERE active AND NOT deleted OR admin",
+    "SELECT k, count(*), CASE WHEN k > 1 THEN 'a' ELSE 'b' END FROM t GROUP BY k",
+])
+def test_common_functions_use_the_query_prompt(sql):
+    assert _classify(sql) == QUERY
+
+
+@pytest.mark.parametrize("sql", [
+    "SELECT CAST('2025-02-30' AS DATE)",
+    "SELECT CAST(-1 AS TINYINT)",
+    "SELECT sha2('Spark', 257)",
+    "SELECT array_contains(array(1, 2, 3), 2)",
+    "SELECT name FROM users WHERE name RLIKE '['",
+])
+def test_catalog_functions_and_literal_casts_use_the_functions_prompt(sql):
+    assert _classify(sql) == FUNCTIONS
@@ -0,0 +1,38 @@
+import json
+
+import pytest
+
+from ..custom_agent.verdict import PARSER_ONLY, parse_verdict, script_verdict, statement_result
+from ..tools.statement_splitter import split_statements
+
+
+def _script(*verdicts):
+    statements = split_statements(";\n".join(f"SELECT {index}" for index in range(len(verdicts))))
+    return script_verdict([statement_result(statement, verdict) for statement, verdict in zip(statements, verdicts)])
+
+
+VALID = {"isValidSQL": True, "summary": "ok"}
+INVALID = {"isValidSQL": False, "summary": "bad"}
+UNDECIDED = {"isValidSQL": None, "summary": "Parser failure", "tier": PARSER_ONLY, "reason": "model_disabled"}
+
+
+@pytest.mark.parametrize("verdicts, expected", [
+    ((VALID, VALID), True),
+    ((VALID, INVALID), False),
+    ((VALID, UNDECIDED), None),
+    ((UNDECIDED, INVALID), False),
+    ((UNDECIDED, UNDECIDED), None),
+])
+def test_script_verdict_is_three_valued(verdicts, expected):
+    assert _script(*verdicts)["isValidSQL"] is expected
+
+
+def test_undecided_script_verdict_survives_parsing():
+    verdict = _script(VALID, {"isValidSQL": None, "summary": "Validation failed: boom"})
+    assert verdict["summary"] == "1 of 2 statements could not be validated."
+    assert parse_verdict(json.dumps(verdict))["isValidSQL"] is None
+
+
+def test_parser_only_statement_marks_the_script():
+    verdict = _script(VALID, UNDECIDED)
+    assert verdict["tier"] == PARSER_ONLY and verdict["reason"] == "model_disabled"
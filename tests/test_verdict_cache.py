@@ -0,0 +1,26 @@
+import pytest
+
+from ..custom_agent.verdict_cache import verdict_cache_key
+
+
+def _key(sql: str) -> str:
+    return verdict_cache_key(sql, "model", "prompt")
+
+
+def test_whitespace_comments_and_keyword_case_share_a_key():
+    assert _key("SELECT id FROM users WHERE age > 30") == \
+        _key("select  id\nfrom users -- adults\nwhere age > 30")
+
+
+@pytest.mark.parametrize("first, second", [
+    ("SELECT name AS age FROM employees", "SELECT name age FROM employees"),
+    ("SELECT a.x FROM a JOIN b ON TRUE", "SELECT a.x FROM a JOIN b"),
+    ("SELECT CAST(x AS INT) FROM t", "SELECT INT(x) FROM t"),
+    ("TRUNCATE TABLE sales", "TRUNCATE sales"),
+    ("INSERT INTO t VALUES (1)", "INSERT t VALUES (1)"),
+    ("CACHE TABLE t", "CACHE t"),
+    ("SELECT 'a' FROM t", "SELECT a FROM t"),
+    ("SELECT `a` FROM t", "SELECT a FROM t"),
+])
+def test_spellings_the_parser_normalizes_keep_their_own_key(first, second):
+    assert _key(first) != _key(second)
@@ -0,0 +1,231 @@
+from typing import Iterable, Iterator, Optional, Sequence
+
+from sqlglot import exp
+from sqlglot.tokens import Token, TokenType
+
+
+def _own_nodes(select: exp.Select, nodes, kind) -> Iterator[exp.Expression]:
+    """Yield nodes of the given type under nodes that belong to select itself, not to a nested subquery."""
+    if nodes is None:
+        return
+    if isinstance(nodes, exp.Expression):
+        nodes = [nodes]
+    for node in nodes:
+        for found in node.find_all(kind):
+            if found.find_ancestor(exp.Select) is select:
+                yield found
+
+
+def _is_aggregate(node: exp.Expression) -> bool:
+    """True if node is an aggregate call that is not evaluated as a window function."""
+    return isinstance(node, exp.AggFunc) and not isinstance(node.parent, exp.Window)
+
+
+def _inside(node: exp.Expression, kinds, stop: exp.Expression) -> bool:
+    """True if node has an ancestor of the given types below stop."""
+    parent = node.parent
+    while parent is not None and parent is not stop:
+        if isinstance(parent, kinds):
+            return True
+        parent = parent.parent
+    return False
+
+
+class Rule:
+    """
+    A deterministic structural check over a parsed Spark SQL statement.
+
+    Subclasses implement check() and return a syntax-error summary when the
+    statement definitely violates the rule, or None when the rule has nothing
+    definite to say (the statement may still be invalid for other reasons).
+    `tokens` are the statement's tokens, for rules that need what the AST
+    doesn't keep; it is empty when the caller doesn't have them.
+    """
+
+    name: str = "rule"
+
+    def check(self, expression: exp.Expression, tokens: Sequence[Token] = ()) -> Optional[str]:
+        raise NotImplementedError
+
+
+class SelectRule(Rule):
+    """A rule evaluated independently on every SELECT in the statement, including subqueries and CTEs."""
+
+    def check(self, expression: exp.Expression, tokens: Sequence[Token] = ()) -> Optional[str]:
+        for select in expression.find_all(exp.Select):
+            summary = self.check_select(select)
+            if summary:
+                return summary
+        return None
+
+    def check_select(self, select: exp.Select) -> Optional[str]:
+        raise NotImplementedError
+
+
+class JoinWithoutConditionRule(Rule):
+    """JOIN must be followed by ON or USING unless it is a CROSS or NATURAL join."""
+
+    name = "join_without_condition"
+
+    def check(self, expression: exp.Expression, tokens: Sequence[Token] = ()) -> Optional[str]:
+        # The Spark dialect fills a bare JOIN with a synthetic ON TRUE, which the AST can't tell
+        # from an explicit `ON TRUE`; only joins beyond the explicit ones in the tokens are bare.
+        true_conditions = 0
+        for select in expression.find_all(exp.Select):
+            for join in select.args.get("joins") or []:
+                if join.args.get("kind") == "CROSS" or join.args.get("method") or join.args.get("using"):
+                    continue
+                if isinstance(join.this, (exp.Lateral, exp.Unnest)):
+                    continue
+                on = join.args.get("on")
+                if on is None:
+                    return "JOIN clause missing ON condition."
+                if isinstance(on, exp.Boolean) and on.this is True:
+                    true_conditions += 1
+        if not tokens:
+            # Without the tokens a TRUE condition is left to the model
+            return None
+        explicit = sum(1 for current, following in zip(tokens, tokens[1:])
+                       if current.token_type == TokenType.ON and following.token_type == TokenType.TRUE)
+        if true_conditions > explicit:
+            return "JOIN clause missing ON condition."
+        return None
+
+
+class SelectAliasReferenceRule(SelectRule):
+    """SELECT aliases cannot be referenced from the WHERE or HAVING clause of the same query."""
+
+    name = "select_alias_reference"
+
+    def check_select(self, select: exp.Select) -> Optional[str]:
+        aliases = {}
+        for projection in select.expressions:
+            if isinstance(projection, exp.Alias) and projection.alias:
+                aliases[projection.alias.lower()] = projection.this
+        if not aliases:
+            return None
+
+        # An alias that shadows a real column name (e.g. `amount * 2 AS amount`) refers
+        # to that column in WHERE/HAVING, so such aliases are never reported.
+        source_columns = {column.name.lower() for column in _own_nodes(select, select.expressions, exp.Column)}
+        group = select.args.get("group")
+        grouped = {column.name.lower() for column in _own_nodes(select, group, exp.Column)}
+
+        for clause in ("where", "having"):
+            for column in _own_nodes(select, select.args.get(clause), exp.Column):
+                name = column.name.lower()
+                if column.table or name not in aliases or name in source_columns:
+                    continue
+                if clause == "where":
+                    return f"Column alias '{column.name}' defined in SELECT cannot be referenced in the WHERE clause."
+                if name not in grouped:
+                    replacement = aliases[name].sql(dialect="spark")
+                    return f"Invalid HAVING clause. {column.name} must be replaced with {replacement} unless aliased in a subquery or CTE."
+        return None
+
+
+class WindowInWhereRule(SelectRule):
+    """Window functions are evaluated after filtering and cannot appear in WHERE."""
+
+    name = "window_in_where"
+
+    def check_select(self, select: exp.Select) -> Optional[str]:
+        for _ in _own_nodes(select, select.args.get("where"), exp.Window):
+            return "Window functions are not allowed in the WHERE clause."
+        return None
+
+
+class UnqualifiedJoinColumnRule(SelectRule):
+    """Columns in the ON clause of a multi-table query must be qualified with a table name or alias."""
+
+    name = "unqualified_join_column"
+
+    def check_select(self, select: exp.Select) -> Optional[str]:
+        joins = select.args.get("joins") or []
+        if not joins:
+            return None
+        for join in joins:
+            for column in _own_nodes(select, join.args.get("on"), exp.Column):
+                if not column.table:
+                    return (
+                        f"Ambiguous column reference: '{column.name}' in ON clause could refer to multiple tables. "
+                        "Qualify it with a table alias."
+                    )
+        return None
+
+
+class AggregateWithoutGroupByRule(SelectRule):
+    """Non-aggregated columns selected next to an aggregate must appear in GROUP BY."""
+
+    name = "aggregate_without_group_by"
+
+    def check_select(self, select: exp.Select) -> Optional[str]:
+        projections = select.expressions
+        if not any(_is_aggregate(node) for node in _own_nodes(select, projections, exp.AggFunc)):
+            return None
+
+        group = select.args.get("group")
+        grouped = None
+        if group is not None:
+            # Positional, alias-based and GROUP BY ALL groupings can't be matched structurally.
+            if group.args.get("all") or any(isinstance(node, exp.Literal) for node in group.expressions):
+                return None
+            grouped = {column.name.lower() for column in _own_nodes(select, group, exp.Column)}
+            aliases = {projection.alias.lower() for projection in select.expressions if isinstance(projection, exp.Alias)}
+            if grouped & aliases:
+                return None
+
+        for column in _own_nodes(select, projections, exp.Column):
+            if isinstance(column.this, exp.Star):
+                continue
+            # FILTER (WHERE ...) and WITHIN GROUP (ORDER BY ...) belong to their aggregate
+            if _inside(column, (exp.AggFunc, exp.Window, exp.Lambda, exp.Filter, exp.WithinGroup), select):
+                continue
+            if grouped is None:
+                return f"Column '{column.sql(dialect='spark')}' must appear in a GROUP BY clause or be used in an aggregate function."
+            if column.name.lower() not in grouped:
+                return f"Column '{column.sql(dialect='spark')}' is not in the GROUP BY clause and is not aggregated."
+        return None
+
+
+DEFAULT_RULES = (
+    JoinWithoutConditionRule(),
+    SelectAliasReferenceRule(),
+    WindowInWhereRule(),
+    UnqualifiedJoinColumnRule(),
+    AggregateWithoutGroupByRule(),
+)
+
+
+class RuleEngine:
+    """
+    Runs structural rules over a parsed statement to settle verdicts without an LLM call.
+
+    Rules can only prove a statement invalid; when none of them fires the
+    statement still needs model validation.
+    """
+
+    def __init__(self, rules: Optional[Iterable[Rule]] = None):
+        self.rules = list(DEFAULT_RULES if rules is None else rules)
+
+    def register(self, rule: Rule) -> None:
+        """Add a rule; rules run in registration order and the first violation wins."""
+        self.rules.append(rule)
+
+    def evaluate(self, expression: exp.Expression, tokens: Sequence[Token] = ()) -> Optional[dict]:
+        """
+        Evaluate every rule against the statement.
+
+        Parameters:
+            expression (exp.Expression): The statement as returned by sqlglot.parse_one.
+            tokens (Sequence[Token]): The statement's tokens (ParseResult.tokens), if available.
+
+        Returns:
+            dict | None: A {"isValidSQL": False, "summary": ...} verdict for the first
+                         violated rule, or None if no rule gives a definite answer.
+        """
+        for rule in self.rules:
+            summary = rule.check(expression, tokens)
+            if summary:
+                return {"isValidSQL": False, "summary": summary}
+        return None
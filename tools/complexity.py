@@ -0,0 +1,129 @@
+from dataclasses import dataclass
+
+from sqlglot import exp
+
+from .syntax_validator import expression_types
+
+# Complexity tiers, from the cheapest model to the strongest
+SIMPLE = "simple"
+MODERATE = "moderate"
+COMPLEX = "complex"
+TIERS = (SIMPLE, MODERATE, COMPLEX)
+
+# Default score thresholds: scores at or above them move a statement up a tier
+DEFAULT_MODERATE_AT = 8.0
+DEFAULT_COMPLEX_AT = 24.0
+
+# Score weights
+_NODES_PER_POINT = 25
+_NESTING_WEIGHT = 3.0
+# AST depth up to this is normal for a flat query; deeper expression nesting (CASE in CASE, nested calls) adds points
+_PLAIN_DEPTH = 8
+_DEPTH_WEIGHT = 0.5
+_JOIN_WEIGHT = 2.0
+_CTE_WEIGHT = 2.0
+_SET_OPERATION_WEIGHT = 2.0
+_WINDOW_WEIGHT = 2.0
+_ADVANCED_WEIGHT = 3.0
+
+
+_SET_OPERATION_TYPES = expression_types("Union", "Intersect", "Except")
+# Constructs whose Spark syntax is easy to get subtly wrong
+_ADVANCED_TYPES = expression_types("Pivot", "Lateral", "Lambda", "Cube", "Rollup", "GroupingSets", "Explode",
+                                   "Posexplode", "Transform", "Merge", "When")
+
+
+@dataclass(frozen=True)
+class QueryComplexity:
+    """Structural features of a parsed statement and the complexity score derived from them."""
+
+    nodes: int
+    # Deepest path from the root to a leaf of the AST
+    depth: int
+    # Deepest nesting of queries inside queries (subqueries, CTE bodies); 1 for a flat query
+    nesting: int
+    joins: int
+    ctes: int
+    set_operations: int
+    window_functions: int
+    advanced_constructs: int
+
+    @property
+    def score(self) -> float:
+        return (
+            self.nodes / _NODES_PER_POINT
+            + _NESTING_WEIGHT * max(0, self.nesting - 1)
+            + _DEPTH_WEIGHT * max(0, self.depth - _PLAIN_DEPTH)
+            + _JOIN_WEIGHT * self.joins
+            + _CTE_WEIGHT * self.ctes
+            + _SET_OPERATION_WEIGHT * self.set_operations
+            + _WINDOW_WEIGHT * self.window_functions
+            + _ADVANCED_WEIGHT * self.advanced_constructs
+        )
+
+    def as_dict(self) -> dict:
+        return {
+            "nodes": self.nodes,
+            "depth": self.depth,
+            "nesting": self.nesting,
+            "joins": self.joins,
+            "ctes": self.ctes,
+            "set_operations": self.set_operations,
+            "window_functions": self.window_functions,
+            "advanced_constructs": self.advanced_constructs,
+            "score": self.score,
+        }
+
+
+def score_query(expression: exp.Expression) -> QueryComplexity:
+    """
+    Measure a parsed statement in one walk over its AST.
+
+    Parameters:
+        expression (exp.Expression): The statement as returned by the parser.
+
+    Returns:
+        QueryComplexity: Node count, depths, construct counts and the resulting score.
+    """
+    nodes = depth = nesting = 0
+    counts = {"joins": 0, "ctes": 0, "set_operations": 0, "window_functions": 0, "advanced_constructs": 0}
+    stack = [(expression, 1, 0)]
+    while stack:
+        node, node_depth, queries = stack.pop()
+        nodes += 1
+        depth = max(depth, node_depth)
+        if isinstance(node, exp.Select):
+            queries += 1
+            nesting = max(nesting, queries)
+        if isinstance(node, exp.Join):
+            counts["joins"] += 1
+        elif isinstance(node, exp.CTE):
+            counts["ctes"] += 1
+        elif isinstance(node, _SET_OPERATION_TYPES):
+            counts["set_operations"] += 1
+        elif isinstance(node, exp.Window):
+            counts["window_functions"] += 1
+        elif isinstance(node, _ADVANCED_TYPES):
+            counts["advanced_constructs"] += 1
+        stack.extend((child, node_depth + 1, queries) for child in node.iter_expressions())
+    return QueryComplexity(nodes=nodes, depth=depth, nesting=nesting, **counts)
+
+
+def complexity_tier(complexity: QueryComplexity, moderate_at: float = DEFAULT_MODERATE_AT,
+                    complex_at: float = DEFAULT_COMPLEX_AT) -> str:
+    """
+    Map a complexity score to SIMPLE, MODERATE or COMPLEX.
+
+    Parameters:
+        complexity (QueryComplexity): The measured statement.
+        moderate_at (float): Lowest score of a MODERATE statement.
+        complex_at (float): Lowest score of a COMPLEX statement.
+
+    Returns:
+        str: The statement's tier.
+    """
+    if complexity.score >= complex_at:
+        return COMPLEX
+    if complexity.score >= moderate_at:
+        return MODERATE
+    return SIMPLE
@@ -0,0 +1,168 @@
+from typing import List, Optional, Tuple
+
+import sqlglot
+from sqlglot.errors import TokenError
+from sqlglot.tokens import Token, TokenType
+
+_QUOTE_KINDS = {
+    "'": "string literal",
+    '"': "string literal",
+    "`": "quoted identifier",
+}
+
+# Token types of names (identifiers, aliases, function names, misspelled keywords) rather than keywords or punctuation
+_NAME_TYPES = (TokenType.VAR, TokenType.IDENTIFIER)
+
+
+def _position(sql: str, offset: int) -> Tuple[int, int]:
+    """Return the 1-based (line, column) of a character offset."""
+    line = sql.count("\n", 0, offset) + 1
+    column = offset - (sql.rfind("\n", 0, offset) + 1) + 1
+    return line, column
+
+
+def _start_column(error: dict) -> int:
+    """Column at which the highlighted token starts; sqlglot's own `col` is the column of its last character."""
+    column = error.get("col")
+    highlight = error.get("highlight") or ""
+    if not highlight or "\n" in highlight:
+        return column
+    return max(1, column - len(highlight) + 1)
+
+
+def _script_position(line: int, column: int, start_line: int, start_column: int) -> Tuple[int, int]:
+    """Turn a (line, column) within a statement into one within the script the statement starts in at (start_line, start_column)."""
+    if line == 1:
+        column += start_column - 1
+    return line + start_line - 1, column
+
+
+def _unterminated_token(sql: str) -> Optional[Tuple[str, int]]:
+    """
+    Find a string literal, quoted identifier or block comment that is never closed.
+
+    Returns:
+        tuple | None: (kind, offset of the opening character), or None if every
+                      quote and comment is closed.
+    """
+    i, length = 0, len(sql)
+    while i < length:
+        char = sql[i]
+        if char == "-" and sql.startswith("--", i):
+            newline = sql.find("\n", i)
+            i = length if newline == -1 else newline + 1
+        elif char == "/" and sql.startswith("/*", i):
+            close = sql.find("*/", i + 2)
+            if close == -1:
+                return "block comment", i
+            i = close + 2
+        elif char in _QUOTE_KINDS:
+            j = i + 1
+            while j < length:
+                if sql[j] == "\\" and char != "`":
+                    j += 2
+                    continue
+                if sql[j] == char:
+                    if sql.startswith(char * 2, j):
+                        j += 2
+                        continue
+                    break
+                j += 1
+            if j >= length:
+                return _QUOTE_KINDS[char], i
+            i = j + 1
+        else:
+            i += 1
+    return None
+
+
+def _tokens(text: str) -> List[Token]:
+    """Tokenize a fragment of the statement; an empty list if it doesn't tokenize (e.g. cut inside a string)."""
+    try:
+        return sqlglot.tokenize(text, read="spark")
+    except TokenError:
+        return []
+
+
+def _is_keyword(text: str) -> bool:
+    """True if text is a single keyword such as WHERE or FROM, not a name or punctuation."""
+    tokens = _tokens(text)
+    return text.isalpha() and len(tokens) == 1 and tokens[0].token_type not in _NAME_TYPES
+
+
+def _template_for(error: dict, where: str) -> Optional[str]:
+    """
+    Build a summary for one structured sqlglot ParseError entry, or None if no template applies.
+
+    sqlglot highlights the token at which it gave up, which is often not the one at fault:
+    after a misspelled keyword (EXPLAN, UNIONALL) it blames the next token, and at the start
+    or end of a statement the highlight says little about what is missing. Those cases are
+    left to the error interpreter; only shapes whose wording holds get a template.
+    """
+    description = error.get("description") or ""
+    highlight = (error.get("highlight") or "").strip()
+    before = _tokens(error.get("start_context") or "")
+    first = not before
+    last = not (error.get("end_context") or "").strip()
+    after_name = bool(before) and before[-1].token_type in _NAME_TYPES
+
+    if description.startswith("Expected TYPE after CAST"):
+        return f"CAST is missing the target data type after AS {where}."
+    if first:
+        return None
+    if description.startswith("Expected table name"):
+        if highlight.upper() in ("FROM", "JOIN") and last:
+            return f"The {highlight.upper()} keyword is not followed by a table name {where}."
+        if last or after_name:
+            return None
+        return f"A table name is missing before '{highlight}' {where}."
+    if description.startswith("Required keyword"):
+        # A clause keyword ending the statement (`... WHERE`) is the only shape where the missing part is clear
+        if last and _is_keyword(highlight):
+            return f"The query ends after '{highlight}' without the expression it requires {where}."
+        return None
+    if description.startswith("Invalid expression / Unexpected token") and highlight == ")":
+        return f"There is an unmatched closing parenthesis ')' {where}."
+    if last:
+        return None
+    if description.startswith("Expecting )") and _is_keyword(highlight):
+        # `sum(a FROM t`: the keyword starts the next clause, so the parenthesis belongs right before it
+        return f"A closing parenthesis ')' is missing before '{highlight}' {where}."
+    if after_name:
+        return None
+    if description.startswith("Expecting ("):
+        return f"An opening parenthesis '(' is missing near '{highlight}' {where}."
+    if description.startswith("Invalid expression / Unexpected token"):
+        return f"Unexpected token '{highlight}' {where}."
+    return None
+
+
+def interpret_syntax_error(sql: str, errors: List[dict], start_line: int = 1, start_column: int = 1) -> Optional[dict]:
+    """
+    Turn sqlglot's structured parse errors into a verdict without calling an LLM.
+
+    Covers the common error classes: unexpected tokens, missing table names after
+    FROM/JOIN, unbalanced parentheses and unterminated strings, quoted identifiers
+    or comments. Anything else returns None and is left to the error interpreter agent.
+
+    Parameters:
+        sql (str): The SQL query that failed to parse.
+        errors (list): The `errors` list of a sqlglot ParseError (empty for tokenizer errors).
+        start_line (int): Line of the script on which sql starts, so positions refer to the script.
+        start_column (int): Column of the script's line at which sql starts.
+
+    Returns:
+        dict | None: A {"isValidSQL": False, "summary": ...} verdict, or None if no template applies.
+    """
+    unterminated = _unterminated_token(sql)
+    if unterminated is not None:
+        kind, offset = unterminated
+        line, column = _script_position(*_position(sql, offset), start_line, start_column)
+        return {"isValidSQL": False, "summary": f"The {kind} starting at line {line}, column {column} is never closed."}
+    if not errors:
+        return None
+    line, column = _script_position(errors[0].get("line"), _start_column(errors[0]), start_line, start_column)
+    summary = _template_for(errors[0], f"at line {line}, column {column}")
+    if summary is None:
+        return None
+    return {"isValidSQL": False, "summary": summary}
@@ -0,0 +1,68 @@
+from sqlglot import exp
+
+from .syntax_validator import expression_types
+
+
+# Expressions whose literal arguments can make a statement invalid on their own: cast
+# ranges and date validity, regex patterns, format strings, sha2 bit lengths,
+# percentiles and division by a zero literal. Literals under them are kept verbatim.
+_LITERAL_SENSITIVE_TYPES = expression_types(
+    "Cast", "TryCast", "Interval",
+    "DateAdd", "DateSub", "DateDiff", "TsOrDsAdd", "TsOrDsDiff", "AddMonths", "MonthsBetween", "LastDay", "NextDay",
+    "DateTrunc", "TimestampTrunc", "TimestampAdd", "TimestampSub", "DatetimeAdd", "DatetimeSub",
+    "MakeDate", "DateFromParts", "TimestampFromParts", "DateFormat",
+    "RegexpLike", "RegexpILike", "RegexpExtract", "RegexpExtractAll", "RegexpReplace", "RegexpSplit",
+    "RegexpCount", "RegexpInstr",
+    "SHA2",
+    "StrToTime", "StrToDate", "StrToUnix", "UnixToStr", "UnixToTime", "TimeToStr", "TimeStrToTime",
+    "DateStrToDate", "TsOrDsToDate", "TsOrDsToTimestamp",
+    "ApproxQuantile", "Quantile", "PercentileCont", "PercentileDisc",
+    "Div", "IntDiv", "Mod",
+    # Functions sqlglot doesn't know; their literal constraints are unknown too
+    "Anonymous",
+    # Statements sqlglot couldn't parse keep their raw text in a string literal
+    "Command",
+)
+
+
+def _literal_sensitive(literal: exp.Literal) -> bool:
+    node = literal.parent
+    while node is not None:
+        if isinstance(node, _LITERAL_SENSITIVE_TYPES):
+            return True
+        node = node.parent
+    return False
+
+
+def _placeholder(node: exp.Expression) -> exp.Expression:
+    if isinstance(node, exp.Literal) and not _literal_sensitive(node):
+        return exp.Placeholder(this="str" if node.is_string else "num")
+    return node
+
+
+def query_fingerprint(expression: exp.Expression, dialect: str = "spark") -> str:
+    """
+    Render a parsed statement with its literals replaced by typed placeholders.
+
+    Statements that differ only in their parameter values (IDs, dates, strings)
+    share a fingerprint, so a verdict cached for one of them holds for all. String
+    and numeric literals stay distinguishable (`:str` / `:num`), since swapping one
+    for the other can change the verdict. An IN list of same-typed placeholders
+    collapses to one list placeholder, so its length doesn't matter either.
+    Literals that can be invalid by value (see _LITERAL_SENSITIVE_TYPES) are kept
+    verbatim, so every distinct value of them still gets its own verdict.
+
+    Parameters:
+        expression (exp.Expression): The statement as returned by the parser.
+        dialect (str): The sqlglot dialect used to render the fingerprint.
+
+    Returns:
+        str: The fingerprint SQL text.
+    """
+    shape = expression.transform(_placeholder)
+    for in_list in shape.find_all(exp.In):
+        items = in_list.expressions
+        if len(items) > 1 and all(isinstance(item, exp.Placeholder) for item in items) \
+                and len({item.name for item in items}) == 1:
+            in_list.set("expressions", [exp.Placeholder(this=f"{items[0].name}_list")])
+    return shape.sql(dialect=dialect, comments=False)
@@ -0,0 +1,236 @@
+import re
+from bisect import bisect_left
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
+
+from sqlglot import exp
+from sqlglot.tokens import Token, TokenType
+
+from .syntax_validator import ParseResult
+
+# Lists longer than this are compacted
+DEFAULT_MAX_ITEMS = 16
+# Leading items kept verbatim as a sample of a compacted list
+DEFAULT_KEEP_ITEMS = 3
+# "line 3, column 12" / "Line 3 col 12" in a model's summary
+_POSITION = re.compile(r"\b(line\s+)(\d+)(,?\s+col(?:umn)?\s+)(\d+)", re.IGNORECASE)
+
+
+@dataclass(frozen=True)
+class Elision:
+    """One compacted list: what it held, how much of it was dropped and where it started in the statement."""
+
+    kind: str
+    kept: int
+    elided: int
+    line: int
+    col: int
+
+
+@dataclass(frozen=True)
+class CompactedSql:
+    """A statement with its long literal lists shortened, ready to be sent to a model."""
+
+    sql: str
+    elisions: List[Elision]
+    original_chars: int
+    # (line, column in sql, columns to add) from where a single-line marker moved the rest of its line
+    shifts: Tuple[Tuple[int, int, int], ...] = ()
+
+    def original_position(self, line: int, col: int) -> Tuple[int, int]:
+        """Map a line and column of the compacted sql to the same place in the original statement."""
+        delta = 0
+        for shift_line, shift_col, shift in self.shifts:
+            if shift_line == line and shift_col <= col:
+                delta = shift
+        return line, col + delta
+
+    def restore_positions(self, text: str) -> str:
+        """Rewrite the "line L, column C" positions in text, e.g. a model's summary, to the original statement."""
+        def restore(match: re.Match) -> str:
+            line, col = self.original_position(int(match.group(2)), int(match.group(4)))
+            return f"{match.group(1)}{line}{match.group(3)}{col}"
+        return _POSITION.sub(restore, text) if self.shifts else text
+
+
+def _position(text: str, offset: int) -> Tuple[int, int]:
+    """1-based line and column of a character offset in text."""
+    return text.count("\n", 0, offset) + 1, offset - (text.rfind("\n", 0, offset) + 1) + 1
+
+
+def _literal_kind(node: exp.Expression) -> Optional[str]:
+    """The kind of a literal value ("string", "numeric", "boolean", "null"), or None for anything else."""
+    if isinstance(node, exp.Neg):
+        node = node.this
+        return "numeric" if isinstance(node, exp.Literal) and not node.is_string else None
+    if isinstance(node, exp.Literal):
+        return "string" if node.is_string else "numeric"
+    if isinstance(node, exp.Boolean):
+        return "boolean"
+    if isinstance(node, exp.Null):
+        return "null"
+    return None
+
+
+def _common_kind(nodes: Sequence[exp.Expression]) -> Optional[str]:
+    """The single literal kind shared by nodes (NULLs fit any kind), or None if they are mixed or not all literals."""
+    kinds = {_literal_kind(node) for node in nodes}
+    if None in kinds:
+        return None
+    kinds.discard("null")
+    if len(kinds) > 1:
+        return None
+    return kinds.pop() if kinds else "null"
+
+
+def _first_offset(nodes: Sequence[exp.Expression]) -> Optional[int]:
+    """Character offset of the first literal token under nodes that sqlglot recorded a position for."""
+    for node in nodes:
+        for literal in node.find_all(exp.Literal):
+            if "start" in literal.meta:
+                return literal.meta["start"]
+    return None
+
+
+def _item_spans(tokens: Sequence[Token], i: int) -> List[Tuple[int, int]]:
+    """Character spans of the comma-separated literal items from token i up to the closing parenthesis."""
+    spans = []
+    start = end = None
+    while i < len(tokens) and tokens[i].token_type != TokenType.R_PAREN:
+        token = tokens[i]
+        if token.token_type == TokenType.COMMA:
+            spans.append((start, end))
+            start = None
+        else:
+            start = token.start if start is None else start
+            end = token.end
+        i += 1
+    if start is not None:
+        spans.append((start, end))
+    return spans
+
+
+def _row_spans(tokens: Sequence[Token], i: int, count: int) -> List[Tuple[int, int]]:
+    """Character spans of up to count comma-separated parenthesized rows of literals, starting at token i."""
+    spans = []
+    while len(spans) < count and i < len(tokens) and tokens[i].token_type == TokenType.L_PAREN:
+        start = tokens[i].start
+        while i < len(tokens) and tokens[i].token_type != TokenType.R_PAREN:
+            i += 1
+        if i == len(tokens):
+            break
+        spans.append((start, tokens[i].end))
+        i += 1
+        if i < len(tokens) and tokens[i].token_type == TokenType.COMMA:
+            i += 1
+    return spans
+
+
+def _opening_paren(tokens: Sequence[Token], starts: List[int], offset: int) -> Optional[int]:
+    """Index of the nearest "(" token before the token starting at offset."""
+    i = bisect_left(starts, offset)
+    while i >= 0:
+        if tokens[i].token_type == TokenType.L_PAREN:
+            return i
+        i -= 1
+    return None
+
+
+def _marker(sql: str, start: int, end: int, elided: int, noun: str) -> str:
+    """
+    Comment replacing sql[start:end + 1]. It repeats the line breaks of the replaced
+    text and pads its last line, so the text after it keeps its line numbers and,
+    when the list spans several lines, its columns.
+    """
+    region = sql[start:end + 1]
+    newlines = region.count("\n")
+    text = f" /* ... {elided} more {noun} elided"
+    if not newlines:
+        return text + " */"
+    last_line = len(region) - region.rfind("\n") - 1
+    return text + "\n" * newlines + " " * max(0, last_line - 2) + "*/"
+
+
+def compact_literals(parsed: ParseResult, max_items: int = DEFAULT_MAX_ITEMS,
+                     keep: int = DEFAULT_KEEP_ITEMS) -> Optional[CompactedSql]:
+    """
+    Shorten long homogeneous literal lists of a parsed statement before it is sent to a model.
+
+    `IN (...)` lists and `VALUES` blocks with more than max_items entries, all of them
+    literals of one kind, keep their first `keep` entries followed by a comment
+    counting the ones dropped. The parser has already accepted every entry, and the
+    text outside the compacted lists is left untouched.
+
+    Parameters:
+        parsed (ParseResult): A successfully parsed statement, with its tokens.
+        max_items (int): Lists with more entries than this are compacted.
+        keep (int): Number of leading entries kept as a sample.
+
+    Returns:
+        CompactedSql | None: The compacted statement, or None if nothing was compacted.
+    """
+    if keep < 1 or max_items < keep:
+        raise ValueError("keep must be at least 1 and at most max_items")
+    if parsed.expression is None or not parsed.tokens:
+        return None
+    tokens = parsed.tokens
+    starts = [token.start for token in tokens]
+    replacements = []
+
+    for node in parsed.expression.find_all(exp.In, exp.Values):
+        if isinstance(node, exp.In):
+            items = node.expressions
+            if len(items) <= max_items:
+                continue
+            kind = _common_kind(items)
+            offset = _first_offset(items)
+            if kind is None or offset is None:
+                continue
+            paren = _opening_paren(tokens, starts, offset)
+            spans = _item_spans(tokens, paren + 1) if paren is not None else []
+            noun = f"{kind} literals"
+        else:
+            rows = node.expressions
+            if len(rows) <= max_items or not all(isinstance(row, exp.Tuple) for row in rows):
+                continue
+            if len({len(row.expressions) for row in rows}) != 1:
+                continue
+            if any(_common_kind(column) is None for column in zip(*(row.expressions for row in rows))):
+                continue
+            offset = _first_offset(rows[0].expressions)
+            if offset is None:
+                continue
+            paren = _opening_paren(tokens, starts, offset)
+            spans = _row_spans(tokens, paren, len(rows)) if paren is not None else []
+            kind, noun = "values", "rows"
+        if len(spans) != len(node.expressions):
+            # The tokens don't line up with the AST; leave this list alone
+            continue
+        start, end = spans[keep - 1][1] + 1, spans[-1][1]
+        line, col = _position(parsed.sql, spans[0][0])
+        elision = Elision(kind, keep, len(spans) - keep, line, col)
+        replacements.append((start, end, _marker(parsed.sql, start, end, elision.elided, noun), elision))
+
+    if not replacements:
+        return None
+    replacements.sort(key=lambda replacement: replacement[0])
+    pieces = []
+    length = position = 0
+    # (offset in the compacted sql, offset in the original) of the text right after each marker
+    anchors = []
+    for start, end, marker, _ in replacements:
+        pieces += [parsed.sql[position:start], marker]
+        length += start - position + len(marker)
+        position = end + 1
+        anchors.append((length, position))
+    pieces.append(parsed.sql[position:])
+    sql = "".join(pieces)
+
+    shifts = []
+    for compacted_offset, original_offset in anchors:
+        line, col = _position(sql, compacted_offset)
+        original_col = _position(parsed.sql, original_offset)[1]
+        if original_col != col:
+            shifts.append((line, col, original_col - col))
+    return CompactedSql(sql=sql, elisions=[elision for _, _, _, elision in replacements],
+                        original_chars=len(parsed.sql), shifts=tuple(shifts))
@@ -0,0 +1,70 @@
+from sqlglot import exp
+
+from .syntax_validator import expression_types
+
+# Statement classes, each with its own model validator prompt
+QUERY = "query"
+FUNCTIONS = "functions"
+DDL = "ddl"
+DML = "dml"
+SESSION = "session"
+# Statements that don't map to a class are validated with the complete prompt
+GENERAL = "general"
+
+
+_DDL_TYPES = expression_types("Create", "Alter", "AlterTable", "Drop", "TruncateTable")
+_DML_TYPES = expression_types("Insert", "Merge", "Update", "Delete")
+_SESSION_TYPES = expression_types("Set", "Use", "Show", "Describe", "Cache", "Uncache", "Refresh", "Analyze")
+_QUERY_TYPES = expression_types("Query", "Subqueryable", "Values")
+# Function calls covered by the query prompt itself: aggregates, conditionals, ranking and the common
+# scalar functions. Any other call needs the function catalog.
+_CORE_FUNCTION_TYPES = expression_types(
+    "Count", "Sum", "Avg", "Min", "Max", "Case", "If", "RowNumber", "Rank", "DenseRank",
+    "Coalesce", "Nullif", "Greatest", "Least", "Lower", "Upper", "Length", "Trim", "Concat", "ConcatWs",
+    "Abs", "Round", "Floor", "Ceil", "CurrentDate", "CurrentTimestamp",
+)
+# Casts of columns and expressions are core too; a cast of a literal needs the catalog's range and format checks
+_CAST_TYPES = expression_types("Cast", "TryCast")
+
+_DDL_COMMANDS = ("CREATE", "ALTER", "DROP", "TRUNCATE")
+_DML_COMMANDS = ("INSERT", "MERGE", "UPDATE", "DELETE")
+
+
+def classify_statement(expression: exp.Expression) -> str:
+    """
+    Pick the prompt class for a parsed statement from the class of its AST root.
+
+    Parameters:
+        expression (exp.Expression): The statement as returned by sqlglot.parse_one.
+
+    Returns:
+        str: One of QUERY, FUNCTIONS, DDL, DML, SESSION or GENERAL.
+    """
+    if isinstance(expression, exp.Command):
+        # Statements sqlglot can't fully parse fall back to a Command named by their leading keyword
+        keyword = str(expression.this or "").split(" ")[0].upper()
+        if keyword in _DDL_COMMANDS:
+            return DDL
+        if keyword in _DML_COMMANDS:
+            return DML
+        return SESSION
+    if isinstance(expression, _DML_TYPES):
+        return DML
+    if isinstance(expression, _DDL_TYPES):
+        return DDL
+    if isinstance(expression, _SESSION_TYPES):
+        return SESSION
+    if isinstance(expression, _QUERY_TYPES):
+        if any(_needs_function_catalog(function) for function in expression.find_all(exp.Func)):
+            return FUNCTIONS
+        return QUERY
+    return GENERAL
+
+
+def _needs_function_catalog(function: exp.Func) -> bool:
+    # AND / OR / XOR are Func subclasses in sqlglot, but they are operators rather than calls
+    if isinstance(function, (exp.Connector,) + _CORE_FUNCTION_TYPES):
+        return False
+    if isinstance(function, _CAST_TYPES):
+        return function.this.is_string or function.this.is_number
+    return True
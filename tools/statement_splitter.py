@@ -0,0 +1,100 @@
+from dataclasses import dataclass, field
+from typing import List, Sequence, Tuple
+
+import sqlglot
+from sqlglot.errors import TokenError
+from sqlglot.tokens import Token, TokenType
+
+
+@dataclass(frozen=True)
+class Statement:
+    """
+    One statement of a SQL script together with its 1-based line range in the script
+    and the 1-based column it starts at on its first line.
+
+    `tokens` holds the statement's tokens with positions relative to `sql`, so the
+    parser can use them without tokenizing the statement again. It is empty when
+    the script could not be tokenized.
+    """
+
+    index: int
+    sql: str
+    start_line: int
+    end_line: int
+    start_column: int = 1
+    tokens: Tuple[Token, ...] = field(default=(), repr=False, compare=False)
+
+
+def _line_of(script: str, offset: int) -> int:
+    return script.count("\n", 0, offset) + 1
+
+
+def _column_of(script: str, offset: int) -> int:
+    return offset - (script.rfind("\n", 0, offset) + 1) + 1
+
+
+def _rebase(tokens: Sequence[Token], script: str, start: int) -> Tuple[Token, ...]:
+    """Copy script tokens with their offsets, lines and first-line columns made relative to the statement at start."""
+    line_shift = _line_of(script, start) - 1
+    column_shift = start - (script.rfind("\n", 0, start) + 1)
+    rebased = []
+    for token in tokens:
+        line = token.line - line_shift
+        rebased.append(Token(
+            token.token_type,
+            token.text,
+            line=line,
+            col=token.col - column_shift if line == 1 else token.col,
+            start=token.start - start,
+            end=token.end - start,
+            comments=token.comments,
+        ))
+    return tuple(rebased)
+
+
+def split_statements(script: str, dialect: str = "spark") -> List[Statement]:
+    """
+    Split a SQL script into its individual statements.
+
+    The script is tokenized with sqlglot, so semicolons inside string literals,
+    quoted identifiers and comments do not split a statement. Empty statements
+    (e.g. a trailing semicolon) are dropped. If the script cannot be tokenized,
+    it is returned whole as a single statement so the parser can report the error.
+
+    Parameters:
+        script (str): The SQL text, possibly holding several `;`-separated statements.
+        dialect (str): The sqlglot dialect used for tokenizing.
+
+    Returns:
+        list[Statement]: The statements in script order.
+    """
+    try:
+        tokens = sqlglot.tokenize(script, read=dialect)
+    except TokenError:
+        tokens = None
+    if not tokens:
+        text = script.strip()
+        if not text:
+            return []
+        start = script.index(text)
+        return [Statement(0, text, _line_of(script, start), _line_of(script, start + len(text) - 1),
+                          _column_of(script, start))]
+
+    statements: List[Statement] = []
+    current = []
+    for token in tokens + [None]:
+        if token is not None and token.token_type != TokenType.SEMICOLON:
+            current.append(token)
+            continue
+        if current:
+            start, end = current[0].start, current[-1].end
+            statements.append(Statement(
+                index=len(statements),
+                sql=script[start:end + 1],
+                start_line=_line_of(script, start),
+                end_line=_line_of(script, end),
+                start_column=_column_of(script, start),
+                tokens=_rebase(current, script, start),
+            ))
+            current = []
+    return statements
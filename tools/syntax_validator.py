@@ -1,5 +1,120 @@
-import sqlglot
-from sqlglot.errors import ParseError
+import logging
+import time
+from dataclasses import dataclass
+from functools import cached_property
+from typing import List, Optional, Sequence
+
+from sqlglot import exp
+from sqlglot.dialects.dialect import Dialect
+from sqlglot.errors import ParseError, TokenError
+from sqlglot.tokens import Token, TokenType
+
+# Structured fields of a sqlglot ParseError entry that are passed on to later stages
+_ERROR_FIELDS = ("description", "line", "col", "start_context", "highlight", "end_context")
+# Token types whose text is data rather than syntax. The canonical form keeps it verbatim and
+# tagged with the type, so the string 'a', the quoted identifier `a` and the name a stay distinct.
+_DATA_TOKEN_TYPES = frozenset(getattr(TokenType, name) for name in (
+    "STRING", "NATIONAL_STRING", "RAW_STRING", "HEREDOC_STRING", "UNICODE_STRING", "BIT_STRING", "HEX_STRING",
+    "BYTE_STRING", "IDENTIFIER", "NUMBER",
+) if hasattr(TokenType, name))
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ParseResult:
+    """
+    Everything the parser stage learned about one statement, shared by the later stages
+    so that nothing has to tokenize or parse the statement again.
+
+    `valid` is True or False for a clean parse or a syntax error, and None when
+    sqlglot itself failed on the input (an internal error rather than a syntax
+    error), in which case the model validator has to decide.
+    """
+
+    sql: str
+    dialect: str
+    expression: Optional[exp.Expression]
+    tokens: Sequence[Token]
+    valid: Optional[bool]
+    message: str
+    # Structured parse errors (description, line, col, start_context, highlight, end_context)
+    errors: List[dict]
+    parse_seconds: float
+
+    @cached_property
+    def canonical(self) -> str:
+        """
+        The statement's token stream with keywords upper-cased and whitespace and
+        comments dropped; every other token keeps its text. Unlike rendering the AST,
+        this never rewrites the statement: a missing AS, an optional INTO or a JOIN
+        without a condition stay as written, so statements a validator may judge
+        differently never share a form. Statements that didn't tokenize fall back to
+        their whitespace-collapsed text.
+        """
+        if not self.tokens:
+            return " ".join(self.sql.split())
+        return " ".join(_canonical_token(token) for token in self.tokens)
+
+    def as_dict(self) -> dict:
+        """The {"valid", "message", "errors"} summary returned by validate_sql_syntax."""
+        return {"valid": self.valid, "message": self.message, "errors": self.errors}
+
+
+def _canonical_token(token: Token) -> str:
+    if token.token_type in _DATA_TOKEN_TYPES:
+        return f"{token.token_type.name}:{token.text!r}"
+    if token.token_type == TokenType.VAR:
+        return token.text
+    return " ".join(token.text.upper().split())
+
+
+def parse_sql(sql: str, dialect: str = "spark", tokens: Optional[Sequence[Token]] = None) -> ParseResult:
+    """
+    Tokenize and parse a SQL statement once, keeping the AST, the tokens and any errors.
+
+    Parameters:
+        sql (str): The SQL statement to parse.
+        dialect (str): The sqlglot dialect to read.
+        tokens (Sequence[Token]): Tokens of sql from an earlier stage (e.g. the statement
+                                  splitter); when given, sql is not tokenized again.
+
+    Returns:
+        ParseResult: The parse outcome.
+    """
+    logger.debug("Parsing %d characters of SQL", len(sql))
+    started = time.perf_counter()
+    reader = Dialect.get_or_raise(dialect)
+    expression = None
+    errors: List[dict] = []
+    try:
+        if tokens is None:
+            tokens = reader.tokenize(sql)
+        result = reader.parser().parse(list(tokens), sql)
+        if not result or result[0] is None:
+            raise ParseError(f"No expression was parsed from '{sql}'")
+        expression = exp.Block(expressions=result) if len(result) > 1 else result[0]
+        valid, message = True, "SQL syntax is valid."
+    except ParseError as e:
+        valid, message = False, f"Syntax error: {str(e)}"
+        errors = [{key: error.get(key) for key in _ERROR_FIELDS} for error in e.errors]
+    except TokenError as e:
+        valid, message = False, f"Syntax error: {str(e)}"
+    except Exception as e:
+        # sqlglot's own expression builders can fail on malformed input, e.g. IndexError for MAP() with an odd argument count
+        logger.warning("sqlglot failed to parse the statement: %r", e)
+        valid, message = None, f"Parser failure: {type(e).__name__}: {e}"
+    return ParseResult(
+        sql=sql,
+        dialect=dialect,
+        expression=expression,
+        tokens=tokens or (),
+        valid=valid,
+        message=message,
+        errors=errors,
+        parse_seconds=time.perf_counter() - started,
+    )
+
 
 def validate_sql_syntax(sql: str) -> dict:
     """
@@ -11,23 +126,35 @@ def validate_sql_syntax(sql: str) -> dict:
     Returns:
         dict: A dictionary with the following structure:
               {
-                  "valid": bool,          # True if syntax is valid, False if error found
-                  "message": str          # Validation result or error message
+                  "valid": bool,          # True if syntax is valid, False if error found,
+                                          # None if sqlglot failed internally
+                  "message": str,         # Validation result or error message
+                  "errors": list          # Structured parse errors (description, line, col,
+                                          # start_context, highlight, end_context); empty if valid
               }
     """
-    try:
-        print("Input to tool -->" + sql)
-        dialect: str = "spark"
-        expr = sqlglot.parse_one(sql, read=dialect)
+    return parse_sql(sql).as_dict()
 
-        return {
-            "valid": True,
-            "message": "SQL syntax is valid."
-        }
 
-    except ParseError as e:
-        return {
-            "valid": False,
-            "message": f"Syntax error: {str(e)}"
-        }
-    
\ No newline at end of file
+def canonicalize_sql(sql: str, dialect: str = "spark") -> str:
+    """
+    Render a SQL query in its canonical token form for the given dialect.
+
+    Whitespace, comments and keyword case are dropped, so two spellings of the same
+    statement canonicalize to the same string, while every other token is kept as
+    written (see ParseResult.canonical). Queries that do not tokenize fall back to
+    their whitespace-collapsed text.
+
+    Parameters:
+        sql (str): The SQL query string to canonicalize.
+        dialect (str): The sqlglot dialect to read and write.
+
+    Returns:
+        str: The canonical SQL text.
+    """
+    return parse_sql(sql, dialect).canonical
+
+
+def expression_types(*names: str) -> tuple:
+    """Resolve sqlglot expression classes by name, skipping ones this sqlglot version doesn't define."""
+    return tuple(getattr(exp, name) for name in names if hasattr(exp, name))